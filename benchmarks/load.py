@@ -0,0 +1,112 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+import httpx
+
+from benchmarks.scenarios import SCENARIOS, Dataset, Recorder, summarize
+from benchmarks.storage import install_local_storage
+
+
+async def run_worker(
+    scenario: str,
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    dataset: Dataset,
+    seed: int,
+    deadline: float,
+) -> None:
+    rng = random.Random(seed)
+    while time.perf_counter() < deadline:
+        await SCENARIOS[scenario](client, recorder, dataset, rng)
+
+
+async def run(
+    scenario: str, concurrency: int, duration: float, url: str | None, seed: int
+) -> dict[str, dict]:
+    if url is None:
+        install_local_storage()
+    from src.database import engine
+    from src.main import app
+
+    dataset = await Dataset.load(engine=engine)
+    recorder = Recorder()
+    if url is None:
+        os.makedirs("temp", exist_ok=True)
+        await app.router.startup()
+        client = httpx.AsyncClient(app=app, base_url="http://benchmark")
+    else:
+        client = httpx.AsyncClient(base_url=url, timeout=30)
+
+    try:
+        async with client:
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    run_worker(
+                        scenario=scenario,
+                        client=client,
+                        recorder=recorder,
+                        dataset=dataset,
+                        seed=seed + worker,
+                        deadline=start + duration,
+                    )
+                    for worker in range(concurrency)
+                )
+            )
+            elapsed = time.perf_counter() - start
+    finally:
+        if url is None:
+            await app.router.shutdown()
+    return summarize(recorder=recorder, elapsed=elapsed)
+
+
+def print_summary(summary: dict[str, dict]) -> None:
+    print(
+        f"{'endpoint':<40}{'requests':>10}{'errors':>8}{'rps':>10}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    )
+    for endpoint, stats in summary.items():
+        print(
+            f"{endpoint:<40}{stats['requests']:>10}{stats['errors']:>8}"
+            f"{stats['rps']:>10}{stats['p50_ms']!s:>10}{stats['p95_ms']!s:>10}"
+            f"{stats['p99_ms']!s:>10}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run a load scenario against the application"
+    )
+    parser.add_argument("scenario", choices=SCENARIOS.keys())
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument(
+        "--url",
+        default=None,
+        help="base url of a running server; the app is run in-process by default",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None, help="write the report as json")
+    args = parser.parse_args()
+
+    summary = asyncio.run(
+        run(
+            scenario=args.scenario,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            url=args.url,
+            seed=args.seed,
+        )
+    )
+    print_summary(summary=summary)
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
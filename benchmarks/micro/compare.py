@@ -0,0 +1,100 @@
+import argparse
+import json
+import os
+import sys
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+
+
+def load_results(path: str) -> dict[str, float]:
+    with open(path, encoding="utf-8") as file:
+        report = json.load(file)
+    return {
+        benchmark["name"]: benchmark["stats"]["median"]
+        for benchmark in report["benchmarks"]
+    }
+
+
+def load_baseline(path: str) -> dict[str, float]:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["medians"]
+
+
+def save_baseline(path: str, results: dict[str, float], threshold: float) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(
+            {"threshold": threshold, "medians": dict(sorted(results.items()))},
+            file,
+            indent=2,
+        )
+        file.write("\n")
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    regressions = []
+    for name, median in sorted(results.items()):
+        if name not in baseline:
+            print(f"{name}: {median * 1e6:.1f} us (no baseline)")
+            continue
+        change = median / baseline[name] - 1
+        print(f"{name}: {median * 1e6:.1f} us ({change:+.1%})")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare a pytest-benchmark json report with the stored "
+        "baseline and fail when a median regresses more than the threshold"
+    )
+    parser.add_argument("report", help="file written by --benchmark-json")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=None,
+        help=f"allowed slowdown, {DEFAULT_THRESHOLD} means 25%%",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="store the medians of the report in the baseline, keeping the "
+        "benchmarks the report does not contain",
+    )
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="with --update, drop the benchmarks the report does not contain",
+    )
+    args = parser.parse_args()
+
+    results = load_results(path=args.report)
+    if args.update:
+        baseline = {}
+        if os.path.exists(args.baseline) and not args.replace:
+            baseline = load_baseline(path=args.baseline)
+        save_baseline(
+            path=args.baseline,
+            results={**baseline, **results},
+            threshold=args.threshold or DEFAULT_THRESHOLD,
+        )
+        return
+
+    threshold = args.threshold
+    if threshold is None:
+        with open(args.baseline, encoding="utf-8") as file:
+            threshold = json.load(file).get("threshold", DEFAULT_THRESHOLD)
+    regressions = compare(
+        results=results, baseline=load_baseline(path=args.baseline), threshold=threshold
+    )
+    if len(regressions) > 0:
+        print(f"Regressed more than {threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
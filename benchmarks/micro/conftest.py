@@ -0,0 +1,86 @@
+import os
+import tempfile
+
+# Keep test runs out of the application log
+os.environ.setdefault(
+    "LOG_FILE", os.path.join(tempfile.gettempdir(), "education_tour_test.log")
+)
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import JSON, Computed
+
+from src.event_module.database.category.category_query import CategoryQuery
+from src.event_module.database.event.event_query import EventQuery
+from src.event_module.database.event_tag.event_tag_query import EventTagQuery
+from src.event_module.database.tag.tag_query import TagQuery
+from src.tour_module.database.tour.tour_query import TourQuery
+from src.tour_module.database.tour_event.tour_event_query import TourEventQuery
+from src.university_module.database.university.university_query import UniversityQuery
+from src.university_module.database.university_event.university_event_query import (
+    UniversityEventQuery,
+)
+from src.university_module.database.university_tour.university_tour_query import (
+    UniversityTourQuery,
+)
+from src.user_module.database.user_event.user_event_query import UserEventQuery
+from src.user_module.database.user_tour.user_tour_query import UserTourQuery
+from src.user_module.database.user_university.user_university_query import (
+    UserUniversityQuery,
+)
+
+ROW_COUNT = 1000
+ADDRESS = {
+    "country": "Россия",
+    "city": "Москва",
+    "street": "Ленинский проспект",
+    "house": 4,
+    "latitude": 55.7558,
+    "longitude": 37.6173,
+}
+QUERY_CLASSES = [
+    CategoryQuery,
+    TagQuery,
+    EventQuery,
+    EventTagQuery,
+    TourQuery,
+    TourEventQuery,
+    UniversityQuery,
+    UniversityEventQuery,
+    UniversityTourQuery,
+    UserEventQuery,
+    UserTourQuery,
+    UserUniversityQuery,
+]
+
+
+def make_value(column, index: int):
+    if isinstance(column.type, JSON):
+        return dict(ADDRESS)
+    python_type = column.type.python_type
+    if python_type is int:
+        return index + 1
+    if python_type is float:
+        return 55.0 + index / ROW_COUNT
+    if python_type is datetime:
+        return datetime(2026, 10, 19, 12, 0)
+    return f"{column.name} {index}"
+
+
+def make_rows(model: type, count: int = ROW_COUNT) -> list[tuple]:
+    columns = [
+        column
+        for column in model.__table__.columns
+        if not isinstance(column.computed, Computed)
+    ]
+    return [
+        (model(**{column.name: make_value(column, index) for column in columns}),)
+        for index in range(count)
+    ]
+
+
+@pytest.fixture(params=QUERY_CLASSES, ids=lambda query_class: query_class.__name__)
+def query_rows(request):
+    query = request.param()
+    return query, make_rows(model=query._model)
@@ -0,0 +1,21 @@
+import json
+
+from benchmarks.micro.conftest import ADDRESS
+from src.address_schema import convert_address, get_coordinates
+
+ADDRESS_JSON = json.dumps(ADDRESS, ensure_ascii=False)
+
+
+def test_convert_address_from_json(benchmark):
+    address = benchmark(convert_address, address=ADDRESS_JSON)
+    assert address.city == ADDRESS["city"]
+
+
+def test_convert_address_from_dict(benchmark):
+    address = benchmark(convert_address, address=ADDRESS)
+    assert address is ADDRESS
+
+
+def test_get_coordinates(benchmark):
+    coordinates = benchmark(get_coordinates, address=ADDRESS)
+    assert coordinates["latitude"] == ADDRESS["latitude"]
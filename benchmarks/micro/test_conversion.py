@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+from benchmarks.micro.conftest import ADDRESS, ROW_COUNT
+from src.event_module.database.event.event_query import EventQuery
+
+
+def test_convert_models_to_schema_list(benchmark, query_rows):
+    query, rows = query_rows
+    schemas = benchmark(query._convert_models_to_schema_list, models=rows)
+    assert len(schemas) == len(rows)
+
+
+def test_convert_rows_to_sparse_schema_list(benchmark):
+    query = EventQuery()
+    rows = [
+        SimpleNamespace(
+            _mapping={
+                "id": index,
+                "name": f"name {index}",
+                "address": dict(ADDRESS),
+            }
+        )
+        for index in range(ROW_COUNT)
+    ]
+    schemas = benchmark(
+        lambda: [query._convert_row_to_sparse_schema(row=row) for row in rows]
+    )
+    assert schemas[0]["address"] == ADDRESS
@@ -0,0 +1,46 @@
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from benchmarks.micro.conftest import make_rows
+from src.event_module.database.event.event_query import EventQuery
+from src.schemas import Response
+from src.utils import Status, return_json
+
+
+@pytest.fixture(scope="module")
+def schemas():
+    query = EventQuery()
+    return query._convert_models_to_schema_list(models=make_rows(model=query._model))
+
+
+def make_response(schemas: list) -> Response:
+    return return_json(
+        status=Status.SUCCESS,
+        message="Мероприятия успешно получены",
+        data={"count": len(schemas), "schemas": schemas},
+    )
+
+
+def test_return_json(benchmark, schemas):
+    response = benchmark(make_response, schemas=schemas)
+    assert response.data["count"] == len(schemas)
+
+
+def test_response_validation(benchmark, schemas):
+    # FastAPI validates the returned envelope against `response_model=Response`
+    content = make_response(schemas=schemas).dict()
+    response = benchmark(Response.validate, content)
+    assert response.status == Status.SUCCESS.value
+
+
+def test_jsonable_encoder(benchmark, schemas):
+    response = make_response(schemas=schemas)
+    content = benchmark(jsonable_encoder, response)
+    assert len(content["data"]["schemas"]) == len(schemas)
+
+
+def test_json_response_render(benchmark, schemas):
+    content = jsonable_encoder(make_response(schemas=schemas))
+    body = benchmark(JSONResponse(content=None).render, content)
+    assert body.startswith(b"{")
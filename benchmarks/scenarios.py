@@ -0,0 +1,221 @@
+import random
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from itertools import count
+from typing import Awaitable, Callable
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.event_module.models import Category, Event
+from src.tour_module.models import Tour
+from src.university_module.models import University
+from src.user_module.models import UserEvent
+from src.utils import Role
+
+API_PREFIX = "/api/v1"
+HOT_EVENT_COUNT = 10
+SEARCH_WORDS = ["экскурсия", "лекция", "музей", "хакатон", "физика"]
+IMAGE = b"\x89PNG\r\n\x1a\n" + bytes(4096)
+
+
+@dataclass
+class Dataset:
+    category_ids: list[int]
+    event_ids: list[int]
+    tour_ids: list[int]
+    university_ids: list[int]
+    max_user_id: int
+
+    @classmethod
+    async def load(cls, engine: AsyncEngine) -> "Dataset":
+        async with engine.connect() as connection:
+
+            async def get_ids(column) -> list[int]:
+                return list((await connection.execute(select(column))).scalars())
+
+            max_user_id = (
+                await connection.execute(
+                    select(UserEvent.user_id)
+                    .order_by(UserEvent.user_id.desc())
+                    .limit(1)
+                )
+            ).scalar()
+            return cls(
+                category_ids=await get_ids(Category.id),
+                event_ids=await get_ids(Event.id),
+                tour_ids=await get_ids(Tour.id),
+                university_ids=await get_ids(University.id),
+                max_user_id=max_user_id or 0,
+            )
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+
+    async def request(
+        self, client: httpx.AsyncClient, method: str, route: str, url: str, **kwargs
+    ) -> httpx.Response | None:
+        endpoint = f"{method} {route}"
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, API_PREFIX + url, **kwargs)
+        except httpx.HTTPError:
+            self.errors[endpoint] += 1
+            return None
+        self.latencies[endpoint].append(time.perf_counter() - start)
+        if response.status_code >= 500:
+            self.errors[endpoint] += 1
+        return response
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    index = max(0, min(len(sorted_values) - 1, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(recorder: Recorder, elapsed: float) -> dict[str, dict]:
+    summary = {}
+    for endpoint in sorted(recorder.latencies.keys() | recorder.errors.keys()):
+        latencies = sorted(recorder.latencies[endpoint])
+        summary[endpoint] = {
+            "requests": len(latencies),
+            "errors": recorder.errors[endpoint],
+            "rps": round(len(latencies) / elapsed, 2),
+            **{
+                f"p{q}_ms": (
+                    round(percentile(latencies, q / 100) * 1000, 2)
+                    if latencies
+                    else None
+                )
+                for q in (50, 95, 99)
+            },
+        }
+    return summary
+
+
+Scenario = Callable[
+    [httpx.AsyncClient, Recorder, Dataset, random.Random], Awaitable[None]
+]
+
+
+async def browse_feed(
+    client: httpx.AsyncClient, recorder: Recorder, dataset: Dataset, rng: random.Random
+) -> None:
+    await recorder.request(
+        client,
+        "GET",
+        "/event/",
+        "/event/",
+        params={
+            "category_list": rng.sample(
+                dataset.category_ids, min(2, len(dataset.category_ids))
+            ),
+            "registration_open": True,
+            "date_sort": "asc",
+            "fields": ["id", "name", "date_start", "image"],
+        },
+    )
+    await recorder.request(
+        client,
+        "GET",
+        "/event/{event_id}",
+        f"/event/{rng.choice(dataset.event_ids)}",
+        params={"include": ["tags", "universities", "registrations_count"]},
+    )
+    await recorder.request(
+        client,
+        "GET",
+        "/event/search",
+        "/event/search",
+        params={"q": rng.choice(SEARCH_WORDS)},
+    )
+    await recorder.request(
+        client,
+        "GET",
+        "/event/",
+        "/event/",
+        params={
+            "latitude": 55.75,
+            "longitude": 37.62,
+            "radius_km": 50,
+            "fields": ["id", "name", "latitude", "longitude"],
+        },
+    )
+    await recorder.request(
+        client,
+        "GET",
+        "/tour/{tour_id}",
+        f"/tour/{rng.choice(dataset.tour_ids)}",
+    )
+    await recorder.request(
+        client,
+        "GET",
+        "/university/{university_id}",
+        f"/university/{rng.choice(dataset.university_ids)}",
+    )
+
+
+_spike_users = count(1)
+
+
+async def registration_spike(
+    client: httpx.AsyncClient, recorder: Recorder, dataset: Dataset, rng: random.Random
+) -> None:
+    # Fresh users compete for a handful of hot events, like when a popular
+    # event opens registration
+    user_id = dataset.max_user_id + next(_spike_users)
+    event_id = rng.choice(dataset.event_ids[:HOT_EVENT_COUNT])
+    await recorder.request(
+        client,
+        "POST",
+        "/user/event",
+        "/user/event",
+        params={"user_role": Role.USER.value, "user_id": user_id},
+        json={"user_id": user_id, "event_id": event_id},
+    )
+    await recorder.request(
+        client,
+        "GET",
+        "/event/{event_id}",
+        f"/event/{event_id}",
+        params={"include": ["registrations_count"]},
+    )
+
+
+_image_events = count(0)
+
+
+async def update_image(
+    client: httpx.AsyncClient, recorder: Recorder, dataset: Dataset, rng: random.Random
+) -> None:
+    event_id = dataset.event_ids[next(_image_events) % len(dataset.event_ids)]
+    await recorder.request(
+        client,
+        "POST",
+        "/event/image",
+        "/event/image",
+        params={"event_id": event_id, "user_role": Role.ADMIN.value},
+        files={"image": (f"event_{event_id}.png", IMAGE, "image/png")},
+    )
+
+
+async def mixed(
+    client: httpx.AsyncClient, recorder: Recorder, dataset: Dataset, rng: random.Random
+) -> None:
+    scenario = rng.choices(
+        [browse_feed, registration_spike, update_image], weights=[90, 9, 1]
+    )[0]
+    await scenario(client, recorder, dataset, rng)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "feed": browse_feed,
+    "registration": registration_spike,
+    "image": update_image,
+    "mixed": mixed,
+}
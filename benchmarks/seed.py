@@ -0,0 +1,272 @@
+import argparse
+import asyncio
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.database import engine, metadata
+from src.event_module.models import Category, Event, EventTag, Tag
+from src.tour_module.models import Tour, TourEvent
+from src.university_module.models import University, UniversityEvent, UniversityTour
+from src.user_module.models import UserEvent, UserTour, UserUniversity
+
+VOLUMES = {
+    "category": 12,
+    "tag": 60,
+    "university": 40,
+    "event": 5000,
+    "tour": 400,
+    "user": 20000,
+}
+TAGS_PER_EVENT = (1, 5)
+EVENTS_PER_TOUR = (2, 8)
+FILL_RATIO = (0.1, 1.0)
+CHUNK_SIZE = 1000
+
+CITIES = [
+    ("Россия", "Москва", 55.7558, 37.6173),
+    ("Россия", "Санкт-Петербург", 59.9343, 30.3351),
+    ("Россия", "Казань", 55.7887, 49.1221),
+    ("Россия", "Новосибирск", 55.0084, 82.9357),
+    ("Россия", "Екатеринбург", 56.8389, 60.6057),
+    ("Россия", "Томск", 56.4847, 84.9482),
+    ("Россия", "Владивосток", 43.1198, 131.8869),
+    ("Беларусь", "Минск", 53.9045, 27.5615),
+]
+WORDS = [
+    "экскурсия",
+    "лекция",
+    "лаборатория",
+    "музей",
+    "олимпиада",
+    "хакатон",
+    "практикум",
+    "кампус",
+    "физика",
+    "история",
+    "программирование",
+    "архитектура",
+    "биология",
+    "робототехника",
+    "искусство",
+]
+
+
+def get_volumes(scale: float) -> dict[str, int]:
+    return {key: max(1, int(value * scale)) for key, value in VOLUMES.items()}
+
+
+def sample(rng: random.Random, population, k: int) -> list:
+    return rng.sample(population, min(k, len(population)))
+
+
+def make_text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def make_address(rng: random.Random) -> tuple[dict, float, float]:
+    country, city, latitude, longitude = rng.choice(CITIES)
+    latitude += rng.uniform(-0.2, 0.2)
+    longitude += rng.uniform(-0.2, 0.2)
+    address = {
+        "country": country,
+        "city": city,
+        "street": make_text(rng=rng, words=1),
+        "house": rng.randint(1, 200),
+        "latitude": latitude,
+        "longitude": longitude,
+    }
+    return address, latitude, longitude
+
+
+def make_period(rng: random.Random, now: datetime) -> dict:
+    date_start = now + timedelta(days=rng.randint(-60, 180), hours=rng.randint(0, 23))
+    return {
+        "date_start": date_start,
+        "date_end": date_start + timedelta(hours=rng.randint(1, 72)),
+        "reg_deadline": date_start - timedelta(days=rng.randint(0, 14)),
+    }
+
+
+async def insert_rows(
+    connection: AsyncConnection, model: type, rows: list[dict]
+) -> list[int]:
+    id_list = []
+    for start in range(0, len(rows), CHUNK_SIZE):
+        result = await connection.execute(
+            insert(model).returning(model.id, sort_by_parameter_order=True),
+            rows[start : start + CHUNK_SIZE],
+        )
+        id_list.extend(result.scalars().all())
+    return id_list
+
+
+def fill_registered_count(rng: random.Random, rows: list[dict], users: int) -> None:
+    for row in rows:
+        row["registered_count"] = min(
+            users, int(row["max_users"] * rng.uniform(*FILL_RATIO))
+        )
+
+
+def make_registrations(
+    rng: random.Random,
+    target_key: str,
+    id_list: list[int],
+    rows: list[dict],
+    users: int,
+) -> list[dict]:
+    return [
+        {"user_id": user_id, target_key: target_id}
+        for target_id, row in zip(id_list, rows)
+        for user_id in rng.sample(range(1, users + 1), row["registered_count"])
+    ]
+
+
+async def seed(scale: float, seed_value: int, reset: bool) -> dict[str, int]:
+    rng = random.Random(seed_value)
+    volumes = get_volumes(scale=scale)
+    now = datetime.utcnow()
+
+    async with engine.begin() as connection:
+        if reset:
+            await connection.run_sync(metadata.drop_all)
+        await connection.run_sync(metadata.create_all)
+
+        category_ids = await insert_rows(
+            connection=connection,
+            model=Category,
+            rows=[{"name": f"Категория {i}"} for i in range(volumes["category"])],
+        )
+        tag_ids = await insert_rows(
+            connection=connection,
+            model=Tag,
+            rows=[{"name": f"{rng.choice(WORDS)} {i}"} for i in range(volumes["tag"])],
+        )
+
+        university_rows = []
+        for i in range(volumes["university"]):
+            address, latitude, longitude = make_address(rng=rng)
+            university_rows.append(
+                {
+                    "name": f"Университет {i}",
+                    "description": make_text(rng=rng, words=30),
+                    "email": f"university{i}@example.com",
+                    "address": address,
+                    "latitude": latitude,
+                    "longitude": longitude,
+                }
+            )
+        university_ids = await insert_rows(
+            connection=connection, model=University, rows=university_rows
+        )
+
+        event_rows = []
+        for _ in range(volumes["event"]):
+            address, latitude, longitude = make_address(rng=rng)
+            event_rows.append(
+                {
+                    "name": make_text(rng=rng, words=3),
+                    "description": make_text(rng=rng, words=60),
+                    "max_users": rng.randint(20, 500),
+                    "category_id": rng.choice(category_ids),
+                    "address": address,
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    **make_period(rng=rng, now=now),
+                }
+            )
+        fill_registered_count(rng=rng, rows=event_rows, users=volumes["user"])
+        event_ids = await insert_rows(
+            connection=connection, model=Event, rows=event_rows
+        )
+
+        tour_rows = []
+        for _ in range(volumes["tour"]):
+            address, latitude, longitude = make_address(rng=rng)
+            tour_rows.append(
+                {
+                    "name": make_text(rng=rng, words=3),
+                    "description": make_text(rng=rng, words=60),
+                    "max_users": rng.randint(10, 100),
+                    "address": address,
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    **make_period(rng=rng, now=now),
+                }
+            )
+        fill_registered_count(rng=rng, rows=tour_rows, users=volumes["user"])
+        tour_ids = await insert_rows(connection=connection, model=Tour, rows=tour_rows)
+
+        links = {
+            EventTag: [
+                {"event_id": event_id, "tag_id": tag_id}
+                for event_id in event_ids
+                for tag_id in sample(
+                    rng=rng, population=tag_ids, k=rng.randint(*TAGS_PER_EVENT)
+                )
+            ],
+            TourEvent: [
+                {"tour_id": tour_id, "event_id": event_id}
+                for tour_id in tour_ids
+                for event_id in sample(
+                    rng=rng, population=event_ids, k=rng.randint(*EVENTS_PER_TOUR)
+                )
+            ],
+            UniversityEvent: [
+                {"university_id": rng.choice(university_ids), "event_id": event_id}
+                for event_id in event_ids
+            ],
+            UniversityTour: [
+                {"university_id": rng.choice(university_ids), "tour_id": tour_id}
+                for tour_id in tour_ids
+            ],
+            UserUniversity: [
+                {"user_id": user_id, "university_id": university_id}
+                for university_id in university_ids
+                for user_id in sample(
+                    rng=rng, population=range(1, volumes["user"] + 1), k=2
+                )
+            ],
+        }
+
+        links[UserEvent] = make_registrations(
+            rng=rng,
+            target_key="event_id",
+            id_list=event_ids,
+            rows=event_rows,
+            users=volumes["user"],
+        )
+        links[UserTour] = make_registrations(
+            rng=rng,
+            target_key="tour_id",
+            id_list=tour_ids,
+            rows=tour_rows,
+            users=volumes["user"],
+        )
+
+        for model, rows in links.items():
+            await insert_rows(connection=connection, model=model, rows=rows)
+    return volumes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Fill the configured database with benchmark data"
+    )
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--reset", action="store_true", help="drop and recreate all tables first"
+    )
+    args = parser.parse_args()
+    volumes = asyncio.run(
+        seed(scale=args.scale, seed_value=args.seed, reset=args.reset)
+    )
+    for key, value in volumes.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
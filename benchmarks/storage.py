@@ -0,0 +1,66 @@
+import os
+import shutil
+import uuid
+
+from src.google_drive.directories import Directory
+from src.monitoring.metrics import observe_storage_call
+from src.schemas import Response
+from src.utils import Status, return_json
+
+STORAGE_DIR = os.environ.get("BENCHMARK_STORAGE_DIR", "benchmark_storage")
+
+
+class LocalDriver:
+    """
+    Drop-in replacement for `Driver` that keeps files on the local disk, so
+    image scenarios do not depend on Google Drive
+    """
+
+    def __init__(self, root: str = STORAGE_DIR) -> None:
+        self.root = root
+
+    def _get_directory(self, directory: Directory) -> str:
+        path = os.path.join(self.root, directory.value)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @observe_storage_call(operation="upload_file")
+    def upload_file(
+        self, filename: str, directory: Directory, temp_directory: str = "temp"
+    ) -> Response:
+        file_id = f"{uuid.uuid4().hex}_{filename}"
+        shutil.copyfile(
+            os.path.join(temp_directory, filename),
+            os.path.join(self._get_directory(directory=directory), file_id),
+        )
+        return return_json(
+            status=Status.SUCCESS,
+            data={
+                "file_link": f"https://drive.google.com/uc?export=view&id={file_id}",
+                "file_id": file_id,
+            },
+        )
+
+    @observe_storage_call(operation="delete_file")
+    def delete_file(self, filename: str, directory: Directory) -> Response:
+        path = self._get_directory(directory=directory)
+        for file_id in os.listdir(path):
+            if file_id.split("_", 1)[-1] == filename:
+                os.remove(os.path.join(path, file_id))
+                return return_json(status=Status.SUCCESS)
+        return return_json(status=Status.ERROR, details="400 File not found")
+
+    @observe_storage_call(operation="delete_file_by_id")
+    def delete_file_by_id(self, file_id: str, directory: Directory) -> Response:
+        path = os.path.join(self._get_directory(directory=directory), file_id)
+        if os.path.isfile(path):
+            os.remove(path)
+            return return_json(status=Status.SUCCESS)
+        return return_json(status=Status.ERROR, details="400 File not found")
+
+
+def install_local_storage() -> None:
+    # Must run before `src.instruments` is imported, which creates the driver
+    from src.google_drive import image_handler
+
+    image_handler.Driver = LocalDriver
@@ -0,0 +1,5 @@
+#!/bin/bash
+
+# Returns immediately when the database is already at head; otherwise runs
+# alembic upgrade under a Postgres advisory lock
+exec python -m src.database_utils.migrations
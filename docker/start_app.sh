@@ -1,5 +1,7 @@
 #!/bin/bash
 
-alembic upgrade head
-
-gunicorn src.main:app --workers 1 --worker-class uvicorn.workers.UvicornWorker --bind=0.0.0.0:8000
\ No newline at end of file
+# Migrations run once per deploy in the migrate service (docker/migrate.sh),
+# not on every replica start; /health/ready reports 503 until they finish.
+# exec hands the signals to the gunicorn master: HUP reloads the workers
+# gracefully, TERM drains them within graceful_timeout
+exec gunicorn src.main:app --config gunicorn.conf.py
@@ -0,0 +1,58 @@
+import os
+import shutil
+
+
+def get_cpu_count() -> int:
+    # Respects the CPU set of the container, unlike os.cpu_count()
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+# Async workers each run their own event loop, so one per core saturates the
+# box; uvicorn picks uvloop and httptools automatically when installed
+workers = int(
+    os.environ.get(
+        "WEB_CONCURRENCY",
+        get_cpu_count() * int(os.environ.get("GUNICORN_WORKERS_PER_CORE", 1)),
+    )
+)
+
+backlog = int(os.environ.get("GUNICORN_BACKLOG", 2048))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 60))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 10000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 1000))
+
+# The heartbeat file lives in memory instead of a possibly slow overlay fs
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-")
+loglevel = os.environ.get("LOG_LEVEL", "info").lower()
+
+# Every worker keeps its own metrics, the files in this directory are merged
+# on /metrics. /profiling/cpu and /profiling/slow are not merged: they answer
+# for the worker that served the request, named by its pid. The autocomplete
+# index is per worker too, but it follows the names changed by any worker
+# through Postgres LISTEN/NOTIFY, AUTOCOMPLETE_TTL only bounds how stale it
+# gets while the listener reconnects
+if workers > 1:
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+
+
+def on_starting(server) -> None:
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir is not None:
+        shutil.rmtree(multiproc_dir, ignore_errors=True)
+        os.makedirs(multiproc_dir)
+
+
+def child_exit(server, worker) -> None:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
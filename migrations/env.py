@@ -3,12 +3,13 @@ import sys
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, pool, text
 
 sys.path.append(os.path.join(sys.path[0], "src"))
 
 from src.config import DB_HOST, DB_NAME, DB_PASSWORD, DB_PORT, DB_USER
 from src.database import metadata
+from src.database_utils.migrations import MIGRATION_LOCK_ID
 from src.event_module.models import *
 from src.tour_module.models import *
 from src.university_module.models import *
@@ -83,6 +84,12 @@ def run_migrations_online() -> None:
         context.configure(connection=connection, target_metadata=target_metadata)
 
         with context.begin_transaction():
+            # Replicas migrating at the same time wait here; the current
+            # revision is read after the lock, so the late ones do nothing
+            connection.execute(
+                text("SELECT pg_advisory_xact_lock(:lock_id)"),
+                {"lock_id": MIGRATION_LOCK_ID},
+            )
             context.run_migrations()
 
 
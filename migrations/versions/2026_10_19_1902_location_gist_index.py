@@ -0,0 +1,40 @@
+"""location gist index
+
+Revision ID: 5e8b1f3a6c27
+Revises: 2d7a9c4e8b36
+Create Date: 2026-10-19 19:02:17.804315
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5e8b1f3a6c27"
+down_revision = "2d7a9c4e8b36"
+branch_labels = None
+depends_on = None
+
+TABLES = ("event", "tour", "university")
+
+
+def upgrade() -> None:
+    for table_name in TABLES:
+        op.drop_index(f"ix_{table_name}_location", table_name=table_name)
+        op.create_index(
+            f"ix_{table_name}_location",
+            table_name,
+            [sa.text("point(longitude, latitude)")],
+            unique=False,
+            postgresql_using="gist",
+        )
+
+
+def downgrade() -> None:
+    for table_name in reversed(TABLES):
+        op.drop_index(f"ix_{table_name}_location", table_name=table_name)
+        op.create_index(
+            f"ix_{table_name}_location",
+            table_name,
+            ["latitude", "longitude"],
+            unique=False,
+        )
@@ -0,0 +1,60 @@
+"""name changes notify
+
+Revision ID: 8c3d6f2a9b14
+Revises: 5e8b1f3a6c27
+Create Date: 2026-10-19 20:13:42.518903
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8c3d6f2a9b14"
+down_revision = "5e8b1f3a6c27"
+branch_labels = None
+depends_on = None
+
+TABLES = ("tag", "category", "university")
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_name_change() RETURNS trigger AS $$
+        DECLARE
+            changed RECORD;
+            payload TEXT;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                changed := OLD;
+            ELSE
+                changed := NEW;
+            END IF;
+            payload := json_build_object(
+                'source', TG_TABLE_NAME,
+                'operation', TG_OP,
+                'id', changed.id,
+                'name', changed.name
+            )::text;
+            IF octet_length(payload) > 7900 THEN
+                payload := json_build_object(
+                    'source', TG_TABLE_NAME, 'operation', TG_OP, 'id', changed.id
+                )::text;
+            END IF;
+            PERFORM pg_notify('name_changes', payload);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table_name in TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table_name}_name_changes "
+            f"AFTER INSERT OR UPDATE OF name OR DELETE ON {table_name} "
+            "FOR EACH ROW EXECUTE FUNCTION notify_name_change()"
+        )
+
+
+def downgrade() -> None:
+    for table_name in reversed(TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS {table_name}_name_changes ON {table_name}")
+    op.execute("DROP FUNCTION IF EXISTS notify_name_change()")
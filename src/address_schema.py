@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+import json
+
+from pydantic import BaseModel, Field
 
 
 class Address(BaseModel):
@@ -11,3 +13,20 @@ class Address(BaseModel):
     level: int = None
     flat: int = None
     office: int = None
+    latitude: float = Field(None, ge=-90, le=90)
+    longitude: float = Field(None, ge=-180, le=180)
+
+
+def convert_address(address: dict | str | None) -> Address | dict | None:
+    if type(address) is str:
+        return Address(**json.loads(address))
+    return address
+
+
+def get_coordinates(address: dict | None) -> dict:
+    if address is None:
+        return {"latitude": None, "longitude": None}
+    return {
+        "latitude": address.get("latitude"),
+        "longitude": address.get("longitude"),
+    }
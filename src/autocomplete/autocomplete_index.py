@@ -0,0 +1,130 @@
+import asyncio
+import json
+import re
+import time
+from bisect import bisect_left, insort
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.autocomplete.autocomplete_models import AutocompleteSource
+from src.database_utils.base_query import BaseQuery
+
+
+class AutocompleteIndex:
+    """
+    In-memory prefix index over model names.
+
+    Every word of a name is stored as a sorted suffix entry, so a prefix
+    lookup is a binary search plus a short scan.
+    """
+
+    def __init__(self, queries: dict[AutocompleteSource, BaseQuery], ttl: float):
+        self._queries = queries
+        self._ttl = ttl
+        self._entries: dict[AutocompleteSource, list[tuple[str, int, str]]] = {}
+        self._built_at: dict[AutocompleteSource, float] = {}
+        self._change_count: dict[AutocompleteSource, int] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _get_entries(model_id: int, name: str) -> list[tuple[str, int, str]]:
+        folded = name.casefold()
+        return [
+            (folded[word.start() :], model_id, name)
+            for word in re.finditer(r"\w+", folded)
+        ]
+
+    def build(self, source: AutocompleteSource, schemas: list[dict]) -> None:
+        entries = []
+        for schema in schemas:
+            entries.extend(
+                self._get_entries(model_id=schema["id"], name=schema["name"])
+            )
+        entries.sort()
+        self._entries[source] = entries
+        self._built_at[source] = time.monotonic()
+
+    def put(self, source: AutocompleteSource, model_id: int, name: str) -> None:
+        """
+        Replaces the entries of one model in place, without reloading the
+        whole table
+        """
+        self._count_change(source=source)
+        if source not in self._entries:
+            return
+        self.remove(source=source, model_id=model_id)
+        for entry in self._get_entries(model_id=model_id, name=name):
+            insort(self._entries[source], entry)
+
+    def remove(self, source: AutocompleteSource, model_id: int) -> None:
+        self._count_change(source=source)
+        if source not in self._entries:
+            return
+        self._entries[source] = [
+            entry for entry in self._entries[source] if entry[1] != model_id
+        ]
+
+    def is_fresh(self, source: AutocompleteSource) -> bool:
+        built_at = self._built_at.get(source)
+        return built_at is not None and time.monotonic() - built_at < self._ttl
+
+    def invalidate(self, source: AutocompleteSource) -> None:
+        self._count_change(source=source)
+        self._built_at.pop(source, None)
+
+    def invalidate_all(self) -> None:
+        for source in self._queries:
+            self.invalidate(source=source)
+
+    def _count_change(self, source: AutocompleteSource) -> None:
+        self._change_count[source] = self._change_count.get(source, 0) + 1
+
+    def apply_change(self, payload: str) -> None:
+        """
+        Applies a change notified by another worker, see
+        `src.database_utils.name_changes`
+        """
+        change = json.loads(payload)
+        try:
+            source = AutocompleteSource(change["source"])
+        except ValueError:
+            return
+        if change["operation"] == "DELETE":
+            self.remove(source=source, model_id=change["id"])
+        elif "name" in change:
+            self.put(source=source, model_id=change["id"], name=change["name"])
+        else:
+            self.invalidate(source=source)
+
+    async def refresh(self, source: AutocompleteSource, session: AsyncSession) -> None:
+        async with self._lock:
+            if self.is_fresh(source=source):
+                return
+            change_count = self._change_count.get(source, 0)
+            schemas = await self._queries[source].get_all(
+                session=session, fields=["name"]
+            )
+            if schemas is None:
+                raise Exception(f"Failed to load {source.value} names")
+            self.build(source=source, schemas=schemas)
+            # A change applied while loading may be missing from the loaded names
+            if self._change_count.get(source, 0) != change_count:
+                self.invalidate(source=source)
+
+    async def refresh_all(self, session: AsyncSession) -> None:
+        for source in self._queries:
+            await self.refresh(source=source, session=session)
+
+    def search(self, source: AutocompleteSource, prefix: str, limit: int) -> list[dict]:
+        key = prefix.strip().casefold()
+        entries = self._entries.get(source, [])
+        found = {}
+        for index in range(bisect_left(entries, (key,)), len(entries)):
+            folded, model_id, name = entries[index]
+            if not folded.startswith(key):
+                break
+            if model_id not in found:
+                found[model_id] = {"id": model_id, "name": name}
+                if len(found) == limit:
+                    break
+        return list(found.values())
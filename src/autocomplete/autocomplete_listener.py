@@ -0,0 +1,45 @@
+import asyncio
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.autocomplete.autocomplete_index import AutocompleteIndex
+from src.database_utils.name_changes import NAME_CHANGES_CHANNEL
+
+
+async def listen_name_changes(engine: AsyncEngine, index: AutocompleteIndex) -> None:
+    """
+    Applies name changes committed by any worker to `index` until the
+    connection is lost
+    """
+    async with engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        terminated = asyncio.get_running_loop().create_future()
+
+        def on_termination(_connection) -> None:
+            if not terminated.done():
+                terminated.set_result(None)
+
+        def on_notification(_connection, _pid, _channel, payload: str) -> None:
+            try:
+                index.apply_change(payload=payload)
+            except Exception as e:
+                logger.error(str(e))
+
+        driver_connection.add_termination_listener(on_termination)
+        await driver_connection.add_listener(NAME_CHANGES_CHANNEL, on_notification)
+        # Changes committed while not listening are lost
+        index.invalidate_all()
+        await terminated
+
+
+async def run_autocomplete_listener(
+    engine: AsyncEngine, index: AutocompleteIndex, retry_interval: int
+) -> None:
+    while True:
+        try:
+            await listen_name_changes(engine=engine, index=index)
+        except Exception as e:
+            logger.error(str(e))
+        await asyncio.sleep(retry_interval)
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class AutocompleteSource(Enum):
+    TAG = "tag"
+    CATEGORY = "category"
+    UNIVERSITY = "university"
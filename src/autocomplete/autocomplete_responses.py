@@ -0,0 +1,44 @@
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.autocomplete.autocomplete_index import AutocompleteIndex
+from src.autocomplete.autocomplete_models import AutocompleteSource
+from src.autocomplete.text.autocomplete_data_key import AutocompleteDataKey
+from src.autocomplete.text.autocomplete_message import AutocompleteMessage
+from src.instruments import autocomplete_index
+from src.schemas import Response
+from src.utils import Status, return_json
+
+
+class AutocompleteResponseHandler:
+    _index: AutocompleteIndex = autocomplete_index
+    _message: AutocompleteMessage = AutocompleteMessage()
+    _data_key: AutocompleteDataKey = AutocompleteDataKey()
+
+    async def search(
+        self,
+        source: AutocompleteSource,
+        text: str,
+        limit: int,
+        session: AsyncSession,
+    ) -> Response:
+        try:
+            if not self._index.is_fresh(source=source):
+                await self._index.refresh(source=source, session=session)
+            schemas = self._index.search(source=source, prefix=text, limit=limit)
+            data = {
+                self._data_key.get("count"): len(schemas),
+                self._data_key.get("schemas"): schemas,
+            }
+            return return_json(
+                status=Status.SUCCESS,
+                message=self._message.get("search_success").format(text=text),
+                data=data,
+            )
+        except Exception as e:
+            logger.error(str(e))
+            return return_json(
+                status=Status.ERROR,
+                message=self._message.get("search_error").format(text=text),
+                details=str(e),
+            )
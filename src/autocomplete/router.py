@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.autocomplete.autocomplete_models import AutocompleteSource
+from src.autocomplete.autocomplete_responses import AutocompleteResponseHandler
+from src.database import get_async_session
+from src.schemas import Response
+
+autocomplete_router = APIRouter(prefix="/autocomplete", tags=["autocomplete"])
+
+autocomplete_response_handler = AutocompleteResponseHandler()
+
+
+@autocomplete_router.get("/{source}", response_model=Response)
+async def autocomplete(
+    source: AutocompleteSource,
+    q: Annotated[str, Query()] = "",
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    return await autocomplete_response_handler.search(
+        source=source, text=q, limit=limit, session=session
+    )
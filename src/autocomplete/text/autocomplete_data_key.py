@@ -0,0 +1,13 @@
+from src.database_utils.text.base_data_key import BaseDataKey
+
+count = "suggestions_count"
+schemas = "suggestions"
+
+AUTOCOMPLETE_DATA_KEY = {
+    "count": count,
+    "schemas": schemas,
+}
+
+
+class AutocompleteDataKey(BaseDataKey):
+    _data_key: dict = AUTOCOMPLETE_DATA_KEY
@@ -0,0 +1,13 @@
+from src.database_utils.text.base_message import BaseMessage
+
+search_error = "Произошла ошибка при автодополнении по запросу «{text}»"
+search_success = "Успешное автодополнение по запросу «{text}»"
+
+AUTOCOMPLETE_MESSAGE = {
+    "search_error": search_error,
+    "search_success": search_success,
+}
+
+
+class AutocompleteMessage(BaseMessage):
+    _messages: dict = AUTOCOMPLETE_MESSAGE
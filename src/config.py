@@ -22,6 +22,32 @@ UNIVERSITY = os.environ.get("UNIVERSITY")
 USER = os.environ.get("USER")
 ROOT = os.environ.get("ROOT")
 
+AUTOCOMPLETE_TTL = int(os.environ.get("AUTOCOMPLETE_TTL", 300))
+AUTOCOMPLETE_LISTEN_RETRY_INTERVAL = int(
+    os.environ.get("AUTOCOMPLETE_LISTEN_RETRY_INTERVAL", 5)
+)
+REGISTRATION_RECONCILE_INTERVAL = int(
+    os.environ.get("REGISTRATION_RECONCILE_INTERVAL", 3600)
+)
+BULK_REGISTRATION_LIMIT = int(os.environ.get("BULK_REGISTRATION_LIMIT", 1000))
+EXPORT_YIELD_PER = int(os.environ.get("EXPORT_YIELD_PER", 1000))
+IMPORT_BATCH_SIZE = int(os.environ.get("IMPORT_BATCH_SIZE", 500))
+
+DEBUG = os.environ.get("DEBUG", "false").lower() == "true"
+QUERY_COUNT_THRESHOLD = int(os.environ.get("QUERY_COUNT_THRESHOLD", 20))
+REPEATED_QUERY_THRESHOLD = int(os.environ.get("REPEATED_QUERY_THRESHOLD", 5))
+TRACE_EXPORT_PATH = os.environ.get("TRACE_EXPORT_PATH", "")
+
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+LOG_FILE = os.environ.get("LOG_FILE", "education_tour.log")
+LOG_SAMPLING_WINDOW = float(os.environ.get("LOG_SAMPLING_WINDOW", 60))
+LOG_SAMPLING_LIMIT = int(os.environ.get("LOG_SAMPLING_LIMIT", 10))
+
+PROFILE_DIR = os.environ.get("PROFILE_DIR", "profiles")
+PROFILE_MAX_SECONDS = int(os.environ.get("PROFILE_MAX_SECONDS", 60))
+SLOW_REQUEST_THRESHOLD_MS = float(os.environ.get("SLOW_REQUEST_THRESHOLD_MS", 1000))
+SLOW_REQUEST_HISTORY = int(os.environ.get("SLOW_REQUEST_HISTORY", 20))
+
 ALLOWED_HOSTS = ["77.232.135.31", "109.172.81.237"]
 
 ORIGINS = [
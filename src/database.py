@@ -6,6 +6,8 @@ from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.pool import NullPool
 
 from src.config import DB_HOST, DB_NAME, DB_PASSWORD, DB_PORT, DB_USER
+from src.database_utils.query_counter import install_query_counter
+from src.monitoring.metrics import install_metrics
 
 DATABASE_URL = (
     f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
@@ -14,6 +16,8 @@ Base = declarative_base()
 metadata = MetaData()
 
 engine = create_async_engine(url=DATABASE_URL, poolclass=NullPool)
+install_query_counter(engine=engine.sync_engine)
+install_metrics(engine=engine.sync_engine)
 async_session_maker = sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -1,11 +1,43 @@
+import math
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from loguru import logger
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    Row,
+    Select,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    update,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.address_schema import convert_address, get_coordinates
 from src.database_utils.base_models import BaseModels
+from src.database_utils.search_vector import SEARCH_VECTOR, to_prefix_tsquery
+from src.monitoring.metrics import instrument_query_methods
+from src.utils import SortOrder
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.045
+
+
+def any_of(value_list: list[int]):
+    return any_(
+        bindparam("value_list", value=value_list, type_=ARRAY(Integer), unique=True)
+    )
+
+
+def address_field(address, key: str):
+    return func.lower(address[literal_column(f"'{key}'")].astext)
 
 
 class AbstractBaseQuery(ABC):
@@ -23,7 +55,9 @@ class AbstractBaseQuery(ABC):
         pass
 
     @abstractmethod
-    async def get_all(self, session: AsyncSession) -> list[_schema_read_class] | None:
+    async def get_all(
+        self, session: AsyncSession, fields: list[str] | None = None
+    ) -> list[_schema_read_class | dict] | None:
         pass
 
     @abstractmethod
@@ -53,6 +87,10 @@ class BaseQuery(AbstractBaseQuery):
     _schema_read_class: type = _models.read_class
     _model: type = _models.database_table
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        instrument_query_methods(cls)
+
     async def create(
         self, model_create: _schema_create_class, session: AsyncSession
     ) -> IntegrityError | None:
@@ -66,15 +104,162 @@ class BaseQuery(AbstractBaseQuery):
         schema: BaseQuery._schema_read_class = self._schema_read_class(id=model.id)
         return schema
 
+    def _convert_row_to_sparse_schema(self, row: Row) -> dict:
+        schema = dict(row._mapping)
+        if "address" in schema:
+            schema["address"] = convert_address(address=schema["address"])
+        return schema
+
     def _convert_models_to_schema_list(
-        self, models: list[_model]
-    ) -> list[_schema_read_class] | None:
+        self, models: list[_model], fields: list[str] | None = None
+    ) -> list[_schema_read_class | dict] | None:
+        if fields is not None:
+            return [self._convert_row_to_sparse_schema(row=model) for model in models]
         return [self._convert_model_to_schema(model=model) for model in models]
 
-    async def get_all(self, session: AsyncSession) -> list[_schema_read_class] | None:
+    def _get_sparse_columns(self, fields: list[str]) -> list:
+        column_names = self._model.__table__.columns.keys()
+        columns = [self._model.id]
+        for field in dict.fromkeys(fields):
+            if field in column_names and field not in ("id", SEARCH_VECTOR):
+                columns.append(getattr(self._model, field))
+        return columns
+
+    def _select(self, fields: list[str] | None = None) -> Select:
+        if fields is None:
+            return select(self._model)
+        return select(*self._get_sparse_columns(fields=fields))
+
+    def _get_values(self, schema) -> dict:
+        values = schema.dict()
+        if "address" in values and hasattr(self._model, "latitude"):
+            values.update(get_coordinates(address=values["address"]))
+        return values
+
+    async def get_existing_ids(
+        self, model_id_list: list[int], session: AsyncSession
+    ) -> set[int]:
+        if len(model_id_list) == 0:
+            return set()
+        existing = await session.execute(
+            select(self._model.id).where(
+                self._model.id == any_of(value_list=model_id_list)
+            )
+        )
+        return set(existing.scalars())
+
+    async def create_many(
+        self, model_create_list: list[_schema_create_class], session: AsyncSession
+    ) -> list[int]:
+        columns = self._model.__table__.columns.keys()
+        values_list = []
+        for model_create in model_create_list:
+            if hasattr(model_create, "fix_time"):
+                model_create.fix_time()
+            values = self._get_values(schema=model_create)
+            values_list.append(
+                {key: value for key, value in values.items() if key in columns}
+            )
+        created = await session.execute(
+            insert(self._model).returning(self._model.id, sort_by_parameter_order=True),
+            values_list,
+        )
+        return list(created.scalars())
+
+    def _filter_by_location(
+        self,
+        statement: Select,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        radius_km: float | None = None,
+    ) -> Select:
+        if latitude is None or longitude is None or radius_km is None:
+            return statement
+        latitude_delta = radius_km / KM_PER_DEGREE
+        cos_latitude = math.cos(math.radians(latitude))
+        longitude_delta = latitude_delta / max(cos_latitude, 1e-9)
+        if -180 <= longitude - longitude_delta and longitude + longitude_delta <= 180:
+            longitude_min, longitude_max = (
+                longitude - longitude_delta,
+                longitude + longitude_delta,
+            )
+        else:
+            longitude_min, longitude_max = -180, 180
+        statement = statement.filter(
+            func.point(self._model.longitude, self._model.latitude).op("<@")(
+                func.box(
+                    func.point(longitude_min, latitude - latitude_delta),
+                    func.point(longitude_max, latitude + latitude_delta),
+                )
+            )
+        )
+        haversine = func.power(
+            func.sin(func.radians(self._model.latitude - latitude) / 2), 2
+        ) + cos_latitude * func.cos(func.radians(self._model.latitude)) * func.power(
+            func.sin(func.radians(self._model.longitude - longitude) / 2), 2
+        )
+        return statement.filter(
+            2 * EARTH_RADIUS_KM * func.asin(func.sqrt(func.least(haversine, 1)))
+            <= radius_km
+        )
+
+    def _filter_by_address(
+        self,
+        statement: Select,
+        city: str | None = None,
+        country: str | None = None,
+    ) -> Select:
+        if city is not None:
+            statement = statement.filter(
+                address_field(address=self._model.address, key="city") == city.lower()
+            )
+        if country is not None:
+            statement = statement.filter(
+                address_field(address=self._model.address, key="country")
+                == country.lower()
+            )
+        return statement
+
+    def _filter_by_dates(
+        self,
+        statement: Select,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        registration_open: bool | None = None,
+        date_sort: SortOrder | None = None,
+    ) -> Select:
+        if date_from is not None:
+            statement = statement.filter(
+                self._model.date_start >= date_from.replace(tzinfo=None)
+            )
+        if date_to is not None:
+            statement = statement.filter(
+                self._model.date_start <= date_to.replace(tzinfo=None)
+            )
+        if registration_open is not None:
+            now = datetime.utcnow()
+            if registration_open:
+                statement = statement.filter(self._model.reg_deadline >= now)
+            else:
+                statement = statement.filter(self._model.reg_deadline < now)
+        if date_sort == SortOrder.ASC:
+            statement = statement.order_by(
+                self._model.date_start.asc(), self._model.id.asc()
+            )
+        elif date_sort == SortOrder.DESC:
+            statement = statement.order_by(
+                self._model.date_start.desc(), self._model.id.desc()
+            )
+        return statement
+
+    async def get_all(
+        self, session: AsyncSession, fields: list[str] | None = None
+    ) -> list[_schema_read_class | dict] | None:
         try:
-            models = await session.execute(select(self._model))
-            schema_list = self._convert_models_to_schema_list(models=models.all())
+            models = await session.execute(self._select(fields=fields))
+            schema_list = self._convert_models_to_schema_list(
+                models=models.all(), fields=fields
+            )
             return schema_list
         except Exception as e:
             logger.error(str(e))
@@ -93,6 +278,82 @@ class BaseQuery(AbstractBaseQuery):
             logger.error(str(e))
             return None
 
+    async def search(
+        self,
+        text: str,
+        session: AsyncSession,
+        limit: int,
+        fields: list[str] | None = None,
+    ) -> list[_schema_read_class | dict] | None:
+        try:
+            tsquery = to_prefix_tsquery(text=text)
+            if tsquery is None:
+                return []
+            search_vector = getattr(self._model, SEARCH_VECTOR)
+            models = await session.execute(
+                self._select(fields=fields)
+                .filter(search_vector.op("@@")(tsquery))
+                .order_by(
+                    func.ts_rank(search_vector, tsquery).desc(), self._model.id.asc()
+                )
+                .limit(limit)
+            )
+            return self._convert_models_to_schema_list(
+                models=models.all(), fields=fields
+            )
+        except Exception as e:
+            logger.error(str(e))
+            return None
+
+    async def get_by_ids(
+        self,
+        model_id_list: list[int],
+        session: AsyncSession,
+        fields: list[str] | None = None,
+    ) -> tuple[list[_schema_read_class | dict], list[int]] | None:
+        try:
+            model_id_list = list(dict.fromkeys(model_id_list))
+            models = await session.execute(
+                self._select(fields=fields).filter(
+                    self._model.id == any_of(value_list=model_id_list)
+                )
+            )
+            schemas = {
+                (schema["id"] if fields is not None else schema.id): schema
+                for schema in self._convert_models_to_schema_list(
+                    models=models.all(), fields=fields
+                )
+            }
+            found = [
+                schemas[model_id] for model_id in model_id_list if model_id in schemas
+            ]
+            missing = [
+                model_id for model_id in model_id_list if model_id not in schemas
+            ]
+            return found, missing
+        except Exception as e:
+            logger.error(str(e))
+            return None
+
+    async def get_by_relation_list(
+        self, relation_field, key_field, value_list: list[int], session: AsyncSession
+    ) -> dict[int, list[_schema_read_class]] | None:
+        try:
+            models = await session.execute(
+                select(self._model, key_field)
+                .join(key_field.class_, relation_field == self._model.id)
+                .filter(key_field == any_of(value_list=value_list))
+            )
+            schemas = {}
+            for model in models.all():
+                schemas.setdefault(model[1], []).append(
+                    self._convert_model_to_schema(model=model)
+                )
+            return schemas
+        except Exception as e:
+            logger.error(str(e))
+            return None
+
     async def update(
         self, model_update: _schema_update_class, session: AsyncSession
     ) -> IntegrityError | None:
@@ -148,3 +409,6 @@ class BaseQuery(AbstractBaseQuery):
                 return image_id
         except IntegrityError as e:
             return e
+
+
+instrument_query_methods(BaseQuery)
@@ -1,17 +1,23 @@
+import csv
 from abc import ABC
+from enum import Enum
+from typing import BinaryIO
 
 from fastapi import UploadFile
 from loguru import logger
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.autocomplete.autocomplete_models import AutocompleteSource
 from src.database_utils.base_models import BaseModels
 from src.database_utils.base_query import BaseQuery
+from src.database_utils.bulk_import import ImportFormat, import_rows, read_rows
 from src.database_utils.text.base_data_key import BaseDataKey
 from src.database_utils.text.base_details import BaseDetails
 from src.database_utils.text.base_message import BaseMessage
 from src.google_drive.directories import Directory
-from src.instruments import image_handler
+from src.instruments import autocomplete_index, image_handler
+from src.monitoring.tracing import trace_methods
 from src.schemas import Response
 from src.utils import Status, return_json
 
@@ -28,10 +34,51 @@ class BaseResponseHandler(ABC):
     _schema_read_class: type = _models.read_class
     _model: type = _models.database_table
     _google_directory: Directory = Directory.ROOT
+    _autocomplete_source: AutocompleteSource | None = None
+    _import_schema_class: type = _models.create_class
+    _relations: dict[Enum, object] = {}
 
-    async def get_all(self, session: AsyncSession) -> Response:
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls, layer="handler")
+
+    def _invalidate_autocomplete(self) -> None:
+        if self._autocomplete_source is not None:
+            autocomplete_index.invalidate(source=self._autocomplete_source)
+
+    def _put_autocomplete(self, model_update: _schema_update_class) -> None:
+        if self._autocomplete_source is not None:
+            autocomplete_index.put(
+                source=self._autocomplete_source,
+                model_id=model_update.id,
+                name=model_update.name,
+            )
+
+    def _remove_autocomplete(self, model_id: int) -> None:
+        if self._autocomplete_source is not None:
+            autocomplete_index.remove(
+                source=self._autocomplete_source, model_id=model_id
+            )
+
+    async def _check_import(
+        self, schemas: list, session: AsyncSession
+    ) -> list[list[str]]:
+        return [[] for _ in schemas]
+
+    async def _link_import(
+        self,
+        id_list: list[int],
+        schemas: list,
+        university_id: int | None,
+        session: AsyncSession,
+    ) -> None:
+        pass
+
+    async def get_all(
+        self, session: AsyncSession, fields: list[str] | None = None
+    ) -> Response:
         try:
-            schemas = await self._query.get_all(session=session)
+            schemas = await self._query.get_all(session=session, fields=fields)
             if schemas is not None:
                 data = {
                     self._data_key.get("count"): len(schemas),
@@ -52,10 +99,41 @@ class BaseResponseHandler(ABC):
                 details=str(e),
             )
 
-    async def get_by_id(self, model_id: int, session: AsyncSession) -> Response:
+    async def include_relations(
+        self,
+        schemas: list[_schema_read_class | dict],
+        include: list[Enum],
+        session: AsyncSession,
+    ) -> list[dict]:
+        items = [
+            schema if isinstance(schema, dict) else schema.dict() for schema in schemas
+        ]
+        model_id_list = [item["id"] for item in items]
+        for relation in dict.fromkeys(include):
+            related = await self._relations[relation].load(
+                value_list=model_id_list, session=session, include=include
+            )
+            if related is None:
+                raise Exception(self._details.get("include_error"))
+            for item in items:
+                item[relation.value] = related[item["id"]]
+        return items
+
+    async def get_by_id(
+        self,
+        model_id: int,
+        session: AsyncSession,
+        include: list[Enum] | None = None,
+    ) -> Response:
         try:
             schema = await self._query.get_by_id(model_id=model_id, session=session)
             if schema is not None:
+                if include:
+                    schema = (
+                        await self.include_relations(
+                            schemas=[schema], include=include, session=session
+                        )
+                    )[0]
                 data = {self._data_key.get("schema"): schema}
                 return return_json(
                     status=Status.SUCCESS,
@@ -72,6 +150,69 @@ class BaseResponseHandler(ABC):
                 details=str(e),
             )
 
+    async def get_by_id_list(
+        self,
+        model_id_list: list[int],
+        session: AsyncSession,
+        fields: list[str] | None = None,
+    ) -> Response:
+        try:
+            result = await self._query.get_by_ids(
+                model_id_list=model_id_list, session=session, fields=fields
+            )
+            if result is not None:
+                schemas, missing = result
+                data = {
+                    self._data_key.get("count"): len(schemas),
+                    self._data_key.get("schemas"): schemas,
+                    self._data_key.get("missing"): missing,
+                }
+                return return_json(
+                    status=Status.SUCCESS,
+                    message=self._message.get("get_all_success"),
+                    data=data,
+                )
+            else:
+                raise Exception()
+        except Exception as e:
+            logger.error(str(e))
+            return return_json(
+                status=Status.ERROR,
+                message=self._message.get("get_all_error"),
+                details=str(e),
+            )
+
+    async def search(
+        self,
+        text: str,
+        session: AsyncSession,
+        limit: int,
+        fields: list[str] | None = None,
+    ) -> Response:
+        try:
+            schemas = await self._query.search(
+                text=text, session=session, limit=limit, fields=fields
+            )
+            if schemas is not None:
+                data = {
+                    self._data_key.get("count"): len(schemas),
+                    self._data_key.get("schemas"): schemas,
+                }
+                return return_json(
+                    status=Status.SUCCESS,
+                    message=self._message.get("search_success").format(text=text),
+                    data=data,
+                )
+            else:
+                raise Exception()
+        except Exception as e:
+            logger.error(str(e))
+            return return_json(
+                status=Status.ERROR,
+                message=self._message.get("search_error").format(text=text),
+                details=str(e),
+            )
+
     @logger.catch
     async def create(
         self, model_create: _schema_create_class, session: AsyncSession
@@ -79,6 +220,7 @@ class BaseResponseHandler(ABC):
         try:
             error = await self._query.create(model_create=model_create, session=session)
             if error is None:
+                self._invalidate_autocomplete()
                 return return_json(
                     status=Status.SUCCESS, message=self._message.get("create_success")
                 )
@@ -102,6 +244,7 @@ class BaseResponseHandler(ABC):
                     model_update=model_update, session=session
                 )
                 if error is None:
+                    self._put_autocomplete(model_update=model_update)
                     return return_json(
                         status=Status.SUCCESS,
                         message=self._message.get("update_success").format(
@@ -133,6 +276,7 @@ class BaseResponseHandler(ABC):
             ]:
                 error = await self._query.delete(model_id=model_id, session=session)
                 if error is None:
+                    self._remove_autocomplete(model_id=model_id)
                     return return_json(
                         status=Status.SUCCESS,
                         message=self._message.get("delete_success").format(id=model_id),
@@ -152,6 +296,62 @@ class BaseResponseHandler(ABC):
                 message=self._message.get("delete_error").format(id=model_id),
             )
 
+    @logger.catch
+    async def import_file(
+        self,
+        file: BinaryIO,
+        import_format: ImportFormat,
+        session: AsyncSession,
+        university_id: int | None = None,
+        skip_invalid: bool = False,
+    ) -> Response:
+        async def link(id_list: list[int], schemas: list, session: AsyncSession):
+            await self._link_import(
+                id_list=id_list,
+                schemas=schemas,
+                university_id=university_id,
+                session=session,
+            )
+
+        try:
+            created_count, error_list = await import_rows(
+                rows=read_rows(file=file, import_format=import_format),
+                schema_class=self._import_schema_class,
+                query=self._query,
+                session=session,
+                check=self._check_import,
+                link=link,
+            )
+            if len(error_list) > 0 and not skip_invalid:
+                await session.rollback()
+                return return_json(
+                    status=Status.ERROR,
+                    message=self._message.get("import_error"),
+                    data={
+                        self._data_key.get("imported_count"): 0,
+                        self._data_key.get("import_errors"): error_list,
+                    },
+                    details=self._details.get("import_invalid_rows"),
+                )
+            await session.commit()
+            self._invalidate_autocomplete()
+            return return_json(
+                status=Status.SUCCESS,
+                message=self._message.get("import_success").format(count=created_count),
+                data={
+                    self._data_key.get("imported_count"): created_count,
+                    self._data_key.get("import_errors"): error_list,
+                },
+            )
+        except (IntegrityError, UnicodeDecodeError, csv.Error) as e:
+            await session.rollback()
+            logger.error(str(e))
+            return return_json(
+                status=Status.ERROR,
+                message=self._message.get("import_error"),
+                details=str(e),
+            )
+
     @logger.catch
     async def update_image(
         self, image: UploadFile, model_id: int, session: AsyncSession
@@ -240,3 +440,6 @@ class BaseResponseHandler(ABC):
                 status=Status.ERROR,
                 message=self._message.get("image_error").format(id=model_id),
             )
+
+
+trace_methods(BaseResponseHandler, layer="handler")
@@ -0,0 +1,120 @@
+import csv
+import io
+import json
+from enum import Enum
+from itertools import islice
+from typing import Awaitable, BinaryIO, Callable, Iterable, Iterator
+
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import IMPORT_BATCH_SIZE
+from src.database_utils.base_query import BaseQuery
+
+LIST_SEPARATOR = ";"
+
+
+class ImportFormat(Enum):
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+def _unflatten(row: dict) -> dict:
+    result = {}
+    for key, value in row.items():
+        if key is None or value is None or value == "":
+            continue
+        if key.endswith("_list"):
+            value = value.split(LIST_SEPARATOR)
+        *parents, name = key.split(".")
+        node = result
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[name] = value
+    return result
+
+
+def read_rows(
+    file: BinaryIO, import_format: ImportFormat
+) -> Iterator[tuple[int, dict | ValueError]]:
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    if import_format == ImportFormat.CSV:
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, _unflatten(row)
+    else:
+        for line_number, line in enumerate(text, start=1):
+            if line.strip() == "":
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError as e:
+                yield line_number, e
+
+
+def next_batch(iterator: Iterator, size: int) -> list:
+    return list(islice(iterator, size))
+
+
+def _format_validation_error(error: ValidationError) -> list[str]:
+    return [
+        ".".join(str(loc) for loc in detail["loc"]) + ": " + detail["msg"]
+        for detail in error.errors()
+    ]
+
+
+async def import_rows(
+    rows: Iterable[tuple[int, dict | ValueError]],
+    schema_class: type,
+    query: BaseQuery,
+    session: AsyncSession,
+    check: Callable[[list[BaseModel], AsyncSession], Awaitable[list[list[str]]]]
+    | None = None,
+    link: Callable[[list[int], list[BaseModel], AsyncSession], Awaitable[None]]
+    | None = None,
+) -> tuple[int, list[dict]]:
+    """
+    Validates and inserts rows in batches of IMPORT_BATCH_SIZE without
+    committing, so the caller decides whether the whole import is kept.
+    Each batch is read and parsed in the threadpool to keep the event loop
+    free while a large upload is processed.
+    Returns the number of inserted rows and the row-level errors.
+    """
+    created_count = 0
+    error_list = []
+    iterator = iter(rows)
+    while batch := await run_in_threadpool(next_batch, iterator, IMPORT_BATCH_SIZE):
+        valid = []
+        for row_number, row in batch:
+            try:
+                if isinstance(row, ValueError):
+                    raise row
+                valid.append((row_number, schema_class.parse_obj(row)))
+            except ValidationError as e:
+                error_list.append(
+                    {"row": row_number, "errors": _format_validation_error(e)}
+                )
+            except ValueError as e:
+                error_list.append({"row": row_number, "errors": [str(e)]})
+        if check is not None and len(valid) > 0:
+            checked = await check([schema for _, schema in valid], session)
+            error_list.extend(
+                {"row": row_number, "errors": errors}
+                for (row_number, _), errors in zip(valid, checked)
+                if len(errors) > 0
+            )
+            valid = [
+                (row_number, schema)
+                for (row_number, schema), errors in zip(valid, checked)
+                if len(errors) == 0
+            ]
+        if len(valid) == 0:
+            continue
+        schemas = [schema for _, schema in valid]
+        id_list = await query.create_many(model_create_list=schemas, session=session)
+        if link is not None:
+            await link(id_list, schemas, session)
+        created_count += len(id_list)
+    error_list.sort(key=lambda error: error["row"])
+    return created_count, error_list
@@ -1,10 +1,10 @@
 from loguru import logger
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database_utils.base_models import BaseModels
-from src.database_utils.base_query import BaseQuery
+from src.database_utils.base_query import BaseQuery, any_of
 
 
 class DependentBaseQuery(BaseQuery):
@@ -41,5 +41,19 @@ class DependentBaseQuery(BaseQuery):
             logger.error(str(e))
             return None
 
+    async def count_by_dependency_list(
+        self, dependency_field, value_list: list[int], session: AsyncSession
+    ) -> dict[int, int] | None:
+        try:
+            rows = await session.execute(
+                select(dependency_field, func.count())
+                .filter(dependency_field == any_of(value_list=value_list))
+                .group_by(dependency_field)
+            )
+            return {value: count for value, count in rows.all()}
+        except Exception as e:
+            logger.error(str(e))
+            return None
+
     def get_schema_create_class(self) -> type:
         return self._schema_create_class
@@ -0,0 +1,86 @@
+import csv
+import io
+import json
+from enum import Enum
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from loguru import logger
+
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+class ExportFormat(Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+EXPORT_MEDIA_TYPE = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+async def _to_csv(rows: AsyncIterator[dict], fields: list[str]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    async for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+async def _to_ndjson(
+    rows: AsyncIterator[dict], fields: list[str]
+) -> AsyncIterator[str]:
+    chunk = []
+    chunk_size = 0
+    async for row in rows:
+        line = json.dumps({field: row.get(field) for field in fields}, default=str)
+        chunk.append(line + "\n")
+        chunk_size += len(line) + 1
+        if chunk_size >= EXPORT_CHUNK_SIZE:
+            yield "".join(chunk)
+            chunk = []
+            chunk_size = 0
+    yield "".join(chunk)
+
+
+_SERIALIZERS = {
+    ExportFormat.CSV: _to_csv,
+    ExportFormat.NDJSON: _to_ndjson,
+}
+
+
+async def _logged(content: AsyncIterator[str]) -> AsyncIterator[str]:
+    try:
+        async for chunk in content:
+            yield chunk
+    except Exception as e:
+        logger.error(str(e))
+        raise
+
+
+def export_response(
+    rows: AsyncIterator[dict],
+    fields: list[str],
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    content = _SERIALIZERS[export_format](rows=rows, fields=fields)
+    return StreamingResponse(
+        _logged(content=content),
+        media_type=EXPORT_MEDIA_TYPE[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{filename}.{export_format.value}"'
+            )
+        },
+    )
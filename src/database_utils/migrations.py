@@ -0,0 +1,87 @@
+import asyncio
+import os
+from functools import cache
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from alembic.script.revision import ResolutionError
+from loguru import logger
+from sqlalchemy import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+ALEMBIC_INI = os.path.join(ROOT_DIR, "alembic.ini")
+# Key of the Postgres advisory lock held while migrations run
+MIGRATION_LOCK_ID = 731_904_215
+
+
+def get_alembic_config() -> Config:
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(ROOT_DIR, "migrations"))
+    return config
+
+
+@cache
+def get_script_directory() -> ScriptDirectory:
+    return ScriptDirectory.from_config(get_alembic_config())
+
+
+@cache
+def get_head_revisions() -> frozenset[str]:
+    return frozenset(get_script_directory().get_heads())
+
+
+def get_current_revisions(connection: Connection) -> frozenset[str]:
+    return frozenset(MigrationContext.configure(connection).get_current_heads())
+
+
+def is_up_to_date(current: frozenset[str]) -> bool:
+    """
+    Checks that the database is at or beyond every head of this build.
+    A revision unknown to this build was applied by a newer one, so during
+    a rolling deploy the old replicas keep serving.
+    """
+    if len(current) == 0:
+        return False
+    try:
+        applied = {
+            revision.revision
+            for revision in get_script_directory().revision_map.iterate_revisions(
+                tuple(current), "base"
+            )
+        }
+    except ResolutionError:
+        return True
+    return get_head_revisions() <= applied
+
+
+async def is_migrated(connection: AsyncConnection) -> bool:
+    current = await connection.run_sync(get_current_revisions)
+    return is_up_to_date(current=current)
+
+
+async def _check_database() -> bool:
+    from src.database import engine
+
+    async with engine.connect() as connection:
+        return await is_migrated(connection=connection)
+
+
+def migrate() -> None:
+    # Not asyncio.run(): it unsets the main thread loop, which alembic's
+    # async_fallback engine needs afterwards
+    loop = asyncio.new_event_loop()
+    try:
+        migrated = loop.run_until_complete(_check_database())
+    finally:
+        loop.close()
+    if migrated:
+        logger.info("Database is at or beyond head, nothing to migrate")
+        return
+    command.upgrade(get_alembic_config(), "head")
+
+
+if __name__ == "__main__":
+    migrate()
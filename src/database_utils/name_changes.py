@@ -0,0 +1,57 @@
+from sqlalchemy import DDL, Table, event
+
+NAME_CHANGES_CHANNEL = "name_changes"
+NAME_CHANGES_FUNCTION = "notify_name_change"
+# pg_notify rejects payloads of 8000 bytes and more
+MAX_PAYLOAD_SIZE = 7900
+
+CREATE_NAME_CHANGES_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION {NAME_CHANGES_FUNCTION}() RETURNS trigger AS $$
+DECLARE
+    changed RECORD;
+    payload TEXT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := OLD;
+    ELSE
+        changed := NEW;
+    END IF;
+    payload := json_build_object(
+        'source', TG_TABLE_NAME,
+        'operation', TG_OP,
+        'id', changed.id,
+        'name', changed.name
+    )::text;
+    IF octet_length(payload) > {MAX_PAYLOAD_SIZE} THEN
+        payload := json_build_object(
+            'source', TG_TABLE_NAME, 'operation', TG_OP, 'id', changed.id
+        )::text;
+    END IF;
+    PERFORM pg_notify('{NAME_CHANGES_CHANNEL}', payload);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def get_trigger_name(table_name: str) -> str:
+    return f"{table_name}_{NAME_CHANGES_CHANNEL}"
+
+
+def create_name_changes_trigger(table_name: str) -> str:
+    return (
+        f"CREATE TRIGGER {get_trigger_name(table_name=table_name)} "
+        f"AFTER INSERT OR UPDATE OF name OR DELETE ON {table_name} "
+        f"FOR EACH ROW EXECUTE FUNCTION {NAME_CHANGES_FUNCTION}()"
+    )
+
+
+def notify_name_changes(table: Table) -> None:
+    """
+    Notifies `NAME_CHANGES_CHANNEL` of every committed change of a name in
+    `table`, so every worker can update its in-memory copy of the names
+    """
+    event.listen(table, "after_create", DDL(CREATE_NAME_CHANGES_FUNCTION))
+    event.listen(
+        table, "after_create", DDL(create_name_changes_trigger(table_name=table.name))
+    )
@@ -0,0 +1,123 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.config import QUERY_COUNT_THRESHOLD, REPEATED_QUERY_THRESHOLD
+
+LOGGED_STATEMENT_LENGTH = 200
+MAX_RECORDED_QUERIES = 100
+
+
+class QueryStats:
+    """
+    SQL statements executed while handling one request
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.commits = 0
+        self.duration = 0.0
+        self.statements = Counter()
+        self.queries: list[tuple[str, float]] = []
+
+    def add(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+        if len(self.queries) < MAX_RECORDED_QUERIES:
+            self.queries.append((statement, duration))
+
+    def get_repeated(self) -> dict[str, int]:
+        return {
+            statement: count
+            for statement, count in self.statements.items()
+            if count >= REPEATED_QUERY_THRESHOLD
+        }
+
+    def get_headers(self) -> dict[str, str]:
+        return {
+            "X-DB-Query-Count": str(self.count),
+            "X-DB-Commit-Count": str(self.commits),
+            "X-DB-Time-Ms": f"{self.duration * 1000:.1f}",
+        }
+
+    def log(self, request: str) -> None:
+        if self.count > QUERY_COUNT_THRESHOLD:
+            logger.warning(
+                f"{request} executed {self.count} queries "
+                f"in {self.duration * 1000:.1f} ms"
+            )
+        for statement, count in self.get_repeated().items():
+            logger.warning(
+                f"{request} repeated the same query {count} times (possible N+1): "
+                f"{' '.join(statement.split())[:LOGGED_STATEMENT_LENGTH]}"
+            )
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats() -> QueryStats:
+    query_stats = QueryStats()
+    _query_stats.set(query_stats)
+    return query_stats
+
+
+def get_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context.query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    query_stats = _query_stats.get()
+    if query_stats is not None:
+        query_stats.add(
+            statement=statement,
+            duration=time.perf_counter() - context.query_start_time,
+        )
+
+
+def _after_commit(conn):
+    query_stats = _query_stats.get()
+    if query_stats is not None:
+        query_stats.commits += 1
+
+
+def install_query_counter(engine: Engine) -> None:
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "commit", _after_commit)
+
+
+@contextmanager
+def record_queries(engine: Engine) -> Iterator[QueryStats]:
+    """
+    Counts every statement and commit on `engine` while active, including
+    the ones executed outside the current context (streamed responses,
+    middleware child tasks)
+    """
+    query_stats = QueryStats()
+
+    def after_cursor_execute(conn, cursor, statement, *args):
+        query_stats.add(statement=statement, duration=0.0)
+
+    def after_commit(conn):
+        query_stats.commits += 1
+
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "commit", after_commit)
+    try:
+        yield query_stats
+    finally:
+        event.remove(engine, "after_cursor_execute", after_cursor_execute)
+        event.remove(engine, "commit", after_commit)
@@ -0,0 +1,548 @@
+from collections import Counter
+from datetime import datetime
+from enum import Enum
+from typing import AsyncIterator
+
+from loguru import logger
+from sqlalchemy import delete, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import EXPORT_YIELD_PER
+from src.database_utils.base_models import BaseModels
+from src.database_utils.dependent_base_query import DependentBaseQuery
+
+# Key of the Postgres advisory lock held while registered_count is reconciled
+RECONCILE_LOCK_ID = 731_904_216
+
+
+class RegistrationResult(Enum):
+    SUCCESS = "success"
+    NOT_FOUND = "registration_not_found"
+    CLOSED = "registration_closed"
+    FULL = "registration_full"
+    ALREADY_REGISTERED = "already_registered"
+    WAITLISTED = "waitlisted"
+    NOT_REGISTERED = "not_registered"
+
+
+class RegistrationBaseQuery(DependentBaseQuery):
+    """
+    Registration Base Class
+
+    Keeps the target's (event or tour) registered_count in step with the
+    registration rows. A seat is taken with a conditional
+    UPDATE ... WHERE registered_count < max_users RETURNING, so concurrent
+    sign-ups cannot overfill the target. Seats released by a delete are given
+    to the waitlist in FIFO order within the same transaction.
+
+    Every write locks the target row before it touches registrations or the
+    waitlist, so a cancellation cannot slip in between the capacity check
+    and the waitlist insert of a concurrent join.
+    """
+
+    _models: BaseModels = BaseModels()
+
+    _schema_create_class: type = _models.create_class
+    _schema_update_class: type = _models.update_class
+    _schema_read_class: type = _models.read_class
+    _model: type = _models.database_table
+
+    _target_model: type = _models.database_table
+    _target_filter: object = "id"  # The Plug (a key of dependency_fields)
+    _waitlist_model: type = _models.database_table
+    _waitlist_read_class: type = _models.read_class
+    _university_link_model: type = _models.database_table
+
+    def _get_target_field(self):
+        return self.dependency_fields[self._target_filter]
+
+    def get_export_fields(self) -> list[str]:
+        return ["id", "user_id", self._get_target_field().key]
+
+    async def create(
+        self, model_create: _schema_create_class, session: AsyncSession
+    ) -> RegistrationResult | IntegrityError:
+        try:
+            result = await self._register(model_create=model_create, session=session)
+            if result == RegistrationResult.SUCCESS:
+                await session.commit()
+            else:
+                await session.rollback()
+            return result
+        except IntegrityError as e:
+            await session.rollback()
+            return e
+
+    async def _register(
+        self, model_create: _schema_create_class, session: AsyncSession
+    ) -> RegistrationResult:
+        target_field = self._get_target_field()
+        target_id = getattr(model_create, target_field.key)
+        result = await self._take_seat(target_id=target_id, session=session)
+        if result != RegistrationResult.SUCCESS:
+            return result
+        inserted = await session.execute(
+            pg_insert(self._model)
+            .values(**model_create.dict())
+            .on_conflict_do_nothing(index_elements=[self._model.user_id, target_field])
+            .returning(self._model.id)
+        )
+        if inserted.first() is None:
+            return RegistrationResult.ALREADY_REGISTERED
+        await self._delete_from_waitlist(
+            pairs={(model_create.user_id, target_id)}, session=session
+        )
+        return RegistrationResult.SUCCESS
+
+    async def _lock_targets(self, condition, session: AsyncSession) -> dict:
+        target = self._target_model
+        rows = await session.execute(
+            select(
+                target.id,
+                target.reg_deadline,
+                target.max_users,
+                target.registered_count,
+            )
+            .where(condition)
+            .order_by(target.id)
+            .with_for_update()
+        )
+        return {row.id: row for row in rows.all()}
+
+    @staticmethod
+    def _is_closed(target_row, now: datetime) -> bool:
+        return target_row.reg_deadline is not None and target_row.reg_deadline < now
+
+    async def _delete_from_waitlist(
+        self, pairs: set[tuple[int, int]], session: AsyncSession
+    ) -> None:
+        waitlist = self._waitlist_model
+        waitlist_target_field = getattr(waitlist, self._get_target_field().key)
+        await session.execute(
+            delete(waitlist).where(
+                tuple_(waitlist.user_id, waitlist_target_field).in_(pairs)
+            )
+        )
+
+    async def _take_seat(
+        self, target_id: int, session: AsyncSession
+    ) -> RegistrationResult:
+        target = self._target_model
+        taken = await session.execute(
+            update(target)
+            .where(
+                (target.id == target_id)
+                & or_(
+                    target.reg_deadline.is_(None),
+                    target.reg_deadline >= datetime.utcnow(),
+                )
+                & or_(
+                    target.max_users.is_(None),
+                    target.registered_count < target.max_users,
+                )
+            )
+            .values(registered_count=target.registered_count + 1)
+            .returning(target.id)
+        )
+        if taken.first() is not None:
+            return RegistrationResult.SUCCESS
+        existing = (
+            await session.execute(
+                select(target.reg_deadline).where(target.id == target_id)
+            )
+        ).one_or_none()
+        if existing is None:
+            return RegistrationResult.NOT_FOUND
+        if (
+            existing.reg_deadline is not None
+            and existing.reg_deadline < datetime.utcnow()
+        ):
+            return RegistrationResult.CLOSED
+        return RegistrationResult.FULL
+
+    async def _promote_from_waitlist(
+        self, target_id: int, seats: int, session: AsyncSession
+    ) -> int:
+        target_field = self._get_target_field()
+        waitlist = self._waitlist_model
+        waitlist_target_field = getattr(waitlist, target_field.key)
+        promoted_count = 0
+        while promoted_count < seats:
+            next_in_line = (
+                select(waitlist.id)
+                .where(waitlist_target_field == target_id)
+                .order_by(waitlist.id)
+                .limit(seats - promoted_count)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            promoted = await session.execute(
+                delete(waitlist)
+                .where(waitlist.id.in_(next_in_line))
+                .returning(waitlist.user_id)
+            )
+            user_id_list = [user_id for user_id, in promoted.all()]
+            if len(user_id_list) == 0:
+                break
+            inserted = await session.execute(
+                pg_insert(self._model)
+                .values(
+                    [
+                        {"user_id": user_id, target_field.key: target_id}
+                        for user_id in user_id_list
+                    ]
+                )
+                .on_conflict_do_nothing(
+                    index_elements=[self._model.user_id, target_field]
+                )
+                .returning(self._model.id)
+            )
+            promoted_count += len(inserted.all())
+        return promoted_count
+
+    async def _delete_rows(
+        self, condition, session: AsyncSession, promote: bool = True
+    ) -> set[tuple[int, int]]:
+        target_field = self._get_target_field()
+        targets = await self._lock_targets(
+            condition=self._target_model.id.in_(select(target_field).where(condition)),
+            session=session,
+        )
+        deleted = (
+            await session.execute(
+                delete(self._model)
+                .where(condition)
+                .returning(self._model.user_id, target_field)
+            )
+        ).all()
+        released = Counter(target_id for _, target_id in deleted)
+        if not released.keys() <= targets.keys():
+            targets.update(
+                await self._lock_targets(
+                    condition=self._target_model.id.in_(
+                        released.keys() - targets.keys()
+                    ),
+                    session=session,
+                )
+            )
+        now = datetime.utcnow()
+        for target_id, count in sorted(released.items()):
+            if promote and not self._is_closed(targets[target_id], now):
+                count -= await self._promote_from_waitlist(
+                    target_id=target_id, seats=count, session=session
+                )
+            await session.execute(
+                update(self._target_model)
+                .where(self._target_model.id == target_id)
+                .values(
+                    registered_count=func.greatest(
+                        self._target_model.registered_count - count, 0
+                    )
+                )
+            )
+        return {(user_id, target_id) for user_id, target_id in deleted}
+
+    async def _delete_where(
+        self, condition, session: AsyncSession, promote: bool = True
+    ) -> IntegrityError | None:
+        try:
+            await self._delete_rows(
+                condition=condition, session=session, promote=promote
+            )
+            await session.commit()
+        except IntegrityError as e:
+            await session.rollback()
+            return e
+
+    async def delete_by_dependency(
+        self, dependency_field, value: int, session: AsyncSession
+    ) -> IntegrityError | None:
+        if dependency_field is self._get_target_field():
+            return await self._delete_where(
+                condition=dependency_field == value, session=session, promote=False
+            )
+        try:
+            await self._delete_rows(
+                condition=dependency_field == value, session=session
+            )
+            waitlist = self._waitlist_model
+            await session.execute(
+                delete(waitlist).where(getattr(waitlist, dependency_field.key) == value)
+            )
+            await session.commit()
+        except IntegrityError as e:
+            await session.rollback()
+            return e
+
+    async def delete(
+        self, model_id: int, session: AsyncSession
+    ) -> IntegrityError | None:
+        return await self._delete_where(
+            condition=self._model.id == model_id, session=session
+        )
+
+    async def bulk_create(
+        self, model_create_list: list[_schema_create_class], session: AsyncSession
+    ) -> list[RegistrationResult] | IntegrityError:
+        try:
+            target_field = self._get_target_field()
+            target = self._target_model
+            pairs = [
+                (model_create.user_id, getattr(model_create, target_field.key))
+                for model_create in model_create_list
+            ]
+            targets = await self._lock_targets(
+                condition=target.id.in_({target_id for _, target_id in pairs}),
+                session=session,
+            )
+            registered = set(
+                (
+                    await session.execute(
+                        select(self._model.user_id, target_field).where(
+                            tuple_(self._model.user_id, target_field).in_(set(pairs))
+                        )
+                    )
+                ).all()
+            )
+            registered_count = {
+                target_id: row.registered_count for target_id, row in targets.items()
+            }
+            now = datetime.utcnow()
+            result_list = []
+            accepted = []
+            for user_id, target_id in pairs:
+                row = targets.get(target_id)
+                if row is None:
+                    result = RegistrationResult.NOT_FOUND
+                elif self._is_closed(row, now):
+                    result = RegistrationResult.CLOSED
+                elif (user_id, target_id) in registered:
+                    result = RegistrationResult.ALREADY_REGISTERED
+                elif (
+                    row.max_users is not None
+                    and registered_count[target_id] >= row.max_users
+                ):
+                    result = RegistrationResult.FULL
+                else:
+                    result = RegistrationResult.SUCCESS
+                    registered.add((user_id, target_id))
+                    registered_count[target_id] += 1
+                    accepted.append({"user_id": user_id, target_field.key: target_id})
+                result_list.append(result)
+            if len(accepted) > 0:
+                await session.execute(pg_insert(self._model).values(accepted))
+                await self._delete_from_waitlist(
+                    pairs={
+                        (values["user_id"], values[target_field.key])
+                        for values in accepted
+                    },
+                    session=session,
+                )
+                await session.execute(
+                    update(target),
+                    [
+                        {"id": target_id, "registered_count": count}
+                        for target_id, count in registered_count.items()
+                        if count != targets[target_id].registered_count
+                    ],
+                )
+            await session.commit()
+            return result_list
+        except IntegrityError as e:
+            await session.rollback()
+            return e
+
+    async def bulk_delete(
+        self, model_delete_list: list, session: AsyncSession
+    ) -> list[RegistrationResult] | IntegrityError:
+        try:
+            target_field = self._get_target_field()
+            pairs = [
+                (model_delete.user_id, getattr(model_delete, target_field.key))
+                for model_delete in model_delete_list
+            ]
+            deleted = await self._delete_rows(
+                condition=tuple_(self._model.user_id, target_field).in_(set(pairs)),
+                session=session,
+            )
+            await session.commit()
+            return [
+                RegistrationResult.SUCCESS
+                if pair in deleted
+                else RegistrationResult.NOT_REGISTERED
+                for pair in pairs
+            ]
+        except IntegrityError as e:
+            await session.rollback()
+            return e
+
+    async def reconcile_registered_count(self, session: AsyncSession) -> int:
+        """
+        Only one process reconciles at a time. Drifted targets are locked
+        before the recount, so a registration committed in the meantime is
+        counted instead of being overwritten with a stale value.
+        """
+        acquired = await session.scalar(
+            select(func.pg_try_advisory_xact_lock(RECONCILE_LOCK_ID))
+        )
+        if not acquired:
+            await session.rollback()
+            return 0
+        target = self._target_model
+        actual_count = (
+            select(func.count())
+            .select_from(self._model)
+            .where(self._get_target_field() == target.id)
+            .correlate(target)
+            .scalar_subquery()
+        )
+        drifted = (
+            await session.scalars(
+                select(target.id).where(target.registered_count != actual_count)
+            )
+        ).all()
+        reconciled_count = 0
+        if len(drifted) > 0:
+            await self._lock_targets(condition=target.id.in_(drifted), session=session)
+            reconciled = await session.execute(
+                update(target)
+                .where(
+                    target.id.in_(drifted) & (target.registered_count != actual_count)
+                )
+                .values(registered_count=actual_count)
+                .returning(target.id)
+            )
+            reconciled_count = len(reconciled.all())
+        await session.commit()
+        return reconciled_count
+
+    async def join_waitlist(
+        self, model_create: _schema_create_class, session: AsyncSession
+    ) -> RegistrationResult | IntegrityError:
+        try:
+            target_field = self._get_target_field()
+            target_id = getattr(model_create, target_field.key)
+            target_row = (
+                await self._lock_targets(
+                    condition=self._target_model.id == target_id, session=session
+                )
+            ).get(target_id)
+            if target_row is None:
+                result = RegistrationResult.NOT_FOUND
+            elif self._is_closed(target_row, datetime.utcnow()):
+                result = RegistrationResult.CLOSED
+            elif (
+                target_row.max_users is None
+                or target_row.registered_count < target_row.max_users
+            ):
+                result = await self._register(
+                    model_create=model_create, session=session
+                )
+            elif (
+                await session.scalar(
+                    select(self._model.id).where(
+                        (self._model.user_id == model_create.user_id)
+                        & (target_field == target_id)
+                    )
+                )
+                is not None
+            ):
+                result = RegistrationResult.ALREADY_REGISTERED
+            else:
+                waitlist = self._waitlist_model
+                await session.execute(
+                    pg_insert(waitlist)
+                    .values(**model_create.dict())
+                    .on_conflict_do_nothing(
+                        index_elements=[
+                            waitlist.user_id,
+                            getattr(waitlist, target_field.key),
+                        ]
+                    )
+                )
+                result = RegistrationResult.WAITLISTED
+            if result in (RegistrationResult.SUCCESS, RegistrationResult.WAITLISTED):
+                await session.commit()
+            else:
+                await session.rollback()
+            return result
+        except IntegrityError as e:
+            await session.rollback()
+            return e
+
+    async def get_waitlist(
+        self, waitlist_filter: Enum, value: int, session: AsyncSession
+    ) -> list[_waitlist_read_class] | None:
+        try:
+            waitlist = self._waitlist_model
+            waitlist_target_field = getattr(waitlist, self._get_target_field().key)
+            ranked = select(
+                waitlist.id,
+                waitlist.user_id,
+                waitlist_target_field,
+                func.row_number()
+                .over(partition_by=waitlist_target_field, order_by=waitlist.id)
+                .label("position"),
+            ).subquery()
+            rows = await session.execute(
+                select(ranked)
+                .where(ranked.c[waitlist_filter.value] == value)
+                .order_by(ranked.c.id)
+            )
+            return [self._waitlist_read_class(**row._mapping) for row in rows.all()]
+        except Exception as e:
+            logger.error(str(e))
+            return None
+
+    async def leave_waitlist(
+        self, model_delete, session: AsyncSession
+    ) -> IntegrityError | None:
+        try:
+            waitlist = self._waitlist_model
+            target_key = self._get_target_field().key
+            await session.execute(
+                delete(waitlist).where(
+                    (waitlist.user_id == model_delete.user_id)
+                    & (
+                        getattr(waitlist, target_key)
+                        == getattr(model_delete, target_key)
+                    )
+                )
+            )
+            await session.commit()
+        except IntegrityError as e:
+            await session.rollback()
+            return e
+
+    async def _stream(self, condition, session: AsyncSession) -> AsyncIterator[dict]:
+        result = await session.stream(
+            select(self._model.id, self._model.user_id, self._get_target_field())
+            .where(condition)
+            .order_by(self._model.id)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        async for row in result.mappings():
+            yield dict(row)
+
+    def stream_by_target(
+        self, target_id: int, session: AsyncSession
+    ) -> AsyncIterator[dict]:
+        return self._stream(
+            condition=self._get_target_field() == target_id, session=session
+        )
+
+    def stream_by_university(
+        self, university_id: int, session: AsyncSession
+    ) -> AsyncIterator[dict]:
+        target_field = self._get_target_field()
+        link = self._university_link_model
+        return self._stream(
+            condition=target_field.in_(
+                select(getattr(link, target_field.key)).where(
+                    link.university_id == university_id
+                )
+            ),
+            session=session,
+        )
@@ -0,0 +1,230 @@
+from fastapi.responses import StreamingResponse
+from loguru import logger
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database_utils.base_models import BaseModels
+from src.database_utils.base_response_handler import BaseResponseHandler
+from src.database_utils.export import ExportFormat, export_response
+from src.database_utils.registration_base_query import (
+    RegistrationBaseQuery,
+    RegistrationResult,
+)
+from src.database_utils.text.base_data_key import BaseDataKey
+from src.database_utils.text.base_details import BaseDetails
+from src.database_utils.text.base_message import BaseMessage
+from src.schemas import Response
+from src.utils import Status, return_json
+
+
+class RegistrationBaseResponseHandler(BaseResponseHandler):
+    """
+    Registration Base Class
+    """
+
+    _query: RegistrationBaseQuery = RegistrationBaseQuery()
+    _message: BaseMessage = BaseMessage()
+    _data_key: BaseDataKey = BaseDataKey()
+    _details: BaseDetails = BaseDetails()
+
+    _models: BaseModels = BaseModels()
+    _schema_create_class: type = _models.create_class
+    _schema_update_class: type = _models.update_class
+    _schema_read_class: type = _models.read_class
+    _model: type = _models.database_table
+
+    @logger.catch
+    async def create(
+        self, model_create: _schema_create_class, session: AsyncSession
+    ) -> Response:
+        try:
+            result = await self._query.create(
+                model_create=model_create, session=session
+            )
+            if result == RegistrationResult.SUCCESS:
+                return return_json(
+                    status=Status.SUCCESS, message=self._message.get("create_success")
+                )
+            elif isinstance(result, RegistrationResult):
+                return return_json(
+                    status=Status.ERROR,
+                    message=self._message.get("create_error"),
+                    details=self._details.get(result.value),
+                )
+            else:
+                raise result
+        except IntegrityError as e:
+            logger.error(str(e))
+            return return_json(
+                status=Status.ERROR,
+                message=self._message.get("create_error"),
+            )
+
+    def _get_bulk_data(self, model_list: list, result_list: list) -> dict:
+        results = [
+            {
+                **model.dict(),
+                "result": result.value,
+                "details": None
+                if result == RegistrationResult.SUCCESS
+                else self._details.get(result.value),
+            }
+            for model, result in zip(model_list, result_list)
+        ]
+        return {
+            self._data_key.get("success_count"): result_list.count(
+                RegistrationResult.SUCCESS
+            ),
+            self._data_key.get("results"): results,
+        }
+
+    @logger.catch
+    async def bulk_create(
+        self, model_create_list: list[_schema_create_class], session: AsyncSession
+    ) -> Response:
+        try:
+            result = await self._query.bulk_create(
+                model_create_list=model_create_list, session=session
+            )
+            if isinstance(result, list):
+                return return_json(
+                    status=Status.SUCCESS,
+                    message=self._message.get("bulk_create_success"),
+                    data=self._get_bulk_data(
+                        model_list=model_create_list, result_list=result
+                    ),
+                )
+            else:
+                raise result
+        except IntegrityError as e:
+            logger.error(str(e))
+            return return_json(
+                status=Status.ERROR,
+                message=self._message.get("bulk_create_error"),
+            )
+
+    @logger.catch
+    async def bulk_delete(
+        self, model_delete_list: list, session: AsyncSession
+    ) -> Response:
+        try:
+            result = await self._query.bulk_delete(
+                model_delete_list=model_delete_list, session=session
+            )
+            if isinstance(result, list):
+                return return_json(
+                    status=Status.SUCCESS,
+                    message=self._message.get("bulk_delete_success"),
+                    data=self._get_bulk_data(
+                        model_list=model_delete_list, result_list=result
+                    ),
+                )
+            else:
+                raise result
+        except IntegrityError as e:
+            logger.error(str(e))
+            return return_json(
+                status=Status.ERROR,
+                message=self._message.get("bulk_delete_error"),
+            )
+
+    async def join_waitlist(
+        self, model_create: _schema_create_class, session: AsyncSession
+    ) -> Response:
+        try:
+            result = await self._query.join_waitlist(
+                model_create=model_create, session=session
+            )
+            if result == RegistrationResult.SUCCESS:
+                return return_json(
+                    status=Status.SUCCESS, message=self._message.get("create_success")
+                )
+            elif result == RegistrationResult.WAITLISTED:
+                return return_json(
+                    status=Status.SUCCESS,
+                    message=self._message.get("waitlist_join_success"),
+                )
+            elif isinstance(result, RegistrationResult):
+                return return_json(
+                    status=Status.ERROR,
+                    message=self._message.get("waitlist_join_error"),
+                    details=self._details.get(result.value),
+                )
+            else:
+                raise result
+        except IntegrityError as e:
+            logger.error(str(e))
+            return return_json(
+                status=Status.ERROR,
+                message=self._message.get("waitlist_join_error"),
+            )
+
+    async def get_waitlist(
+        self, waitlist_filter, value: int, session: AsyncSession
+    ) -> Response:
+        try:
+            schemas = await self._query.get_waitlist(
+                waitlist_filter=waitlist_filter, value=value, session=session
+            )
+            if schemas is not None:
+                data = {
+                    self._data_key.get("waitlist_count"): len(schemas),
+                    self._data_key.get("waitlist"): schemas,
+                }
+                return return_json(
+                    status=Status.SUCCESS,
+                    message=self._message.get("waitlist_get_success"),
+                    data=data,
+                )
+            else:
+                raise Exception()
+        except Exception as e:
+            logger.error(str(e))
+            return return_json(
+                status=Status.ERROR,
+                message=self._message.get("waitlist_get_error"),
+                details=str(e),
+            )
+
+    async def leave_waitlist(self, model_delete, session: AsyncSession) -> Response:
+        try:
+            error = await self._query.leave_waitlist(
+                model_delete=model_delete, session=session
+            )
+            if error is None:
+                return return_json(
+                    status=Status.SUCCESS,
+                    message=self._message.get("waitlist_delete_success"),
+                )
+            else:
+                raise error
+        except IntegrityError as e:
+            logger.error(str(e))
+            return return_json(
+                status=Status.ERROR,
+                message=self._message.get("waitlist_delete_error"),
+            )
+
+    def export_by_target(
+        self, target_id: int, export_format: ExportFormat, session: AsyncSession
+    ) -> StreamingResponse:
+        fields = self._query.get_export_fields()
+        return export_response(
+            rows=self._query.stream_by_target(target_id=target_id, session=session),
+            fields=fields,
+            export_format=export_format,
+            filename=f"{fields[-1].removesuffix('_id')}_{target_id}_users",
+        )
+
+    def export_by_university(
+        self, university_id: int, export_format: ExportFormat, session: AsyncSession
+    ) -> StreamingResponse:
+        fields = self._query.get_export_fields()
+        return export_response(
+            rows=self._query.stream_by_university(
+                university_id=university_id, session=session
+            ),
+            fields=fields,
+            export_format=export_format,
+            filename=f"university_{university_id}_{fields[-1].removesuffix('_id')}_users",
+        )
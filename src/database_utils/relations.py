@@ -0,0 +1,122 @@
+from enum import Enum
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database_utils.base_query import BaseQuery
+from src.database_utils.dependent_base_query import DependentBaseQuery
+
+
+class LinkRelation:
+    """
+    Rows of `query` linked to the requested ids through the link table of
+    `key_field`. Requested `nested` relations are loaded for all linked rows
+    at once and embedded into each of them
+    """
+
+    def __init__(
+        self,
+        query: BaseQuery,
+        relation_field,
+        key_field,
+        nested: dict[Enum, object] | None = None,
+    ) -> None:
+        self._query = query
+        self._relation_field = relation_field
+        self._key_field = key_field
+        self._nested = nested or {}
+
+    async def load(
+        self, value_list: list[int], session: AsyncSession, include: list[Enum] = ()
+    ) -> dict[int, list] | None:
+        related = await self._query.get_by_relation_list(
+            relation_field=self._relation_field,
+            key_field=self._key_field,
+            value_list=value_list,
+            session=session,
+        )
+        if related is None:
+            return None
+        nested_include = [relation for relation in include if relation in self._nested]
+        if len(nested_include) > 0:
+            related_id_list = list(
+                {schema.id for schemas in related.values() for schema in schemas}
+            )
+            nested = {}
+            for relation in nested_include:
+                nested[relation] = await self._nested[relation].load(
+                    value_list=related_id_list, session=session
+                )
+                if nested[relation] is None:
+                    return None
+            related = {
+                value: [
+                    {
+                        **schema.dict(),
+                        **{
+                            relation.value: nested_related[schema.id]
+                            for relation, nested_related in nested.items()
+                        },
+                    }
+                    for schema in schemas
+                ]
+                for value, schemas in related.items()
+            }
+        return {value: related.get(value, []) for value in value_list}
+
+
+class ThroughRelation:
+    """
+    Distinct rows of `relation` reached through every row of `through`,
+    e.g. the tags of all events of a tour
+    """
+
+    def __init__(self, through: LinkRelation, relation: LinkRelation) -> None:
+        self._through = through
+        self._relation = relation
+
+    async def load(
+        self, value_list: list[int], session: AsyncSession, include: list[Enum] = ()
+    ) -> dict[int, list] | None:
+        through = await self._through.load(value_list=value_list, session=session)
+        if through is None:
+            return None
+        related = await self._relation.load(
+            value_list=list(
+                {schema.id for schemas in through.values() for schema in schemas}
+            ),
+            session=session,
+        )
+        if related is None:
+            return None
+        return {
+            value: list(
+                {
+                    schema.id: schema
+                    for through_schema in through[value]
+                    for schema in related[through_schema.id]
+                }.values()
+            )
+            for value in value_list
+        }
+
+
+class CountRelation:
+    """
+    Number of `query` rows referencing each requested id by `dependency_field`
+    """
+
+    def __init__(self, query: DependentBaseQuery, dependency_field) -> None:
+        self._query = query
+        self._dependency_field = dependency_field
+
+    async def load(
+        self, value_list: list[int], session: AsyncSession, include: list[Enum] = ()
+    ) -> dict[int, int] | None:
+        counts = await self._query.count_by_dependency_list(
+            dependency_field=self._dependency_field,
+            value_list=value_list,
+            session=session,
+        )
+        if counts is None:
+            return None
+        return {value: counts.get(value, 0) for value in value_list}
@@ -0,0 +1,34 @@
+import re
+
+from sqlalchemy import Column, Computed, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
+
+SEARCH_CONFIG = "russian"
+SEARCH_VECTOR = "search_vector"
+
+
+def search_vector_expression(name: str = "name", description: str = "description"):
+    return (
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({name}, '')), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({description}, '')), 'B')"
+    )
+
+
+def search_vector_column():
+    return deferred(
+        Column(TSVECTOR, Computed(search_vector_expression(), persisted=True))
+    )
+
+
+def search_vector_index(table_name: str) -> Index:
+    return Index(
+        f"ix_{table_name}_{SEARCH_VECTOR}", SEARCH_VECTOR, postgresql_using="gin"
+    )
+
+
+def to_prefix_tsquery(text: str):
+    words = re.findall(r"\w+", text)
+    if len(words) == 0:
+        return None
+    return func.to_tsquery(SEARCH_CONFIG, " & ".join(f"{word}:*" for word in words))
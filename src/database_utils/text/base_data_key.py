@@ -1,11 +1,17 @@
 count = "count"
 schemas = "schemas"
 schema = "schema"
+missing = "missing"
+imported_count = "imported_count"
+import_errors = "import_errors"
 
 BASE_DATA_KEY = {
     "count": count,
     "schemas": schemas,
     "schema": schema,
+    "missing": missing,
+    "imported_count": imported_count,
+    "import_errors": import_errors,
 }
 
 
@@ -1,7 +1,11 @@
 wrong_id = "Указан не верный id"
+include_error = "Не удалось получить связанные данные"
+import_invalid_rows = "Файл содержит строки с ошибками, импорт отменён"
 
 BASE_DETAILS = {
     "wrong_id": wrong_id,
+    "include_error": include_error,
+    "import_invalid_rows": import_invalid_rows,
 }
 
 
@@ -1,6 +1,9 @@
 get_all_error = "Произошла ошибка при получении"
 get_all_success = "Успешное получение"
 
+search_error = "Произошла ошибка при поиске по запросу «{text}»"
+search_success = "Успешный поиск по запросу «{text}»"
+
 get_one_error = "Произошла ошибка при получении #{id}"
 get_one_success = "Успешное получение #{id}"
 
@@ -16,9 +19,14 @@ delete_success = "Успешное удаление #{id}"
 image_error = "Произошла ошибка при изменении изображения для #{id}"
 image_success = "Успешное изменение изображения для #{id}"
 
+import_error = "Произошла ошибка при импорте"
+import_success = "Успешно импортировано записей: {count}"
+
 BASE_MESSAGE = {
     "get_all_error": get_all_error,
     "get_all_success": get_all_success,
+    "search_error": search_error,
+    "search_success": search_success,
     "get_one_error": get_one_error,
     "get_one_success": get_one_success,
     "create_error": create_error,
@@ -29,6 +37,8 @@ BASE_MESSAGE = {
     "delete_success": delete_success,
     "image_error": image_error,
     "image_success": image_success,
+    "import_error": import_error,
+    "import_success": import_success,
 }
 
 
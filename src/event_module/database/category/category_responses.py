@@ -2,6 +2,7 @@ from loguru import logger
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.autocomplete.autocomplete_models import AutocompleteSource
 from src.database_utils.base_response_handler import BaseResponseHandler
 from src.event_module.database.category.category_models import CategoryModels
 from src.event_module.database.category.category_query import CategoryQuery
@@ -24,6 +25,7 @@ class CategoryResponseHandler(BaseResponseHandler):
     _schema_update_class: type = _models.update_class
     _schema_read_class: type = _models.read_class
     _model: type = _models.database_table
+    _autocomplete_source: AutocompleteSource = AutocompleteSource.CATEGORY
 
     async def delete(self, model_id: int, session: AsyncSession) -> Response:
         try:
@@ -37,6 +39,7 @@ class CategoryResponseHandler(BaseResponseHandler):
                 ]:
                     error = await self._query.delete(model_id=model_id, session=session)
                     if error is None:
+                        self._remove_autocomplete(model_id=model_id)
                         return return_json(
                             status=Status.SUCCESS,
                             message=self._message.get("delete_success").format(
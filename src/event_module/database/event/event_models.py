@@ -1,10 +1,19 @@
+from enum import Enum
+
 from src.database_utils.base_models import BaseModels
 from src.event_module.models import Event
-from src.event_module.schemas import EventCreate, EventRead, EventUpdate
+from src.event_module.schemas import EventCreate, EventImport, EventRead, EventUpdate
+
+
+class EventInclude(Enum):
+    TAGS = "tags"
+    UNIVERSITIES = "universities"
+    REGISTRATIONS_COUNT = "registrations_count"
 
 
 class EventModels(BaseModels):
     create_class: type = EventCreate
     update_class: type = EventUpdate
     read_class: type = EventRead
+    import_class: type = EventImport
     database_table: type = Event
@@ -1,17 +1,18 @@
-import json
+from datetime import datetime
 
 from loguru import logger
 from sqlalchemy import insert, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.address_schema import Address
+from src.address_schema import convert_address
 from src.database_utils.base_query import BaseQuery
 from src.event_module.database.event.event_models import EventModels
 from src.event_module.models import Event, EventTag
 from src.event_module.schemas import EventRead
 from src.tour_module.models import TourEvent
 from src.university_module.models import UniversityEvent
+from src.utils import SortOrder
 
 
 class EventQuery(BaseQuery):
@@ -29,13 +30,22 @@ class EventQuery(BaseQuery):
         tour_id: int | None,
         university_id: int | None,
         session: AsyncSession,
-    ) -> list[_schema_read_class] | None:
+        fields: list[str] | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        registration_open: bool | None = None,
+        date_sort: SortOrder | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        radius_km: float | None = None,
+        city: str | None = None,
+        country: str | None = None,
+    ) -> list[_schema_read_class | dict] | None:
         try:
-            statement = select(self._model)
+            statement = self._select(fields=fields)
 
             if category_list is not None:
-                for category_id in category_list:
-                    statement = statement.filter(self._model.category_id == category_id)
+                statement = statement.filter(self._model.category_id.in_(category_list))
             if tag_id is not None:
                 statement = statement.join(
                     EventTag, EventTag.event_id == self._model.id
@@ -48,10 +58,28 @@ class EventQuery(BaseQuery):
                 statement = statement.join(
                     UniversityEvent, UniversityEvent.event_id == self._model.id
                 ).filter(UniversityEvent.university_id == university_id)
+            statement = self._filter_by_dates(
+                statement=statement,
+                date_from=date_from,
+                date_to=date_to,
+                registration_open=registration_open,
+                date_sort=date_sort,
+            )
+            statement = self._filter_by_location(
+                statement=statement,
+                latitude=latitude,
+                longitude=longitude,
+                radius_km=radius_km,
+            )
+            statement = self._filter_by_address(
+                statement=statement, city=city, country=country
+            )
 
             event_rows = await session.execute(statement)
 
-            return self._convert_models_to_schema_list(models=event_rows.all())
+            return self._convert_models_to_schema_list(
+                models=event_rows.all(), fields=fields
+            )
 
         except Exception as e:
             logger.error(str(e))
@@ -63,16 +91,14 @@ class EventQuery(BaseQuery):
         try:
             model_create.fix_time()
 
-            await session.execute(insert(self._model).values(**model_create.dict()))
+            await session.execute(
+                insert(self._model).values(**self._get_values(schema=model_create))
+            )
             await session.commit()
         except IntegrityError as e:
             return e
 
     def _convert_model_to_schema(self, model: _model) -> _schema_read_class | None:
-        if type(model[0].address) is str:
-            address = Address(**json.loads(model[0].address))
-        else:
-            address = model[0].address
         schema = self._schema_read_class(
             id=model[0].id,
             name=model[0].name,
@@ -82,8 +108,9 @@ class EventQuery(BaseQuery):
             reg_deadline=model[0].reg_deadline,
             max_users=model[0].max_users,
             category_id=model[0].category_id,
-            address=address,
+            address=convert_address(address=model[0].address),
             image=model[0].image,
+            registered_count=model[0].registered_count,
         )
         return schema
 
@@ -94,7 +121,7 @@ class EventQuery(BaseQuery):
             model_update.fix_time()
             await session.execute(
                 update(self._model)
-                .values(**model_update.dict())
+                .values(**self._get_values(schema=model_update))
                 .where(self._model.id == model_update.id)
             )
             await session.commit()
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from fastapi import UploadFile
 from loguru import logger
 from sqlalchemy.exc import IntegrityError
@@ -5,27 +7,33 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database_utils.base_query import BaseQuery
 from src.database_utils.cascade_base_response_handler import CascadeBaseResponseHandler
-from src.event_module.database.event.event_models import EventModels
+from src.database_utils.relations import CountRelation, LinkRelation
+from src.event_module.database.category.category_query import CategoryQuery
+from src.event_module.database.event.event_models import EventInclude, EventModels
 from src.event_module.database.event.event_query import EventQuery
 from src.event_module.database.event.text.event_data_key import EventDataKey
 from src.event_module.database.event.text.event_details import EventDetails
 from src.event_module.database.event.text.event_message import EventMessage
 from src.event_module.database.event_tag.event_tag_models import EventTagFilter
 from src.event_module.database.event_tag.event_tag_query import EventTagQuery
+from src.event_module.database.tag.tag_query import TagQuery
+from src.event_module.schemas import EventTagCreate
 from src.google_drive.directories import Directory
 from src.instruments import image_handler
 from src.schemas import Response
 from src.tour_module.database.tour_event.tour_event_models import TourEventFilter
 from src.tour_module.database.tour_event.tour_event_query import TourEventQuery
+from src.university_module.database.university.university_query import UniversityQuery
 from src.university_module.database.university_event.university_event_models import (
     UniversityEventFilter,
 )
 from src.university_module.database.university_event.university_event_query import (
     UniversityEventQuery,
 )
+from src.university_module.schemas import UniversityEventCreate
 from src.user_module.database.user_event.user_event_models import UserEventFilter
 from src.user_module.database.user_event.user_event_query import UserEventQuery
-from src.utils import Status, return_json
+from src.utils import SortOrder, Status, return_json
 
 
 class EventResponseHandler(CascadeBaseResponseHandler):
@@ -48,9 +56,86 @@ class EventResponseHandler(CascadeBaseResponseHandler):
     _schema_update_class: type = _models.update_class
     _schema_read_class: type = _models.read_class
     _model: type = _models.database_table
+    _import_schema_class: type = _models.import_class
 
     _google_directory: Directory = Directory.EVENT
 
+    _relations: dict[EventInclude, object] = {
+        EventInclude.TAGS: LinkRelation(
+            query=TagQuery(),
+            relation_field=EventTagQuery.dependency_fields[EventTagFilter.TAG],
+            key_field=EventTagQuery.dependency_fields[EventTagFilter.EVENT],
+        ),
+        EventInclude.UNIVERSITIES: LinkRelation(
+            query=UniversityQuery(),
+            relation_field=UniversityEventQuery.dependency_fields[
+                UniversityEventFilter.UNIVERSITY
+            ],
+            key_field=UniversityEventQuery.dependency_fields[
+                UniversityEventFilter.EVENT
+            ],
+        ),
+        EventInclude.REGISTRATIONS_COUNT: CountRelation(
+            query=UserEventQuery(),
+            dependency_field=UserEventQuery.dependency_fields[UserEventFilter.EVENT],
+        ),
+    }
+
+    _tag_query: TagQuery = TagQuery()
+    _category_query: CategoryQuery = CategoryQuery()
+    _event_tag_query: EventTagQuery = EventTagQuery()
+    _university_event_query: UniversityEventQuery = UniversityEventQuery()
+
+    async def _check_import(
+        self, schemas: list, session: AsyncSession
+    ) -> list[list[str]]:
+        category_id_set = await self._category_query.get_existing_ids(
+            model_id_list=list({schema.category_id for schema in schemas}),
+            session=session,
+        )
+        tag_id_set = await self._tag_query.get_existing_ids(
+            model_id_list=list(
+                {tag_id for schema in schemas for tag_id in schema.tag_id_list}
+            ),
+            session=session,
+        )
+        error_list = []
+        for schema in schemas:
+            errors = []
+            if schema.category_id not in category_id_set:
+                errors.append(self._details.get("wrong_category_id"))
+            if any(tag_id not in tag_id_set for tag_id in schema.tag_id_list):
+                errors.append(self._details.get("wrong_tag_id"))
+            error_list.append(errors)
+        return error_list
+
+    async def _link_import(
+        self,
+        id_list: list[int],
+        schemas: list,
+        university_id: int | None,
+        session: AsyncSession,
+    ) -> None:
+        event_tag_list = [
+            EventTagCreate(event_id=event_id, tag_id=tag_id)
+            for event_id, schema in zip(id_list, schemas)
+            for tag_id in dict.fromkeys(schema.tag_id_list)
+        ]
+        if len(event_tag_list) > 0:
+            await self._event_tag_query.create_many(
+                model_create_list=event_tag_list, session=session
+            )
+        if university_id is not None:
+            await self._university_event_query.create_many(
+                model_create_list=[
+                    UniversityEventCreate(
+                        university_id=university_id, event_id=event_id
+                    )
+                    for event_id in id_list
+                ],
+                session=session,
+            )
+
     async def get_by_filter(
         self,
         category_list: list[int] | None,
@@ -58,6 +143,17 @@ class EventResponseHandler(CascadeBaseResponseHandler):
         tour_id: int | None,
         university_id: int | None,
         session: AsyncSession,
+        fields: list[str] | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        registration_open: bool | None = None,
+        date_sort: SortOrder | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        radius_km: float | None = None,
+        city: str | None = None,
+        country: str | None = None,
+        include: list[EventInclude] | None = None,
     ) -> Response:
         try:
             schemas = await self._query.get_by_filter_query(
@@ -66,8 +162,22 @@ class EventResponseHandler(CascadeBaseResponseHandler):
                 tour_id=tour_id,
                 university_id=university_id,
                 session=session,
+                fields=fields,
+                date_from=date_from,
+                date_to=date_to,
+                registration_open=registration_open,
+                date_sort=date_sort,
+                latitude=latitude,
+                longitude=longitude,
+                radius_km=radius_km,
+                city=city,
+                country=country,
             )
             if schemas is not None:
+                if include:
+                    schemas = await self.include_relations(
+                        schemas=schemas, include=include, session=session
+                    )
                 data = {
                     self._data_key.get("count"): len(schemas),
                     self._data_key.get("schemas"): schemas,
@@ -87,9 +197,11 @@ class EventResponseHandler(CascadeBaseResponseHandler):
                 details=str(e),
             )
 
-    async def get_all(self, session: AsyncSession) -> Response:
+    async def get_all(
+        self, session: AsyncSession, fields: list[str] | None = None
+    ) -> Response:
         try:
-            schemas = await self._query.get_all(session=session)
+            schemas = await self._query.get_all(session=session, fields=fields)
             if schemas is not None:
                 data = {
                     self._data_key.get("count"): len(schemas),
@@ -110,31 +222,6 @@ class EventResponseHandler(CascadeBaseResponseHandler):
                 details=str(e),
             )
 
-    async def get_by_id_list(
-        self, model_id_list: list[int], session: AsyncSession
-    ) -> Response:
-        try:
-            schemas = [
-                await self._query.get_by_id(model_id=model_id, session=session)
-                for model_id in model_id_list
-            ]
-            if len(schemas) is not None:
-                data = {self._data_key.get("schemas"): schemas}
-                return return_json(
-                    status=Status.SUCCESS,
-                    message=self._message.get("get_all_success"),
-                    data=data,
-                )
-            else:
-                raise Exception()
-        except Exception as e:
-            logger.error(str(e))
-            return return_json(
-                status=Status.ERROR,
-                message=self._message.get("get_all_error"),
-                details=str(e),
-            )
-
     @logger.catch
     async def create(
         self, model_create: _schema_create_class, session: AsyncSession
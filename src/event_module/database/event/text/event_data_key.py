@@ -3,11 +3,17 @@ from src.database_utils.text.base_data_key import BaseDataKey
 count = "events_count"
 schemas = "events"
 schema = "event"
+missing = "missing_events"
+imported_count = "imported_events_count"
+import_errors = "import_errors"
 
 EVENT_DATA_KEY = {
     "count": count,
     "schemas": schemas,
     "schema": schema,
+    "missing": missing,
+    "imported_count": imported_count,
+    "import_errors": import_errors,
 }
 
 
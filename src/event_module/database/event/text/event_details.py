@@ -2,10 +2,16 @@ from src.database_utils.text.base_details import BaseDetails
 
 wrong_id = "Указан не верный id мероприятия"
 wrong_category_id = "Указан не верный id категории"
+include_error = "Не удалось получить связанные данные мероприятий"
+import_invalid_rows = "Файл содержит строки с ошибками, импорт отменён"
+wrong_tag_id = "Указан не верный id тега"
 
 EVENT_DETAILS = {
     "wrong_id": wrong_id,
     "wrong_category_id": wrong_category_id,
+    "include_error": include_error,
+    "import_invalid_rows": import_invalid_rows,
+    "wrong_tag_id": wrong_tag_id,
 }
 
 
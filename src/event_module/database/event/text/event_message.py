@@ -3,6 +3,9 @@ from src.database_utils.text.base_message import BaseMessage
 get_all_error = "Произошла ошибка при получении мероприятий"
 get_all_success = "Успешное получение мероприятий"
 
+search_error = "Произошла ошибка при поиске мероприятий по запросу «{text}»"
+search_success = "Успешный поиск мероприятий по запросу «{text}»"
+
 get_by_category_error = (
     "Произошла ошибка при получении мероприятий по category_id #{id}"
 )
@@ -23,9 +26,14 @@ delete_success = "Успешное удаление мероприятия #{id}
 image_error = "Произошла ошибка при изменении изображения для мероприятия #{id}"
 image_success = "Успешное изменение изображения для мероприятия #{id}"
 
+import_error = "Произошла ошибка при импорте мероприятий"
+import_success = "Успешно импортировано мероприятий: {count}"
+
 EVENT_MESSAGE = {
     "get_all_error": get_all_error,
     "get_all_success": get_all_success,
+    "search_error": search_error,
+    "search_success": search_success,
     "get_by_category_error": get_by_category_error,
     "get_by_category_success": get_by_category_success,
     "get_one_error": get_one_error,
@@ -38,6 +46,8 @@ EVENT_MESSAGE = {
     "delete_success": delete_success,
     "image_error": image_error,
     "image_success": image_success,
+    "import_error": import_error,
+    "import_success": import_success,
 }
 
 
@@ -1,6 +1,7 @@
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.autocomplete.autocomplete_models import AutocompleteSource
 from src.database_utils.cascade_base_response_handler import CascadeBaseResponseHandler
 from src.event_module.database.event_tag.event_tag_models import EventTagFilter
 from src.event_module.database.event_tag.event_tag_query import EventTagQuery
@@ -28,6 +29,7 @@ class TagResponseHandler(CascadeBaseResponseHandler):
     _schema_update_class: type = _models.update_class
     _schema_read_class: type = _models.read_class
     _model: type = _models.database_table
+    _autocomplete_source: AutocompleteSource = AutocompleteSource.TAG
 
     async def get_by_filter(
         self,
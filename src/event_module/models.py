@@ -1,8 +1,21 @@
 from datetime import datetime
 
-from sqlalchemy import JSON, TIMESTAMP, Column, ForeignKey, Integer, String
+from sqlalchemy import (
+    TIMESTAMP,
+    Column,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 
 from src.database import Base, metadata
+from src.database_utils.name_changes import notify_name_changes
+from src.database_utils.search_vector import search_vector_column, search_vector_index
 
 
 class Category(Base):
@@ -12,19 +25,37 @@ class Category(Base):
     name = Column(String, nullable=False)
 
 
+notify_name_changes(table=Category.__table__)
+
+
 class Event(Base):
     __tablename__ = "event"
     id = Column(Integer, primary_key=True)
     metadata = metadata
     name = Column(String, nullable=False)
     description = Column(String, nullable=False)
-    date_start = Column(TIMESTAMP, default=datetime.utcnow)
+    date_start = Column(TIMESTAMP, default=datetime.utcnow, index=True)
     date_end = Column(TIMESTAMP, default=datetime.utcnow)
-    reg_deadline = Column(TIMESTAMP, default=datetime.utcnow)
+    reg_deadline = Column(TIMESTAMP, default=datetime.utcnow, index=True)
     max_users = Column(Integer, nullable=True)
+    registered_count = Column(Integer, nullable=False, default=0, server_default="0")
     category_id = Column(Integer, ForeignKey(Category.id), nullable=False)
-    address = Column(JSON, nullable=True)
+    address = Column(JSONB, nullable=True)
     image = Column(String, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    search_vector = search_vector_column()
+
+    __table_args__ = (
+        search_vector_index(table_name="event"),
+        Index(
+            "ix_event_location",
+            func.point(longitude, latitude),
+            postgresql_using="gist",
+        ),
+        Index("ix_event_address_city", func.lower(address["city"].astext)),
+        Index("ix_event_address_country", func.lower(address["country"].astext)),
+    )
 
 
 class Tag(Base):
@@ -34,9 +65,17 @@ class Tag(Base):
     name = Column(String, nullable=False)
 
 
+notify_name_changes(table=Tag.__table__)
+
+
 class EventTag(Base):
     __tablename__ = "event_tag"
     id = Column(Integer, primary_key=True)
     metadata = metadata
     event_id = Column(Integer, ForeignKey(Event.id), nullable=False)
     tag_id = Column(Integer, ForeignKey(Tag.id), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("event_id", "tag_id", name="uq_event_tag_event_id_tag_id"),
+        Index("ix_event_tag_tag_id", "tag_id"),
+    )
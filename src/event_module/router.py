@@ -1,12 +1,17 @@
+from datetime import datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_async_session
+from src.database_utils.bulk_import import ImportFormat
+from src.database_utils.export import ExportFormat
 from src.event_module.database.category.category_responses import (
     CategoryResponseHandler,
 )
+from src.event_module.database.event.event_models import EventInclude
 from src.event_module.database.event.event_responses import EventResponseHandler
 from src.event_module.database.event_tag.event_tag_responses import (
     EventTagResponseHandler,
@@ -27,9 +32,10 @@ from src.schemas import Response
 from src.tour_module.database.tour_event.tour_event_responses import (
     TourEventResponseHandler,
 )
+from src.university_module.utils import check_user_university
 from src.user_module.database.user_event.user_event_models import UserEventFilter
 from src.user_module.router import user_event_response_handler
-from src.utils import Role, access_denied, role_access
+from src.utils import Role, SortOrder, access_denied, check_location, role_access
 
 event_router = APIRouter(prefix="/event", tags=["event"])
 category_router = APIRouter(prefix="/category", tags=["category"])
@@ -48,22 +54,72 @@ async def get_events(
     tag_id: Annotated[int | None, Query()] = None,
     tour_id: Annotated[int | None, Query()] = None,
     university_id: Annotated[int | None, Query()] = None,
+    date_from: Annotated[datetime | None, Query()] = None,
+    date_to: Annotated[datetime | None, Query()] = None,
+    registration_open: Annotated[bool | None, Query()] = None,
+    date_sort: Annotated[SortOrder | None, Query()] = None,
+    latitude: Annotated[float | None, Query(ge=-90, le=90)] = None,
+    longitude: Annotated[float | None, Query(ge=-180, le=180)] = None,
+    radius_km: Annotated[float | None, Query(gt=0)] = None,
+    city: Annotated[str | None, Query()] = None,
+    country: Annotated[str | None, Query()] = None,
+    fields: Annotated[list[str] | None, Query()] = None,
+    include: Annotated[list[EventInclude] | None, Query()] = None,
     session: AsyncSession = Depends(get_async_session),
 ) -> Response:
+    check_location(latitude=latitude, longitude=longitude, radius_km=radius_km)
     return await event_response_handler.get_by_filter(
         category_list=category_list,
         tag_id=tag_id,
         tour_id=tour_id,
         university_id=university_id,
         session=session,
+        fields=fields,
+        date_from=date_from,
+        date_to=date_to,
+        registration_open=registration_open,
+        date_sort=date_sort,
+        latitude=latitude,
+        longitude=longitude,
+        radius_km=radius_km,
+        city=city,
+        country=country,
+        include=include,
+    )
+
+
+@event_router.get("/batch", response_model=Response)
+async def get_events_by_ids(
+    ids: Annotated[list[int], Query()],
+    fields: Annotated[list[str] | None, Query()] = None,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    return await event_response_handler.get_by_id_list(
+        model_id_list=ids, session=session, fields=fields
+    )
+
+
+@event_router.get("/search", response_model=Response)
+async def search_events(
+    q: Annotated[str, Query(min_length=1)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    fields: Annotated[list[str] | None, Query()] = None,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    return await event_response_handler.search(
+        text=q, session=session, limit=limit, fields=fields
     )
 
 
 @event_router.get("/{event_id}", response_model=Response)
 async def get_event_by_id(
-    event_id: int, session: AsyncSession = Depends(get_async_session)
+    event_id: int,
+    include: Annotated[list[EventInclude] | None, Query()] = None,
+    session: AsyncSession = Depends(get_async_session),
 ) -> Response:
-    return await event_response_handler.get_by_id(model_id=event_id, session=session)
+    return await event_response_handler.get_by_id(
+        model_id=event_id, session=session, include=include
+    )
 
 
 @event_router.post("/", response_model=Response)
@@ -78,6 +134,39 @@ async def create_event(
         return access_denied()
 
 
+@event_router.post("/import", response_model=Response)
+async def import_events(
+    file: UploadFile,
+    import_format: ImportFormat = ImportFormat.CSV,
+    university_id: Annotated[int | None, Query()] = None,
+    skip_invalid: bool = False,
+    user_id: Annotated[int | None, Query()] = None,
+    user_role: Annotated[Role, Query()] = Role.GUEST,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    if role_access[user_role] == role_access[Role.ADMIN]:
+        return await event_response_handler.import_file(
+            file=file.file,
+            import_format=import_format,
+            session=session,
+            university_id=university_id,
+            skip_invalid=skip_invalid,
+        )
+    elif role_access[user_role] == role_access[Role.UNIVERSITY] and user_id is not None:
+        if university_id is not None and await check_user_university(
+            user_id=user_id, university_id=university_id, session=session
+        ):
+            return await event_response_handler.import_file(
+                file=file.file,
+                import_format=import_format,
+                session=session,
+                university_id=university_id,
+                skip_invalid=skip_invalid,
+            )
+
+    return access_denied()
+
+
 @event_router.post("/image", response_model=Response)
 async def update_image(
     image: UploadFile,
@@ -334,3 +423,26 @@ async def get_users_by_event(
             )
 
     return access_denied()
+
+
+@event_router.get("/{event_id}/user/export", response_model=None)
+async def export_users_by_event(
+    user_role: Role,
+    event_id: int,
+    export_format: ExportFormat = ExportFormat.CSV,
+    user_id: Annotated[int | None, Query()] = None,
+    session: AsyncSession = Depends(get_async_session),
+) -> StreamingResponse | Response:
+    if role_access[user_role] == role_access[Role.ADMIN]:
+        return user_event_response_handler.export_by_target(
+            target_id=event_id, export_format=export_format, session=session
+        )
+    elif role_access[user_role] == role_access[Role.UNIVERSITY] and user_id is not None:
+        if await check_university_event(
+            user_id=user_id, event_id=event_id, session=session
+        ):
+            return user_event_response_handler.export_by_target(
+                target_id=event_id, export_format=export_format, session=session
+            )
+
+    return access_denied()
@@ -25,6 +25,10 @@ class EventCreate(BaseModel):
         self.reg_deadline = self.reg_deadline.replace(tzinfo=None)
 
 
+class EventImport(EventCreate):
+    tag_id_list: list[int] = []
+
+
 class EventRead(BaseIDModel):
     name: str
     description: str
@@ -35,6 +39,7 @@ class EventRead(BaseIDModel):
     category_id: int
     address: Address
     image: str | None
+    registered_count: int = 0
 
 
 class EventUpdate(BaseIDModel):
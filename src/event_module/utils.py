@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.monitoring.tracing import traced
 from src.university_module.database.university_event.text.university_event_data_key import (
     UniversityEventDataKey,
 )
@@ -17,25 +18,29 @@ from src.user_module.database.user_university.user_university_responses import (
 )
 
 
-async def check_university_event(user_id: int, event_id: int, session: AsyncSession):
-    university_id = (
-        (
-            await UserUniversityResponseHandler().get_by_filter(
-                user_university_filter=UserUniversityFilter.USER,
-                value=user_id,
-                session=session,
-            )
+@traced(name="get_university_event_ids", layer="router")
+async def get_university_event_ids(user_id: int, session: AsyncSession) -> set[int]:
+    user_university_list = (
+        await UserUniversityResponseHandler().get_by_filter(
+            user_university_filter=UserUniversityFilter.USER,
+            value=user_id,
+            session=session,
         )
-        .data[UserUniversityDataKey().get(key="schema")]
-        .university_id
-    )
-    events = (
-        (
-            await UniversityEventResponseHandler().get_by_filter(
-                value=university_id, session=session
+    ).data[UserUniversityDataKey().get(key="schema")]
+    event_id_set = set()
+    for user_university in user_university_list:
+        event_id_set.update(
+            (
+                await UniversityEventResponseHandler().get_by_filter(
+                    value=user_university.university_id, session=session
+                )
             )
+            .data[UniversityEventDataKey().get(key="schemas")]
+            .event_id_list
         )
-        .data[UniversityEventDataKey().get(key="schemas")]
-        .event_id_list
-    )
-    return event_id in events
+    return event_id_set
+
+
+@traced(name="check_university_event", layer="router")
+async def check_university_event(user_id: int, event_id: int, session: AsyncSession):
+    return event_id in await get_university_event_ids(user_id=user_id, session=session)
@@ -5,6 +5,7 @@ from pydrive.auth import GoogleAuth
 from pydrive.drive import GoogleDrive
 
 from src.google_drive.directories import Directory, directory_id
+from src.monitoring.metrics import observe_storage_call
 from src.schemas import Response
 from src.utils import Status, return_json
 
@@ -14,6 +15,7 @@ class Driver:
         self.google_auth: GoogleAuth = GoogleAuth()
         self.google_auth.LocalWebserverAuth()
 
+    @observe_storage_call(operation="upload_file")
     def upload_file(
         self, filename: str, directory: Directory, temp_directory: str = "temp"
     ) -> Response:
@@ -41,6 +43,7 @@ class Driver:
         except Exception as _ex:
             return return_json(status=Status.ERROR, details=str(_ex))
 
+    @observe_storage_call(operation="delete_file")
     def delete_file(self, filename: str, directory: Directory) -> Response:
         try:
             drive = GoogleDrive(self.google_auth)
@@ -58,6 +61,7 @@ class Driver:
         except Exception as _ex:
             return return_json(status=Status.ERROR, details=str(_ex))
 
+    @observe_storage_call(operation="delete_file_by_id")
     def delete_file_by_id(self, file_id: str, directory: Directory) -> Response:
         try:
             drive = GoogleDrive(self.google_auth)
@@ -1,3 +1,17 @@
+from src.autocomplete.autocomplete_index import AutocompleteIndex
+from src.autocomplete.autocomplete_models import AutocompleteSource
+from src.config import AUTOCOMPLETE_TTL
+from src.event_module.database.category.category_query import CategoryQuery
+from src.event_module.database.tag.tag_query import TagQuery
 from src.google_drive.image_handler import ImageHandler
+from src.university_module.database.university.university_query import UniversityQuery
 
 image_handler = ImageHandler()
+autocomplete_index = AutocompleteIndex(
+    queries={
+        AutocompleteSource.TAG: TagQuery(),
+        AutocompleteSource.CATEGORY: CategoryQuery(),
+        AutocompleteSource.UNIVERSITY: UniversityQuery(),
+    },
+    ttl=AUTOCOMPLETE_TTL,
+)
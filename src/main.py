@@ -1,17 +1,33 @@
-import time
+import asyncio
+from contextlib import suppress
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 from starlette.middleware.cors import CORSMiddleware
 from starlette.responses import JSONResponse
 
-from src.config import ALLOWED_HOSTS, ORIGINS
+from src.autocomplete.autocomplete_listener import run_autocomplete_listener
+from src.autocomplete.router import autocomplete_router
+from src.config import (
+    ALLOWED_HOSTS,
+    AUTOCOMPLETE_LISTEN_RETRY_INTERVAL,
+    ORIGINS,
+    REGISTRATION_RECONCILE_INTERVAL,
+)
+from src.database import async_session_maker, engine, get_async_session
+from src.database_utils.migrations import is_migrated
 from src.event_module.router import category_router, event_router, tag_router
 from src.google_drive.router import image_router
+from src.instruments import autocomplete_index
+from src.monitoring.middleware import RequestMonitoringMiddleware
+from src.monitoring.router import monitoring_router
 from src.tour_module.router import tour_router
 from src.university_module.router import university_router
 from src.user_module.router import user_router
-from src.utils import access_denied
+from src.user_module.utils import run_registration_reconciler
+from src.utils import Status, access_denied, return_json
 
 app = FastAPI(title="Education Tourism")
 
@@ -37,11 +53,91 @@ ROUTERS_V1 = [
     university_router,
     user_router,
     image_router,
+    autocomplete_router,
 ]
 
 for router in ROUTERS_V1:
     app.include_router(router, prefix="/api/v1")
 
+app.include_router(monitoring_router)
+
+app.add_middleware(RequestMonitoringMiddleware)
+
+
+@app.get("/health/live", include_in_schema=False)
+async def check_liveness():
+    return return_json(status=Status.SUCCESS, message="Сервис работает")
+
+
+@app.get("/health/ready", include_in_schema=False)
+async def check_readiness(session: AsyncSession = Depends(get_async_session)):
+    try:
+        ready = await is_migrated(connection=await session.connection())
+        details = None if ready else "База данных не обновлена до последней миграции"
+    except Exception as e:
+        logger.warning(str(e))
+        ready = False
+        details = "База данных недоступна"
+    if ready:
+        return return_json(status=Status.SUCCESS, message="Сервис готов")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=return_json(
+            status=Status.ERROR, message="Сервис не готов", details=details
+        ).dict(),
+    )
+
+
+@app.on_event("startup")
+async def build_autocomplete_index():
+    try:
+        async with async_session_maker() as session:
+            await autocomplete_index.refresh_all(session=session)
+    except Exception as e:
+        logger.warning(str(e))
+
+
+@app.on_event("startup")
+async def start_autocomplete_listener():
+    app.state.autocomplete_listener = asyncio.create_task(
+        run_autocomplete_listener(
+            engine=engine,
+            index=autocomplete_index,
+            retry_interval=AUTOCOMPLETE_LISTEN_RETRY_INTERVAL,
+        )
+    )
+
+
+@app.on_event("startup")
+async def start_registration_reconciler():
+    if REGISTRATION_RECONCILE_INTERVAL > 0:
+        app.state.registration_reconciler = asyncio.create_task(
+            run_registration_reconciler(interval=REGISTRATION_RECONCILE_INTERVAL)
+        )
+
+
+@app.on_event("shutdown")
+async def stop_registration_reconciler():
+    reconciler = getattr(app.state, "registration_reconciler", None)
+    if reconciler is not None:
+        reconciler.cancel()
+        with suppress(asyncio.CancelledError):
+            await reconciler
+
+
+@app.on_event("shutdown")
+async def stop_autocomplete_listener():
+    listener = getattr(app.state, "autocomplete_listener", None)
+    if listener is not None:
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
+
+
+@app.on_event("shutdown")
+async def flush_logs():
+    await logger.complete()
+
 
 # @app.middleware("http")
 # async def add_allow_hosts(request: Request, call_next):
@@ -0,0 +1,51 @@
+import threading
+import time
+
+
+class LogSampler:
+    """
+    Loguru filter that lets through at most `limit` identical warnings or
+    errors per `window` seconds. The first record after a window reports how
+    many copies were dropped in extra["suppressed"].
+    """
+
+    max_keys = 10000
+
+    def __init__(self, window: float, limit: int, min_level: int = 30) -> None:
+        self._window = window
+        self._limit = limit
+        self._min_level = min_level
+        self._lock = threading.Lock()
+        self._counters: dict[tuple, list] = {}
+
+    def __call__(self, record: dict) -> bool:
+        if record["level"].no < self._min_level or self._limit <= 0:
+            return True
+        key = (
+            record["name"],
+            record["function"],
+            record["line"],
+            record["message"],
+        )
+        now = time.monotonic()
+        with self._lock:
+            if len(self._counters) > self.max_keys:
+                self._prune(now=now)
+            window_start, count, suppressed = self._counters.get(key, (now, 0, 0))
+            if now - window_start >= self._window:
+                window_start, count = now, 0
+            count += 1
+            if count > self._limit:
+                self._counters[key] = [window_start, count, suppressed + 1]
+                return False
+            self._counters[key] = [window_start, count, 0]
+        if suppressed > 0:
+            record["extra"]["suppressed"] = suppressed
+        return True
+
+    def _prune(self, now: float) -> None:
+        self._counters = {
+            key: counter
+            for key, counter in self._counters.items()
+            if now - counter[0] < self._window
+        }
@@ -0,0 +1,147 @@
+import inspect
+import os
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Match
+
+from src.monitoring.tracing import start_span
+
+UNMATCHED_ROUTE = "unmatched"
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+DB_CONNECTIONS_IN_USE = Gauge(
+    "db_connections_in_use",
+    "Database connections checked out from the pool",
+    multiprocess_mode="livesum",
+)
+DB_QUERY_LATENCY = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement latency by BaseQuery method",
+    ["method"],
+)
+STORAGE_CALL_LATENCY = Histogram(
+    "storage_call_duration_seconds",
+    "Storage backend call latency",
+    ["operation", "status"],
+)
+
+_query_method: ContextVar[str] = ContextVar("query_method", default="unknown")
+
+
+def _with_query_method(function: Callable, name: str) -> Callable:
+    @wraps(function)
+    async def wrapper(self, *args, **kwargs):
+        label = f"{type(self).__name__}.{name}"
+        token = _query_method.set(label)
+        try:
+            with start_span(name=label, layer="query"):
+                return await function(self, *args, **kwargs)
+        finally:
+            _query_method.reset(token)
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+def instrument_query_methods(cls: type) -> None:
+    for name, attribute in list(vars(cls).items()):
+        if (
+            name.startswith("_")
+            or not inspect.iscoroutinefunction(attribute)
+            or getattr(attribute, "__instrumented__", False)
+        ):
+            continue
+        setattr(cls, name, _with_query_method(function=attribute, name=name))
+
+
+def observe_storage_call(operation: str) -> Callable:
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            status = "exception"
+            try:
+                with start_span(name=operation, layer="storage") as span:
+                    result = function(*args, **kwargs)
+                    status = getattr(result, "status", "unknown")
+                    span.attributes["status"] = status
+                    return result
+            finally:
+                STORAGE_CALL_LATENCY.labels(operation=operation, status=status).observe(
+                    time.perf_counter() - start
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context.metrics_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    DB_QUERY_LATENCY.labels(method=_query_method.get()).observe(
+        time.perf_counter() - context.metrics_start_time
+    )
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    DB_CONNECTIONS_IN_USE.inc()
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    DB_CONNECTIONS_IN_USE.dec()
+
+
+def install_metrics(engine: Engine) -> None:
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "checkout", _on_checkout)
+        event.listen(engine, "checkin", _on_checkin)
+
+
+def get_route_template(request: Request) -> str:
+    for route in request.app.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return route.path
+    return UNMATCHED_ROUTE
+
+
+def render_metrics() -> Response:
+    registry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(
+        content=generate_latest(registry),
+        headers={"Content-Type": CONTENT_TYPE_LATEST},
+    )
@@ -0,0 +1,87 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import DEBUG
+from src.database_utils.query_counter import start_query_stats
+from src.monitoring.metrics import (
+    REQUEST_LATENCY,
+    REQUESTS_IN_PROGRESS,
+    get_route_template,
+)
+from src.monitoring.slow_requests import slow_request_log
+from src.monitoring.tracing import (
+    TRACE_ID_HEADER,
+    TRACEPARENT_HEADER,
+    TRACEPARENT_PATTERN,
+    start_span,
+)
+
+
+class RequestMonitoringMiddleware:
+    """
+    Counts queries, records latency and traces a request until the last
+    `http.response.body` is sent, so queries run while a streaming response
+    is being sent are accounted to the request
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        method = request.method
+        route = get_route_template(request=request)
+        trace_id = parent_id = None
+        match = TRACEPARENT_PATTERN.match(request.headers.get(TRACEPARENT_HEADER, ""))
+        if match is not None:
+            trace_id, parent_id = match.groups()
+
+        query_stats = start_query_stats()
+        status_code = 500
+        REQUESTS_IN_PROGRESS.labels(method=method).inc()
+        start = time.perf_counter()
+        with start_span(
+            name=f"{method} {request.url.path}",
+            layer="router",
+            trace_id=trace_id,
+            parent_id=parent_id,
+        ) as span:
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    headers = MutableHeaders(scope=message)
+                    headers[TRACE_ID_HEADER] = span.trace_id
+                    headers[
+                        TRACEPARENT_HEADER
+                    ] = f"00-{span.trace_id}-{span.span_id}-01"
+                    if DEBUG:
+                        headers.update(query_stats.get_headers())
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                duration = time.perf_counter() - start
+                span.attributes["status_code"] = status_code
+                if status_code >= 500:
+                    span.status = "error"
+                REQUESTS_IN_PROGRESS.labels(method=method).dec()
+                REQUEST_LATENCY.labels(
+                    method=method, route=route, status=status_code
+                ).observe(duration)
+                slow_request_log.observe(
+                    method=method,
+                    route=route,
+                    duration=duration,
+                    query_stats=query_stats,
+                )
+                query_stats.log(request=f"{method} {request.url.path}")
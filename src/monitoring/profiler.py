@@ -0,0 +1,82 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from src.config import PROFILE_DIR
+
+
+class ProfilerBusyError(Exception):
+    pass
+
+
+class SamplingProfiler:
+    """
+    Samples the event loop thread's stack from a helper thread and
+    aggregates it in the collapsed ("folded") format read by flamegraph.pl
+    and speedscope
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _fold(frame) -> str:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(
+                f"{code.co_name} ({os.path.basename(code.co_filename)}:"
+                f"{code.co_firstlineno})"
+            )
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+    def _sample(
+        self, thread_id: int, interval: float, stop: threading.Event, stacks: Counter
+    ) -> None:
+        while not stop.wait(interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is not None:
+                stacks[self._fold(frame)] += 1
+
+    async def profile(self, seconds: float, interval: float) -> Counter:
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError()
+        try:
+            stacks = Counter()
+            stop = threading.Event()
+            sampler = threading.Thread(
+                target=self._sample,
+                args=(threading.get_ident(), interval, stop, stacks),
+                daemon=True,
+            )
+            sampler.start()
+            await asyncio.sleep(seconds)
+            stop.set()
+            sampler.join()
+            return stacks
+        finally:
+            self._lock.release()
+
+
+def to_folded(stacks: Counter) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+def save_profile(folded: str) -> str:
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    path = os.path.join(
+        PROFILE_DIR,
+        f"profile-{datetime.utcnow():%Y%m%d-%H%M%S}-{os.getpid()}-"
+        f"{time.time_ns()}.folded",
+    )
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(folded)
+    return path
+
+
+profiler = SamplingProfiler()
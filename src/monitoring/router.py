@@ -0,0 +1,57 @@
+import os
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+from loguru import logger
+from starlette.responses import PlainTextResponse, Response
+
+from src.config import PROFILE_MAX_SECONDS
+from src.monitoring.metrics import render_metrics
+from src.monitoring.profiler import ProfilerBusyError, profiler, save_profile, to_folded
+from src.monitoring.slow_requests import slow_request_log
+from src.schemas import Response as JsonResponse
+from src.utils import Role, Status, access_denied, return_json, role_access
+
+monitoring_router = APIRouter(tags=["monitoring"])
+
+# Every gunicorn worker profiles and keeps slow requests of its own, so the
+# answer describes only the worker that served the request
+WORKER_PID_HEADER = "X-Worker-Pid"
+
+
+@monitoring_router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    return render_metrics()
+
+
+@monitoring_router.get("/profiling/cpu", response_model=None)
+async def profile_cpu(
+    user_role: Role,
+    seconds: Annotated[int, Query(ge=1, le=PROFILE_MAX_SECONDS)] = 10,
+    interval_ms: Annotated[int, Query(ge=1, le=1000)] = 10,
+) -> Response | JsonResponse:
+    if role_access[user_role] != role_access[Role.ADMIN]:
+        return access_denied()
+    try:
+        stacks = await profiler.profile(seconds=seconds, interval=interval_ms / 1000)
+    except ProfilerBusyError:
+        return return_json(
+            status=Status.ERROR,
+            message="Произошла ошибка при профилировании",
+            details="Профилирование уже запущено",
+        )
+    folded = to_folded(stacks=stacks)
+    path = save_profile(folded=folded)
+    logger.info(f"CPU profile saved to {path}")
+    return PlainTextResponse(folded, headers={WORKER_PID_HEADER: str(os.getpid())})
+
+
+@monitoring_router.get("/profiling/slow")
+async def get_slow_requests(user_role: Role) -> JsonResponse:
+    if role_access[user_role] != role_access[Role.ADMIN]:
+        return access_denied()
+    return return_json(
+        status=Status.SUCCESS,
+        message="Медленные запросы успешно получены",
+        data={"worker_pid": os.getpid(), "slow_requests": slow_request_log.get_all()},
+    )
@@ -0,0 +1,55 @@
+from collections import defaultdict, deque
+from datetime import datetime
+
+from loguru import logger
+
+from src.config import SLOW_REQUEST_HISTORY, SLOW_REQUEST_THRESHOLD_MS
+from src.database_utils.query_counter import LOGGED_STATEMENT_LENGTH, QueryStats
+
+
+class SlowRequestLog:
+    """
+    Keeps the last `history` requests per route that took longer than
+    `threshold_ms`, together with the SQL they executed
+    """
+
+    def __init__(self, threshold_ms: float, history: int) -> None:
+        self._threshold_ms = threshold_ms
+        self._requests: dict[str, deque] = defaultdict(lambda: deque(maxlen=history))
+
+    def observe(
+        self, method: str, route: str, duration: float, query_stats: QueryStats
+    ) -> None:
+        duration_ms = duration * 1000
+        if duration_ms < self._threshold_ms:
+            return
+        key = f"{method} {route}"
+        self._requests[key].append(
+            {
+                "time": datetime.utcnow().isoformat(),
+                "duration_ms": round(duration_ms, 1),
+                "query_count": query_stats.count,
+                "query_time_ms": round(query_stats.duration * 1000, 1),
+                "queries": [
+                    {
+                        "statement": " ".join(statement.split())[
+                            :LOGGED_STATEMENT_LENGTH
+                        ],
+                        "duration_ms": round(query_duration * 1000, 3),
+                    }
+                    for statement, query_duration in query_stats.queries
+                ],
+            }
+        )
+        logger.warning(
+            f"Slow request {key}: {duration_ms:.1f} ms, "
+            f"{query_stats.count} queries in {query_stats.duration * 1000:.1f} ms"
+        )
+
+    def get_all(self) -> dict[str, list[dict]]:
+        return {key: list(requests) for key, requests in self._requests.items()}
+
+
+slow_request_log = SlowRequestLog(
+    threshold_ms=SLOW_REQUEST_THRESHOLD_MS, history=SLOW_REQUEST_HISTORY
+)
@@ -0,0 +1,163 @@
+import inspect
+import json
+import queue
+import re
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Iterator
+
+from src.config import TRACE_EXPORT_PATH
+
+TRACEPARENT_HEADER = "traceparent"
+TRACE_ID_HEADER = "X-Trace-Id"
+TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+class Span:
+    def __init__(
+        self, name: str, layer: str, trace_id: str, parent_id: str | None
+    ) -> None:
+        self.name = name
+        self.layer = layer
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.status = "ok"
+        self.attributes = {}
+        self.start_time = time.time()
+        self.duration = None
+        self._start = time.perf_counter()
+
+    def end(self) -> None:
+        self.duration = time.perf_counter() - self._start
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "layer": self.layer,
+            "status": self.status,
+            "start_time": self.start_time,
+            "duration_ms": round(self.duration * 1000, 3),
+            "attributes": self.attributes,
+        }
+
+
+class FileSpanExporter:
+    """
+    Appends finished spans as JSON lines from a background thread, so the
+    request path never waits on file IO
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+        self._queue.put(json.dumps(span.to_dict(), ensure_ascii=False))
+
+    def _run(self) -> None:
+        with open(self._path, "a", encoding="utf-8") as file:
+            while True:
+                file.write(self._queue.get() + "\n")
+                while not self._queue.empty():
+                    file.write(self._queue.get() + "\n")
+                file.flush()
+
+
+span_exporter = FileSpanExporter(path=TRACE_EXPORT_PATH) if TRACE_EXPORT_PATH else None
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def get_trace_id() -> str:
+    span = _current_span.get()
+    return span.trace_id if span is not None else ""
+
+
+@contextmanager
+def start_span(
+    name: str,
+    layer: str,
+    trace_id: str | None = None,
+    parent_id: str | None = None,
+) -> Iterator[Span]:
+    parent = _current_span.get()
+    if parent is not None:
+        trace_id, parent_id = parent.trace_id, parent.span_id
+    span = Span(
+        name=name,
+        layer=layer,
+        trace_id=trace_id or secrets.token_hex(16),
+        parent_id=parent_id,
+    )
+    token = _current_span.set(span)
+    try:
+        yield span
+    except Exception:
+        span.status = "error"
+        raise
+    finally:
+        span.end()
+        _current_span.reset(token)
+        if span_exporter is not None:
+            span_exporter.export(span=span)
+
+
+def traced(name: str, layer: str) -> Callable:
+    def decorator(function: Callable) -> Callable:
+        if inspect.iscoroutinefunction(function):
+
+            @wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                with start_span(name=name, layer=layer):
+                    return await function(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with start_span(name=name, layer=layer):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _with_span(function: Callable, name: str, layer: str) -> Callable:
+    @wraps(function)
+    async def wrapper(self, *args, **kwargs):
+        with start_span(name=f"{type(self).__name__}.{name}", layer=layer):
+            return await function(self, *args, **kwargs)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def trace_methods(cls: type, layer: str) -> None:
+    for name, attribute in list(vars(cls).items()):
+        if (
+            name.startswith("_")
+            or not inspect.iscoroutinefunction(attribute)
+            or getattr(attribute, "__traced__", False)
+        ):
+            continue
+        setattr(cls, name, _with_span(function=attribute, name=name, layer=layer))
+
+
+def add_trace_id(record: dict) -> None:
+    record["extra"]["trace_id"] = get_trace_id()
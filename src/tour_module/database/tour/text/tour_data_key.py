@@ -3,11 +3,17 @@ from src.database_utils.text.base_data_key import BaseDataKey
 count = "tours_count"
 schemas = "tours"
 schema = "tour"
+missing = "missing_tours"
+imported_count = "imported_tours_count"
+import_errors = "import_errors"
 
 TOUR_DATA_KEY = {
     "count": count,
     "schemas": schemas,
     "schema": schema,
+    "missing": missing,
+    "imported_count": imported_count,
+    "import_errors": import_errors,
 }
 
 
@@ -2,10 +2,14 @@ from src.database_utils.text.base_details import BaseDetails
 
 wrong_id = "Указан не верный id тура"
 wrong_event_id = "Указан не верный id мероприятия"
+include_error = "Не удалось получить связанные данные туров"
+import_invalid_rows = "Файл содержит строки с ошибками, импорт отменён"
 
 TOUR_DETAILS = {
     "wrong_id": wrong_id,
     "wrong_event_id": wrong_event_id,
+    "include_error": include_error,
+    "import_invalid_rows": import_invalid_rows,
 }
 
 
@@ -3,6 +3,9 @@ from src.database_utils.text.base_message import BaseMessage
 get_all_error = "Произошла ошибка при получении туров"
 get_all_success = "Успешное получение туров"
 
+search_error = "Произошла ошибка при поиске туров по запросу «{text}»"
+search_success = "Успешный поиск туров по запросу «{text}»"
+
 get_one_error = "Произошла ошибка при получении тура #{id}"
 get_one_success = "Успешное получение тура #{id}"
 
@@ -18,9 +21,14 @@ delete_success = "Успешное удаление тура #{id}"
 image_error = "Произошла ошибка при изменении изображения для тура #{id}"
 image_success = "Успешное изменение изображения для тура #{id}"
 
+import_error = "Произошла ошибка при импорте туров"
+import_success = "Успешно импортировано туров: {count}"
+
 TOUR_MESSAGE = {
     "get_all_error": get_all_error,
     "get_all_success": get_all_success,
+    "search_error": search_error,
+    "search_success": search_success,
     "get_one_error": get_one_error,
     "get_one_success": get_one_success,
     "create_error": create_error,
@@ -31,6 +39,8 @@ TOUR_MESSAGE = {
     "delete_success": delete_success,
     "image_error": image_error,
     "image_success": image_success,
+    "import_error": import_error,
+    "import_success": import_success,
 }
 
 
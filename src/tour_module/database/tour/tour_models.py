@@ -1,8 +1,17 @@
+from enum import Enum
+
 from src.database_utils.base_models import BaseModels
 from src.tour_module.models import Tour
 from src.tour_module.schemas import TourCreate, TourRead, TourUpdate
 
 
+class TourInclude(Enum):
+    EVENTS = "events"
+    TAGS = "tags"
+    UNIVERSITIES = "universities"
+    REGISTRATIONS_COUNT = "registrations_count"
+
+
 class TourModels(BaseModels):
     create_class: type = TourCreate
     update_class: type = TourUpdate
@@ -1,14 +1,15 @@
-import json
+from datetime import datetime
 
 from loguru import logger
-from sqlalchemy import insert, select, update
+from sqlalchemy import insert, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.address_schema import Address
+from src.address_schema import convert_address
 from src.database_utils.base_query import BaseQuery
 from src.tour_module.database.tour.tour_models import TourModels
 from src.university_module.models import UniversityTour
+from src.utils import SortOrder
 
 
 class TourQuery(BaseQuery):
@@ -23,18 +24,46 @@ class TourQuery(BaseQuery):
         self,
         university_id: int | None,
         session: AsyncSession,
-    ) -> list[_schema_read_class] | None:
+        fields: list[str] | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        registration_open: bool | None = None,
+        date_sort: SortOrder | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        radius_km: float | None = None,
+        city: str | None = None,
+        country: str | None = None,
+    ) -> list[_schema_read_class | dict] | None:
         try:
-            statement = select(self._model)
+            statement = self._select(fields=fields)
 
             if university_id is not None:
                 statement = statement.join(
                     UniversityTour, UniversityTour.tour_id == self._model.id
                 ).filter(UniversityTour.university_id == university_id)
+            statement = self._filter_by_dates(
+                statement=statement,
+                date_from=date_from,
+                date_to=date_to,
+                registration_open=registration_open,
+                date_sort=date_sort,
+            )
+            statement = self._filter_by_location(
+                statement=statement,
+                latitude=latitude,
+                longitude=longitude,
+                radius_km=radius_km,
+            )
+            statement = self._filter_by_address(
+                statement=statement, city=city, country=country
+            )
 
             tour_rows = await session.execute(statement)
 
-            return self._convert_models_to_schema_list(models=tour_rows.all())
+            return self._convert_models_to_schema_list(
+                models=tour_rows.all(), fields=fields
+            )
 
         except Exception as e:
             logger.error(str(e))
@@ -45,16 +74,14 @@ class TourQuery(BaseQuery):
     ) -> IntegrityError | None:
         try:
             model_create.fix_time()
-            await session.execute(insert(self._model).values(**model_create.dict()))
+            await session.execute(
+                insert(self._model).values(**self._get_values(schema=model_create))
+            )
             await session.commit()
         except IntegrityError as e:
             return e
 
     def _convert_model_to_schema(self, model: _model) -> _schema_read_class | None:
-        if type(model[0].address) is str:
-            address = Address(**json.loads(model[0].address))
-        else:
-            address = model[0].address
         schema = self._schema_read_class(
             id=model[0].id,
             name=model[0].name,
@@ -63,8 +90,9 @@ class TourQuery(BaseQuery):
             date_end=model[0].date_end,
             reg_deadline=model[0].reg_deadline,
             max_users=model[0].max_users,
-            address=address,
+            address=convert_address(address=model[0].address),
             image=model[0].image,
+            registered_count=model[0].registered_count,
         )
         return schema
 
@@ -75,7 +103,7 @@ class TourQuery(BaseQuery):
             model_update.fix_time()
             await session.execute(
                 update(self._model)
-                .values(**model_update.dict())
+                .values(**self._get_values(schema=model_update))
                 .where(self._model.id == model_update.id)
             )
             await session.commit()
@@ -1,27 +1,35 @@
+from datetime import datetime
+
 from loguru import logger
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database_utils.base_query import BaseQuery
 from src.database_utils.cascade_base_response_handler import CascadeBaseResponseHandler
+from src.database_utils.relations import CountRelation, LinkRelation, ThroughRelation
+from src.event_module.database.event.event_models import EventInclude
+from src.event_module.database.event.event_query import EventQuery
+from src.event_module.database.event.event_responses import EventResponseHandler
 from src.google_drive.directories import Directory
 from src.schemas import Response
 from src.tour_module.database.tour.text.tour_data_key import TourDataKey
 from src.tour_module.database.tour.text.tour_details import TourDetails
 from src.tour_module.database.tour.text.tour_message import TourMessage
-from src.tour_module.database.tour.tour_models import TourModels
+from src.tour_module.database.tour.tour_models import TourInclude, TourModels
 from src.tour_module.database.tour.tour_query import TourQuery
 from src.tour_module.database.tour_event.tour_event_models import TourEventFilter
 from src.tour_module.database.tour_event.tour_event_query import TourEventQuery
+from src.university_module.database.university.university_query import UniversityQuery
 from src.university_module.database.university_tour.university_tour_models import (
     UniversityTourFilter,
 )
 from src.university_module.database.university_tour.university_tour_query import (
     UniversityTourQuery,
 )
+from src.university_module.schemas import UniversityTourCreate
 from src.user_module.database.user_tour.user_tour_models import UserTourFilter
 from src.user_module.database.user_tour.user_tour_query import UserTourQuery
-from src.utils import Status, return_json
+from src.utils import SortOrder, Status, return_json
 
 
 class TourResponseHandler(CascadeBaseResponseHandler):
@@ -43,20 +51,94 @@ class TourResponseHandler(CascadeBaseResponseHandler):
     _schema_update_class: type = _models.update_class
     _schema_read_class: type = _models.read_class
     _model: type = _models.database_table
+    _import_schema_class: type = _models.create_class
 
     _google_directory: Directory = Directory.TOUR
 
+    _relations: dict[TourInclude, object] = {
+        TourInclude.EVENTS: LinkRelation(
+            query=EventQuery(),
+            relation_field=TourEventQuery.dependency_fields[TourEventFilter.EVENT],
+            key_field=TourEventQuery.dependency_fields[TourEventFilter.TOUR],
+            nested={
+                TourInclude.TAGS: EventResponseHandler._relations[EventInclude.TAGS]
+            },
+        ),
+        TourInclude.TAGS: ThroughRelation(
+            through=LinkRelation(
+                query=EventQuery(),
+                relation_field=TourEventQuery.dependency_fields[TourEventFilter.EVENT],
+                key_field=TourEventQuery.dependency_fields[TourEventFilter.TOUR],
+            ),
+            relation=EventResponseHandler._relations[EventInclude.TAGS],
+        ),
+        TourInclude.UNIVERSITIES: LinkRelation(
+            query=UniversityQuery(),
+            relation_field=UniversityTourQuery.dependency_fields[
+                UniversityTourFilter.UNIVERSITY
+            ],
+            key_field=UniversityTourQuery.dependency_fields[UniversityTourFilter.TOUR],
+        ),
+        TourInclude.REGISTRATIONS_COUNT: CountRelation(
+            query=UserTourQuery(),
+            dependency_field=UserTourQuery.dependency_fields[UserTourFilter.TOUR],
+        ),
+    }
+
+    _university_tour_query: UniversityTourQuery = UniversityTourQuery()
+
+    async def _link_import(
+        self,
+        id_list: list[int],
+        schemas: list,
+        university_id: int | None,
+        session: AsyncSession,
+    ) -> None:
+        if university_id is not None:
+            await self._university_tour_query.create_many(
+                model_create_list=[
+                    UniversityTourCreate(university_id=university_id, tour_id=tour_id)
+                    for tour_id in id_list
+                ],
+                session=session,
+            )
+
     async def get_by_filter(
         self,
         university_id: int | None,
         session: AsyncSession,
+        fields: list[str] | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        registration_open: bool | None = None,
+        date_sort: SortOrder | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        radius_km: float | None = None,
+        city: str | None = None,
+        country: str | None = None,
+        include: list[TourInclude] | None = None,
     ) -> Response:
         try:
             schemas = await self._query.get_by_filter_query(
                 university_id=university_id,
                 session=session,
+                fields=fields,
+                date_from=date_from,
+                date_to=date_to,
+                registration_open=registration_open,
+                date_sort=date_sort,
+                latitude=latitude,
+                longitude=longitude,
+                radius_km=radius_km,
+                city=city,
+                country=country,
             )
             if schemas is not None:
+                if include:
+                    schemas = await self.include_relations(
+                        schemas=schemas, include=include, session=session
+                    )
                 data = {
                     self._data_key.get("count"): len(schemas),
                     self._data_key.get("schemas"): schemas,
@@ -1,8 +1,20 @@
 from datetime import datetime
 
-from sqlalchemy import JSON, TIMESTAMP, Column, ForeignKey, Integer, String
+from sqlalchemy import (
+    TIMESTAMP,
+    Column,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 
 from src.database import Base, metadata
+from src.database_utils.search_vector import search_vector_column, search_vector_index
 from src.event_module.models import Event
 
 
@@ -11,13 +23,28 @@ class Tour(Base):
     metadata = metadata
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)
-    address = Column(JSON, nullable=True)
+    address = Column(JSONB, nullable=True)
     description = Column(String, nullable=False)
-    date_start = Column(TIMESTAMP, default=datetime.utcnow)
+    date_start = Column(TIMESTAMP, default=datetime.utcnow, index=True)
     date_end = Column(TIMESTAMP, default=datetime.utcnow)
-    reg_deadline = Column(TIMESTAMP, default=datetime.utcnow)
+    reg_deadline = Column(TIMESTAMP, default=datetime.utcnow, index=True)
     max_users = Column(Integer, nullable=True)
+    registered_count = Column(Integer, nullable=False, default=0, server_default="0")
     image = Column(String, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    search_vector = search_vector_column()
+
+    __table_args__ = (
+        search_vector_index(table_name="tour"),
+        Index(
+            "ix_tour_location",
+            func.point(longitude, latitude),
+            postgresql_using="gist",
+        ),
+        Index("ix_tour_address_city", func.lower(address["city"].astext)),
+        Index("ix_tour_address_country", func.lower(address["country"].astext)),
+    )
 
 
 class TourEvent(Base):
@@ -26,3 +53,8 @@ class TourEvent(Base):
     id = Column(Integer, primary_key=True)
     tour_id = Column(Integer, ForeignKey(Tour.id), nullable=False)
     event_id = Column(Integer, ForeignKey(Event.id), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("tour_id", "event_id", name="uq_tour_event_tour_id_event_id"),
+        Index("ix_tour_event_event_id", "event_id"),
+    )
@@ -1,10 +1,15 @@
+from datetime import datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_async_session
+from src.database_utils.bulk_import import ImportFormat
+from src.database_utils.export import ExportFormat
 from src.schemas import Response
+from src.tour_module.database.tour.tour_models import TourInclude
 from src.tour_module.database.tour.tour_responses import TourResponseHandler
 from src.tour_module.database.tour_event.tour_event_responses import (
     TourEventResponseHandler,
@@ -16,9 +21,10 @@ from src.tour_module.schemas import (
     TourUpdate,
 )
 from src.tour_module.utils import check_university_tour
+from src.university_module.utils import check_user_university
 from src.user_module.database.user_tour.user_tour_models import UserTourFilter
 from src.user_module.router import user_tour_response_handler
-from src.utils import Role, access_denied, role_access
+from src.utils import Role, SortOrder, access_denied, check_location, role_access
 
 tour_router = APIRouter(prefix="/tour", tags=["tour"])
 
@@ -29,18 +35,69 @@ tour_event_response_handler = TourEventResponseHandler()
 @tour_router.get("/", response_model=Response)
 async def get_all_tours(
     university_id: Annotated[int | None, Query()] = None,
+    date_from: Annotated[datetime | None, Query()] = None,
+    date_to: Annotated[datetime | None, Query()] = None,
+    registration_open: Annotated[bool | None, Query()] = None,
+    date_sort: Annotated[SortOrder | None, Query()] = None,
+    latitude: Annotated[float | None, Query(ge=-90, le=90)] = None,
+    longitude: Annotated[float | None, Query(ge=-180, le=180)] = None,
+    radius_km: Annotated[float | None, Query(gt=0)] = None,
+    city: Annotated[str | None, Query()] = None,
+    country: Annotated[str | None, Query()] = None,
+    fields: Annotated[list[str] | None, Query()] = None,
+    include: Annotated[list[TourInclude] | None, Query()] = None,
     session: AsyncSession = Depends(get_async_session),
 ) -> Response:
+    check_location(latitude=latitude, longitude=longitude, radius_km=radius_km)
     return await tour_response_handler.get_by_filter(
-        university_id=university_id, session=session
+        university_id=university_id,
+        session=session,
+        fields=fields,
+        date_from=date_from,
+        date_to=date_to,
+        registration_open=registration_open,
+        date_sort=date_sort,
+        latitude=latitude,
+        longitude=longitude,
+        radius_km=radius_km,
+        city=city,
+        country=country,
+        include=include,
+    )
+
+
+@tour_router.get("/batch", response_model=Response)
+async def get_tours_by_ids(
+    ids: Annotated[list[int], Query()],
+    fields: Annotated[list[str] | None, Query()] = None,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    return await tour_response_handler.get_by_id_list(
+        model_id_list=ids, session=session, fields=fields
+    )
+
+
+@tour_router.get("/search", response_model=Response)
+async def search_tours(
+    q: Annotated[str, Query(min_length=1)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    fields: Annotated[list[str] | None, Query()] = None,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    return await tour_response_handler.search(
+        text=q, session=session, limit=limit, fields=fields
     )
 
 
 @tour_router.get("/{tour_id}", response_model=Response)
 async def get_tour_by_id(
-    tour_id: int, session: AsyncSession = Depends(get_async_session)
+    tour_id: int,
+    include: Annotated[list[TourInclude] | None, Query()] = None,
+    session: AsyncSession = Depends(get_async_session),
 ) -> Response:
-    return await tour_response_handler.get_by_id(model_id=tour_id, session=session)
+    return await tour_response_handler.get_by_id(
+        model_id=tour_id, session=session, include=include
+    )
 
 
 @tour_router.post("/", response_model=Response)
@@ -55,6 +112,39 @@ async def create_tour(
     return access_denied()
 
 
+@tour_router.post("/import", response_model=Response)
+async def import_tours(
+    file: UploadFile,
+    import_format: ImportFormat = ImportFormat.CSV,
+    university_id: Annotated[int | None, Query()] = None,
+    skip_invalid: bool = False,
+    user_id: Annotated[int | None, Query()] = None,
+    user_role: Annotated[Role, Query()] = Role.GUEST,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    if role_access[user_role] == role_access[Role.ADMIN]:
+        return await tour_response_handler.import_file(
+            file=file.file,
+            import_format=import_format,
+            session=session,
+            university_id=university_id,
+            skip_invalid=skip_invalid,
+        )
+    elif role_access[user_role] == role_access[Role.UNIVERSITY] and user_id is not None:
+        if university_id is not None and await check_user_university(
+            user_id=user_id, university_id=university_id, session=session
+        ):
+            return await tour_response_handler.import_file(
+                file=file.file,
+                import_format=import_format,
+                session=session,
+                university_id=university_id,
+                skip_invalid=skip_invalid,
+            )
+
+    return access_denied()
+
+
 @tour_router.put("/{tour_id}", response_model=Response)
 async def update_tour(
     tour: TourUpdate,
@@ -200,3 +290,26 @@ async def get_users_by_tour(
             )
 
     return access_denied()
+
+
+@tour_router.get("/{tour_id}/user/export", response_model=None)
+async def export_users_by_tour(
+    user_role: Role,
+    tour_id: int,
+    export_format: ExportFormat = ExportFormat.CSV,
+    user_id: Annotated[int | None, Query()] = None,
+    session: AsyncSession = Depends(get_async_session),
+) -> StreamingResponse | Response:
+    if role_access[user_role] == role_access[Role.ADMIN]:
+        return user_tour_response_handler.export_by_target(
+            target_id=tour_id, export_format=export_format, session=session
+        )
+    elif role_access[user_role] == role_access[Role.UNIVERSITY] and user_id is not None:
+        if await check_university_tour(
+            user_id=user_id, tour_id=tour_id, session=session
+        ):
+            return user_tour_response_handler.export_by_target(
+                target_id=tour_id, export_format=export_format, session=session
+            )
+
+    return access_denied()
@@ -33,6 +33,7 @@ class TourRead(BaseIDModel):
     reg_deadline: datetime
     max_users: int
     image: str | None
+    registered_count: int = 0
 
 
 class TourUpdate(BaseIDModel):
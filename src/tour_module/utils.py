@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.monitoring.tracing import traced
 from src.university_module.database.university_tour.text.university_tour_data_key import (
     UniversityTourDataKey,
 )
@@ -17,25 +18,29 @@ from src.user_module.database.user_university.user_university_responses import (
 )
 
 
-async def check_university_tour(user_id: int, tour_id: int, session: AsyncSession):
-    university_id = (
-        (
-            await UserUniversityResponseHandler().get_by_filter(
-                user_university_filter=UserUniversityFilter.USER,
-                value=user_id,
-                session=session,
-            )
+@traced(name="get_university_tour_ids", layer="router")
+async def get_university_tour_ids(user_id: int, session: AsyncSession) -> set[int]:
+    user_university_list = (
+        await UserUniversityResponseHandler().get_by_filter(
+            user_university_filter=UserUniversityFilter.USER,
+            value=user_id,
+            session=session,
         )
-        .data[UserUniversityDataKey().get(key="schema")]
-        .university_id
-    )
-    tours = (
-        (
-            await UniversityTourResponseHandler().get_by_filter(
-                value=university_id, session=session
+    ).data[UserUniversityDataKey().get(key="schema")]
+    tour_id_set = set()
+    for user_university in user_university_list:
+        tour_id_set.update(
+            (
+                await UniversityTourResponseHandler().get_by_filter(
+                    value=user_university.university_id, session=session
+                )
             )
+            .data[UniversityTourDataKey().get(key="schemas")]
+            .tour_id_list
         )
-        .data[UniversityTourDataKey().get(key="schemas")]
-        .event_id_list
-    )
-    return tour_id in tours
+    return tour_id_set
+
+
+@traced(name="check_university_tour", layer="router")
+async def check_university_tour(user_id: int, tour_id: int, session: AsyncSession):
+    return tour_id in await get_university_tour_ids(user_id=user_id, session=session)
@@ -3,11 +3,13 @@ from src.database_utils.text.base_data_key import BaseDataKey
 count = "universities_count"
 schemas = "universities"
 schema = "university"
+missing = "missing_universities"
 
 UNIVERSITY_DATA_KEY = {
     "count": count,
     "schemas": schemas,
     "schema": schema,
+    "missing": missing,
 }
 
 
@@ -3,6 +3,9 @@ from src.database_utils.text.base_message import BaseMessage
 get_all_error = "Произошла ошибка при получении университетов"
 get_all_success = "Успешное получение университетов"
 
+search_error = "Произошла ошибка при поиске университетов по запросу «{text}»"
+search_success = "Успешный поиск университетов по запросу «{text}»"
+
 get_one_error = "Произошла ошибка при получении университета #{id}"
 get_one_success = "Успешное получение университета #{id}"
 
@@ -21,6 +24,8 @@ image_success = "Успешное изменение изображения дл
 UNIVERSITY_MESSAGE = {
     "get_all_error": get_all_error,
     "get_all_success": get_all_success,
+    "search_error": search_error,
+    "search_success": search_success,
     "get_one_error": get_one_error,
     "get_one_success": get_one_success,
     "create_error": create_error,
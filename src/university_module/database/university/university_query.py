@@ -1,10 +1,9 @@
-import json
-
+from loguru import logger
 from sqlalchemy import insert, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.address_schema import Address
+from src.address_schema import convert_address
 from src.database_utils.base_query import BaseQuery
 from src.university_module.database.university.university_models import UniversityModels
 
@@ -17,28 +16,48 @@ class UniversityQuery(BaseQuery):
     _schema_read_class: type = _models.read_class
     _model: type = _models.database_table
 
+    async def get_by_filter_query(
+        self,
+        session: AsyncSession,
+        fields: list[str] | None = None,
+        city: str | None = None,
+        country: str | None = None,
+    ) -> list[_schema_read_class | dict] | None:
+        try:
+            statement = self._filter_by_address(
+                statement=self._select(fields=fields), city=city, country=country
+            )
+
+            university_rows = await session.execute(statement)
+
+            return self._convert_models_to_schema_list(
+                models=university_rows.all(), fields=fields
+            )
+
+        except Exception as e:
+            logger.error(str(e))
+            return None
+
     async def create(
         self, model_create: _schema_create_class, session: AsyncSession
     ) -> IntegrityError | None:
         try:
             model_create.fix_time()
-            await session.execute(insert(self._model).values(**model_create.dict()))
+            await session.execute(
+                insert(self._model).values(**self._get_values(schema=model_create))
+            )
             await session.commit()
         except IntegrityError as e:
             return e
 
     def _convert_model_to_schema(self, model: _model) -> _schema_read_class | None:
-        if type(model[0].address) is str:
-            address = Address(**json.loads(model[0].address))
-        else:
-            address = model[0].address
         schema = self._schema_read_class(
             id=model[0].id,
             name=model[0].name,
             url=model[0].url,
             phone=model[0].phone,
             email=model[0].email,
-            address=address,
+            address=convert_address(address=model[0].address),
             description=model[0].description,
             reg_date=model[0].reg_date,
             image=model[0].image,
@@ -52,7 +71,7 @@ class UniversityQuery(BaseQuery):
             model_update.fix_time()
             await session.execute(
                 update(self._model)
-                .values(**model_update.dict())
+                .values(**self._get_values(schema=model_update))
                 .where(self._model.id == model_update.id)
             )
             await session.commit()
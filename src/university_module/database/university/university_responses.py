@@ -1,6 +1,11 @@
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.autocomplete.autocomplete_models import AutocompleteSource
 from src.database_utils.base_query import BaseQuery
 from src.database_utils.cascade_base_response_handler import CascadeBaseResponseHandler
 from src.google_drive.directories import Directory
+from src.schemas import Response
 from src.university_module.database.university.text.university_data_key import (
     UniversityDataKey,
 )
@@ -24,6 +29,7 @@ from src.university_module.database.university_tour.university_tour_models impor
 from src.university_module.database.university_tour.university_tour_query import (
     UniversityTourQuery,
 )
+from src.utils import Status, return_json
 
 
 class UniversityResponseHandler(CascadeBaseResponseHandler):
@@ -46,5 +52,37 @@ class UniversityResponseHandler(CascadeBaseResponseHandler):
     _schema_update_class: type = _models.update_class
     _schema_read_class: type = _models.read_class
     _model: type = _models.database_table
+    _autocomplete_source: AutocompleteSource = AutocompleteSource.UNIVERSITY
 
     _google_directory: Directory = Directory.UNIVERSITY
+
+    async def get_by_filter(
+        self,
+        session: AsyncSession,
+        fields: list[str] | None = None,
+        city: str | None = None,
+        country: str | None = None,
+    ) -> Response:
+        try:
+            schemas = await self._query.get_by_filter_query(
+                session=session, fields=fields, city=city, country=country
+            )
+            if schemas is not None:
+                data = {
+                    self._data_key.get("count"): len(schemas),
+                    self._data_key.get("schemas"): schemas,
+                }
+                return return_json(
+                    status=Status.SUCCESS,
+                    message=self._message.get("get_all_success"),
+                    data=data,
+                )
+            else:
+                raise Exception()
+        except Exception as e:
+            logger.error(str(e))
+            return return_json(
+                status=Status.ERROR,
+                message=self._message.get("get_all_error"),
+                details=str(e),
+            )
@@ -1,8 +1,21 @@
 from datetime import datetime
 
-from sqlalchemy import JSON, TIMESTAMP, Column, ForeignKey, Integer, String
+from sqlalchemy import (
+    TIMESTAMP,
+    Column,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 
 from src.database import Base, metadata
+from src.database_utils.name_changes import notify_name_changes
+from src.database_utils.search_vector import search_vector_column, search_vector_index
 from src.event_module.models import Event
 from src.tour_module.models import Tour
 
@@ -15,10 +28,27 @@ class University(Base):
     url = Column(String, nullable=True)
     phone = Column(String, nullable=True)
     email = Column(String, nullable=True)
-    address = Column(JSON, nullable=True)
+    address = Column(JSONB, nullable=True)
     description = Column(String, nullable=True)
     reg_date = Column(TIMESTAMP, default=datetime.utcnow)
     image = Column(String, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    search_vector = search_vector_column()
+
+    __table_args__ = (
+        search_vector_index(table_name="university"),
+        Index(
+            "ix_university_location",
+            func.point(longitude, latitude),
+            postgresql_using="gist",
+        ),
+        Index("ix_university_address_city", func.lower(address["city"].astext)),
+        Index("ix_university_address_country", func.lower(address["country"].astext)),
+    )
+
+
+notify_name_changes(table=University.__table__)
 
 
 class UniversityEvent(Base):
@@ -28,6 +58,15 @@ class UniversityEvent(Base):
     university_id = Column(Integer, ForeignKey(University.id), nullable=False)
     event_id = Column(Integer, ForeignKey(Event.id), nullable=False)
 
+    __table_args__ = (
+        UniqueConstraint(
+            "university_id",
+            "event_id",
+            name="uq_university_event_university_id_event_id",
+        ),
+        Index("ix_university_event_event_id", "event_id"),
+    )
+
 
 class UniversityTour(Base):
     __tablename__ = "university_tour"
@@ -35,3 +74,10 @@ class UniversityTour(Base):
     id = Column(Integer, primary_key=True)
     university_id = Column(Integer, ForeignKey(University.id), nullable=False)
     tour_id = Column(Integer, ForeignKey(Tour.id), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "university_id", "tour_id", name="uq_university_tour_university_id_tour_id"
+        ),
+        Index("ix_university_tour_tour_id", "tour_id"),
+    )
@@ -1,9 +1,11 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_async_session
+from src.database_utils.export import ExportFormat
 from src.schemas import Response
 from src.university_module.database.university.university_responses import (
     UniversityResponseHandler,
@@ -26,7 +28,11 @@ from src.university_module.utils import check_user_university
 from src.user_module.database.user_university.user_university_models import (
     UserUniversityFilter,
 )
-from src.user_module.router import user_university_response_handler
+from src.user_module.router import (
+    user_event_response_handler,
+    user_tour_response_handler,
+    user_university_response_handler,
+)
 from src.utils import Role, access_denied, role_access
 
 university_router = APIRouter(prefix="/university", tags=["university"])
@@ -38,9 +44,37 @@ university_event_response_handler = UniversityEventResponseHandler()
 
 @university_router.get("/", response_model=Response)
 async def get_all_universities(
+    city: Annotated[str | None, Query()] = None,
+    country: Annotated[str | None, Query()] = None,
+    fields: Annotated[list[str] | None, Query()] = None,
     session: AsyncSession = Depends(get_async_session),
 ) -> Response:
-    return await university_response_handler.get_all(session=session)
+    return await university_response_handler.get_by_filter(
+        session=session, fields=fields, city=city, country=country
+    )
+
+
+@university_router.get("/batch", response_model=Response)
+async def get_universities_by_ids(
+    ids: Annotated[list[int], Query()],
+    fields: Annotated[list[str] | None, Query()] = None,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    return await university_response_handler.get_by_id_list(
+        model_id_list=ids, session=session, fields=fields
+    )
+
+
+@university_router.get("/search", response_model=Response)
+async def search_universities(
+    q: Annotated[str, Query(min_length=1)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    fields: Annotated[list[str] | None, Query()] = None,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    return await university_response_handler.search(
+        text=q, session=session, limit=limit, fields=fields
+    )
 
 
 @university_router.get("/{university_id}", response_model=Response)
@@ -261,3 +295,53 @@ async def get_user_by_university_id(
         value=university_id,
         session=session,
     )
+
+
+@university_router.get("/{university_id}/event/user/export", response_model=None)
+async def export_event_users_by_university(
+    user_role: Role,
+    university_id: int,
+    export_format: ExportFormat = ExportFormat.CSV,
+    user_id: Annotated[int | None, Query()] = None,
+    session: AsyncSession = Depends(get_async_session),
+) -> StreamingResponse | Response:
+    if role_access[user_role] == role_access[Role.ADMIN]:
+        return user_event_response_handler.export_by_university(
+            university_id=university_id, export_format=export_format, session=session
+        )
+    elif role_access[user_role] == role_access[Role.UNIVERSITY] and user_id is not None:
+        if await check_user_university(
+            user_id=user_id, university_id=university_id, session=session
+        ):
+            return user_event_response_handler.export_by_university(
+                university_id=university_id,
+                export_format=export_format,
+                session=session,
+            )
+
+    return access_denied()
+
+
+@university_router.get("/{university_id}/tour/user/export", response_model=None)
+async def export_tour_users_by_university(
+    user_role: Role,
+    university_id: int,
+    export_format: ExportFormat = ExportFormat.CSV,
+    user_id: Annotated[int | None, Query()] = None,
+    session: AsyncSession = Depends(get_async_session),
+) -> StreamingResponse | Response:
+    if role_access[user_role] == role_access[Role.ADMIN]:
+        return user_tour_response_handler.export_by_university(
+            university_id=university_id, export_format=export_format, session=session
+        )
+    elif role_access[user_role] == role_access[Role.UNIVERSITY] and user_id is not None:
+        if await check_user_university(
+            user_id=user_id, university_id=university_id, session=session
+        ):
+            return user_tour_response_handler.export_by_university(
+                university_id=university_id,
+                export_format=export_format,
+                session=session,
+            )
+
+    return access_denied()
@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.monitoring.tracing import traced
 from src.user_module.database.user_university.text.user_university_data_key import (
     UserUniversityDataKey,
 )
@@ -11,6 +12,7 @@ from src.user_module.database.user_university.user_university_responses import (
 )
 
 
+@traced(name="check_user_university", layer="router")
 async def check_user_university(
     user_id: int, university_id: int, session: AsyncSession
 ):
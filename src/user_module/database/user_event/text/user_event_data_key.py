@@ -3,11 +3,19 @@ from src.database_utils.text.base_data_key import BaseDataKey
 count = "user_events_count"
 schemas = "user_events"
 schema = "user_event"
+waitlist_count = "waitlist_count"
+waitlist = "waitlist"
+success_count = "success_count"
+results = "results"
 
 USER_EVENT_DATA_KEY = {
     "count": count,
     "schemas": schemas,
     "schema": schema,
+    "waitlist_count": waitlist_count,
+    "waitlist": waitlist,
+    "success_count": success_count,
+    "results": results,
 }
 
 
@@ -1,9 +1,19 @@
 from src.database_utils.text.base_details import BaseDetails
 
 wrong_id = "Указан неверный id таблицы user_event"
+registration_not_found = "Указан неверный id мероприятия"
+registration_closed = "Регистрация на мероприятие закрыта"
+registration_full = "Достигнуто максимальное количество участников мероприятия"
+already_registered = "Пользователь уже зарегистрирован на мероприятие"
+not_registered = "Пользователь не зарегистрирован на мероприятие"
 
 USER_EVENT_DETAILS = {
     "wrong_id": wrong_id,
+    "registration_not_found": registration_not_found,
+    "registration_closed": registration_closed,
+    "registration_full": registration_full,
+    "already_registered": already_registered,
+    "not_registered": not_registered,
 }
 
 
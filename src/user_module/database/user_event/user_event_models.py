@@ -1,13 +1,14 @@
 from enum import Enum
 
 from src.database_utils.base_models import BaseModels
-from src.user_module.models import UserEvent
+from src.user_module.models import UserEvent, UserEventWaitlist
 from src.user_module.schemas import (
     EventListRead,
     UserEventCreate,
     UserEventDelete,
     UserEventRead,
     UserEventUpdate,
+    UserEventWaitlistRead,
     UserListRead,
 )
 
@@ -23,6 +24,8 @@ class UserEventModels(BaseModels):
     read_class: type = UserEventRead
     delete_class: type = UserEventDelete
     database_table: type = UserEvent
+    waitlist_table: type = UserEventWaitlist
+    waitlist_read_class: type = UserEventWaitlistRead
 
     read_user_list_class: type = UserListRead
     read_event_list_class: type = EventListRead
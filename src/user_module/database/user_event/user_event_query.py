@@ -1,15 +1,16 @@
-from sqlalchemy import delete
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database_utils.dependent_base_query import DependentBaseQuery
+from src.database_utils.registration_base_query import RegistrationBaseQuery
+from src.event_module.models import Event
+from src.university_module.models import UniversityEvent
 from src.user_module.database.user_event.user_event_models import (
     UserEventFilter,
     UserEventModels,
 )
 
 
-class UserEventQuery(DependentBaseQuery):
+class UserEventQuery(RegistrationBaseQuery):
     _models: UserEventModels = UserEventModels()
 
     schema_create_class: type = _models.create_class
@@ -23,6 +24,12 @@ class UserEventQuery(DependentBaseQuery):
         UserEventFilter.EVENT: _model.event_id,
     }
 
+    _target_model: type = Event
+    _target_filter: object = UserEventFilter.EVENT
+    _waitlist_model: type = _models.waitlist_table
+    _waitlist_read_class: type = _models.waitlist_read_class
+    _university_link_model: type = UniversityEvent
+
     def _convert_model_to_schema(self, model: _model) -> _schema_read_class | None:
         schema = self._schema_read_class(
             id=model[0].id,
@@ -34,20 +41,17 @@ class UserEventQuery(DependentBaseQuery):
     async def delete_by_delete_schema(
         self, model_delete: _schema_delete_class, session: AsyncSession
     ) -> IntegrityError | None:
-        try:
-            await session.execute(
-                delete(self._model).where(
-                    (self._model.user_id == model_delete.user_id)
-                    & (self._model.event_id == model_delete.event_id)
-                )
-            )
-            await session.commit()
-        except IntegrityError as e:
-            return e
+        return await self._delete_where(
+            condition=(self._model.user_id == model_delete.user_id)
+            & (self._model.event_id == model_delete.event_id),
+            session=session,
+        )
 
     async def delete_by_user(
         self, user_id: int, session: AsyncSession
     ) -> IntegrityError | None:
         return await self.delete_by_dependency(
-            dependency_field=UserEventFilter.USER, value=user_id, session=session
+            dependency_field=self.dependency_fields[UserEventFilter.USER],
+            value=user_id,
+            session=session,
         )
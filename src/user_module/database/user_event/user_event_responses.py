@@ -2,7 +2,9 @@ from loguru import logger
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database_utils.base_response_handler import BaseResponseHandler
+from src.database_utils.registration_base_response_handler import (
+    RegistrationBaseResponseHandler,
+)
 from src.schemas import Response
 from src.user_module.database.user_event.text.user_event_data_key import (
     UserEventDataKey,
@@ -19,7 +21,7 @@ from src.user_module.database.user_event.user_event_query import UserEventQuery
 from src.utils import Status, return_json
 
 
-class UserEventResponseHandler(BaseResponseHandler):
+class UserEventResponseHandler(RegistrationBaseResponseHandler):
     _query: UserEventQuery = UserEventQuery()
     _message: UserEventMessage = UserEventMessage()
     _data_key: UserEventDataKey = UserEventDataKey()
@@ -86,7 +88,7 @@ class UserEventResponseHandler(BaseResponseHandler):
                         id="("
                         + str(model_delete.user_id)
                         + " - "
-                        + str(model_delete.event_list)
+                        + str(model_delete.event_id)
                         + ")"
                     ),
                 )
@@ -100,7 +102,7 @@ class UserEventResponseHandler(BaseResponseHandler):
                     id="("
                     + str(model_delete.user_id)
                     + " - "
-                    + str(model_delete.event_list)
+                    + str(model_delete.event_id)
                     + ")"
                 ),
             )
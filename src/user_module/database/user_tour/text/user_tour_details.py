@@ -1,9 +1,19 @@
 from src.database_utils.text.base_details import BaseDetails
 
 wrong_id = "Указан неверный id таблицы user_tour"
+registration_not_found = "Указан неверный id тура"
+registration_closed = "Регистрация на тур закрыта"
+registration_full = "Достигнуто максимальное количество участников тура"
+already_registered = "Пользователь уже зарегистрирован на тур"
+not_registered = "Пользователь не зарегистрирован на тур"
 
 USER_TOUR_DETAILS = {
     "wrong_id": wrong_id,
+    "registration_not_found": registration_not_found,
+    "registration_closed": registration_closed,
+    "registration_full": registration_full,
+    "already_registered": already_registered,
+    "not_registered": not_registered,
 }
 
 
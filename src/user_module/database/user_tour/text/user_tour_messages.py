@@ -15,6 +15,21 @@ update_success = "Успешное изменение связи user_tour #{id}
 delete_error = "Произошла ошибка при удалении связи user_tour #{id}"
 delete_success = "Успешное удаление связи user_tour #{id}"
 
+bulk_create_error = "Произошла ошибка при групповой регистрации на тур"
+bulk_create_success = "Групповая регистрация на тур обработана"
+
+bulk_delete_error = "Произошла ошибка при групповой отмене регистрации на тур"
+bulk_delete_success = "Групповая отмена регистрации на тур обработана"
+
+waitlist_join_error = "Произошла ошибка при добавлении в лист ожидания тура"
+waitlist_join_success = "Пользователь добавлен в лист ожидания тура"
+
+waitlist_get_error = "Произошла ошибка при получении листа ожидания тура"
+waitlist_get_success = "Успешное получение листа ожидания тура"
+
+waitlist_delete_error = "Произошла ошибка при удалении из листа ожидания тура"
+waitlist_delete_success = "Успешное удаление из листа ожидания тура"
+
 
 USER_TOUR_MESSAGE = {
     "get_all_error": get_all_error,
@@ -27,6 +42,16 @@ USER_TOUR_MESSAGE = {
     "update_success": update_success,
     "delete_error": delete_error,
     "delete_success": delete_success,
+    "bulk_create_error": bulk_create_error,
+    "bulk_create_success": bulk_create_success,
+    "bulk_delete_error": bulk_delete_error,
+    "bulk_delete_success": bulk_delete_success,
+    "waitlist_join_error": waitlist_join_error,
+    "waitlist_join_success": waitlist_join_success,
+    "waitlist_get_error": waitlist_get_error,
+    "waitlist_get_success": waitlist_get_success,
+    "waitlist_delete_error": waitlist_delete_error,
+    "waitlist_delete_success": waitlist_delete_success,
 }
 
 
@@ -1,7 +1,7 @@
 from enum import Enum
 
 from src.database_utils.base_models import BaseModels
-from src.user_module.models import UserTour
+from src.user_module.models import UserTour, UserTourWaitlist
 from src.user_module.schemas import (
     TourListRead,
     UserListRead,
@@ -9,6 +9,7 @@ from src.user_module.schemas import (
     UserTourDelete,
     UserTourRead,
     UserTourUpdate,
+    UserTourWaitlistRead,
 )
 
 
@@ -23,6 +24,8 @@ class UserTourModels(BaseModels):
     read_class: type = UserTourRead
     delete_class: type = UserTourDelete
     database_table: type = UserTour
+    waitlist_table: type = UserTourWaitlist
+    waitlist_read_class: type = UserTourWaitlistRead
 
     read_tour_list_class: type = TourListRead
     read_user_list_class: type = UserListRead
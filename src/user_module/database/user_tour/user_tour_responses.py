@@ -2,7 +2,9 @@ from loguru import logger
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database_utils.base_response_handler import BaseResponseHandler
+from src.database_utils.registration_base_response_handler import (
+    RegistrationBaseResponseHandler,
+)
 from src.schemas import Response
 from src.user_module.database.user_tour.text.user_tour_data_key import UserTourDataKey
 from src.user_module.database.user_tour.text.user_tour_details import UserTourDetails
@@ -15,7 +17,7 @@ from src.user_module.database.user_tour.user_tour_query import UserTourQuery
 from src.utils import Status, return_json
 
 
-class UserTourResponseHandler(BaseResponseHandler):
+class UserTourResponseHandler(RegistrationBaseResponseHandler):
     _query: UserTourQuery = UserTourQuery()
     _message: UserTourMessage = UserTourMessage()
     _data_key: UserTourDataKey = UserTourDataKey()
@@ -82,7 +84,7 @@ class UserTourResponseHandler(BaseResponseHandler):
                         id="("
                         + str(model_delete.user_id)
                         + " - "
-                        + str(model_delete.event_list)
+                        + str(model_delete.tour_id)
                         + ")"
                     ),
                 )
@@ -96,7 +98,7 @@ class UserTourResponseHandler(BaseResponseHandler):
                     id="("
                     + str(model_delete.user_id)
                     + " - "
-                    + str(model_delete.event_list)
+                    + str(model_delete.tour_id)
                     + ")"
                 ),
             )
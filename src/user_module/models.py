@@ -1,4 +1,6 @@
-from sqlalchemy import Column, ForeignKey, Integer
+from datetime import datetime
+
+from sqlalchemy import TIMESTAMP, Column, ForeignKey, Index, Integer, UniqueConstraint
 
 from src.database import Base, metadata
 from src.event_module.models import Event
@@ -13,6 +15,11 @@ class UserEvent(Base):
     user_id = Column(Integer, nullable=False)
     event_id = Column(Integer, ForeignKey(Event.id), nullable=False)
 
+    __table_args__ = (
+        UniqueConstraint("user_id", "event_id", name="uq_user_event_user_id_event_id"),
+        Index("ix_user_event_event_id", "event_id"),
+    )
+
 
 class UserTour(Base):
     __tablename__ = "user_tour"
@@ -21,6 +28,43 @@ class UserTour(Base):
     user_id = Column(Integer, nullable=False)
     tour_id = Column(Integer, ForeignKey(Tour.id), nullable=False)
 
+    __table_args__ = (
+        UniqueConstraint("user_id", "tour_id", name="uq_user_tour_user_id_tour_id"),
+        Index("ix_user_tour_tour_id", "tour_id"),
+    )
+
+
+class UserEventWaitlist(Base):
+    __tablename__ = "user_event_waitlist"
+    metadata = metadata
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    event_id = Column(Integer, ForeignKey(Event.id, ondelete="CASCADE"), nullable=False)
+    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "event_id", name="uq_user_event_waitlist_user_id_event_id"
+        ),
+        Index("ix_user_event_waitlist_event_id_id", "event_id", "id"),
+    )
+
+
+class UserTourWaitlist(Base):
+    __tablename__ = "user_tour_waitlist"
+    metadata = metadata
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    tour_id = Column(Integer, ForeignKey(Tour.id, ondelete="CASCADE"), nullable=False)
+    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "tour_id", name="uq_user_tour_waitlist_user_id_tour_id"
+        ),
+        Index("ix_user_tour_waitlist_tour_id_id", "tour_id", "id"),
+    )
+
 
 class UserUniversity(Base):
     __tablename__ = "user_university"
@@ -28,3 +72,10 @@ class UserUniversity(Base):
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, nullable=False)
     university_id = Column(Integer, ForeignKey(University.id), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "university_id", name="uq_user_university_user_id_university_id"
+        ),
+        Index("ix_user_university_university_id", "university_id"),
+    )
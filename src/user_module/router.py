@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends
+from pydantic import conlist
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import BULK_REGISTRATION_LIMIT
 from src.database import get_async_session
-from src.event_module.utils import check_university_event
+from src.event_module.utils import check_university_event, get_university_event_ids
 from src.schemas import Response
-from src.tour_module.utils import check_university_tour
+from src.tour_module.utils import check_university_tour, get_university_tour_ids
 from src.user_module.database.user_event.user_event_models import UserEventFilter
 from src.user_module.database.user_event.user_event_responses import (
     UserEventResponseHandler,
@@ -26,7 +28,7 @@ from src.user_module.schemas import (
     UserTourDelete,
     UserUniversityCreate,
 )
-from src.user_module.utils import check_user_ids
+from src.user_module.utils import check_bulk_access, check_user_ids
 from src.utils import Role, access_denied, role_access
 
 user_router = APIRouter(prefix="/user", tags=["user"])
@@ -81,49 +83,147 @@ async def get_events(
     return access_denied()
 
 
-@user_router.delete("/{event_id}", response_model=Response)
-async def delete_user_event(
+@user_router.delete("/event", response_model=Response)
+async def delete_all_user_events(
     user_role: Role,
     user_id: int | None,
-    user_event: UserEventDelete,
+    user_id_to_delete: int,
     session: AsyncSession = Depends(get_async_session),
 ) -> Response:
     if role_access[user_role] == role_access[Role.ADMIN]:
-        return await user_event_response_handler.delete_by_delete_schema(
-            model_delete=user_event, session=session
+        return await user_event_response_handler.delete_by_user(
+            user_id=user_id_to_delete, session=session
         )
-    elif role_access[user_role] == role_access[Role.UNIVERSITY] and user_id is not None:
-        if check_university_event(
-            user_id=user_id, event_id=user_event.event_id, session=session
-        ):
-            return await user_event_response_handler.delete_by_delete_schema(
-                model_delete=user_event, session=session
+
+    elif role_access[user_role] == role_access[Role.USER]:
+        if check_user_ids(needed=user_id, received=user_id_to_delete):
+            return await user_event_response_handler.delete_by_user(
+                user_id=user_id_to_delete, session=session
             )
+
+    return access_denied()
+
+
+@user_router.post("/event/bulk", response_model=Response)
+async def set_event_bulk(
+    user_role: Role,
+    user_id: int | None,
+    user_event_list: conlist(
+        UserEventCreate, min_items=1, max_items=BULK_REGISTRATION_LIMIT
+    ),
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    if await check_bulk_access(
+        user_role=user_role,
+        user_id=user_id,
+        model_list=user_event_list,
+        get_university_ids=get_university_event_ids,
+        target_key="event_id",
+        session=session,
+    ):
+        return await user_event_response_handler.bulk_create(
+            model_create_list=user_event_list, session=session
+        )
+
+    return access_denied()
+
+
+@user_router.delete("/event/bulk", response_model=Response)
+async def delete_user_event_bulk(
+    user_role: Role,
+    user_id: int | None,
+    user_event_list: conlist(
+        UserEventDelete, min_items=1, max_items=BULK_REGISTRATION_LIMIT
+    ),
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    if await check_bulk_access(
+        user_role=user_role,
+        user_id=user_id,
+        model_list=user_event_list,
+        get_university_ids=get_university_event_ids,
+        target_key="event_id",
+        session=session,
+    ):
+        return await user_event_response_handler.bulk_delete(
+            model_delete_list=user_event_list, session=session
+        )
+
+    return access_denied()
+
+
+@user_router.post("/event/waitlist", response_model=Response)
+async def join_event_waitlist(
+    user_role: Role,
+    user_id: int | None,
+    user_event: UserEventCreate,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    if role_access[user_role] == role_access[Role.ADMIN]:
+        return await user_event_response_handler.join_waitlist(
+            model_create=user_event, session=session
+        )
     elif role_access[user_role] == role_access[Role.USER] and user_id is not None:
         if check_user_ids(needed=user_id, received=user_event.user_id):
-            return await user_event_response_handler.delete_by_delete_schema(
-                model_delete=user_event, session=session
+            return await user_event_response_handler.join_waitlist(
+                model_create=user_event, session=session
             )
 
     return access_denied()
 
 
-@user_router.delete("/event", response_model=Response)
-async def delete_all_user_events(
+@user_router.get("/event/waitlist", response_model=Response)
+async def get_event_waitlist(
     user_role: Role,
     user_id: int | None,
-    user_id_to_delete: int,
+    user_id_to_get: int | None = None,
+    event_id: int | None = None,
     session: AsyncSession = Depends(get_async_session),
 ) -> Response:
     if role_access[user_role] == role_access[Role.ADMIN]:
-        return await user_event_response_handler.delete_by_user(
-            user_id=user_id_to_delete, session=session
-        )
-
+        if event_id is not None:
+            return await user_event_response_handler.get_waitlist(
+                waitlist_filter=UserEventFilter.EVENT, value=event_id, session=session
+            )
+        elif user_id_to_get is not None:
+            return await user_event_response_handler.get_waitlist(
+                waitlist_filter=UserEventFilter.USER,
+                value=user_id_to_get,
+                session=session,
+            )
+    elif role_access[user_role] == role_access[Role.UNIVERSITY] and user_id is not None:
+        if event_id is not None and await check_university_event(
+            user_id=user_id, event_id=event_id, session=session
+        ):
+            return await user_event_response_handler.get_waitlist(
+                waitlist_filter=UserEventFilter.EVENT, value=event_id, session=session
+            )
     elif role_access[user_role] == role_access[Role.USER]:
-        if check_user_ids(needed=user_id, received=user_id_to_delete):
-            return await user_event_response_handler.delete_by_user(
-                user_id=user_id_to_delete, session=session
+        if check_user_ids(needed=user_id, received=user_id_to_get):
+            return await user_event_response_handler.get_waitlist(
+                waitlist_filter=UserEventFilter.USER,
+                value=user_id_to_get,
+                session=session,
+            )
+
+    return access_denied()
+
+
+@user_router.delete("/event/waitlist", response_model=Response)
+async def leave_event_waitlist(
+    user_role: Role,
+    user_id: int | None,
+    user_event: UserEventDelete,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    if role_access[user_role] == role_access[Role.ADMIN]:
+        return await user_event_response_handler.leave_waitlist(
+            model_delete=user_event, session=session
+        )
+    elif role_access[user_role] == role_access[Role.USER] and user_id is not None:
+        if check_user_ids(needed=user_id, received=user_event.user_id):
+            return await user_event_response_handler.leave_waitlist(
+                model_delete=user_event, session=session
             )
 
     return access_denied()
@@ -138,13 +238,13 @@ async def set_tour(
 ) -> Response:
     if role_access[user_role] == role_access[Role.ADMIN]:
         return await user_tour_response_handler.create(
-            user_tour=user_tour, session=session
+            model_create=user_tour, session=session
         )
 
     elif role_access[user_role] == role_access[Role.USER]:
         if check_user_ids(needed=user_id, received=user_tour.user_id):
             return await user_tour_response_handler.create(
-                user_tour=user_tour, session=session
+                model_create=user_tour, session=session
             )
 
     return access_denied()
@@ -172,49 +272,201 @@ async def get_tours(
     return access_denied()
 
 
-@user_router.delete("/{tour_id}", response_model=Response)
-async def delete_user_tour(
+@user_router.delete("/tour", response_model=Response)
+async def delete_all_user_events(
     user_role: Role,
     user_id: int | None,
-    user_tour: UserTourDelete,
+    user_id_to_delete: int,
     session: AsyncSession = Depends(get_async_session),
 ) -> Response:
     if role_access[user_role] == role_access[Role.ADMIN]:
-        return await user_tour_response_handler.delete_by_delete_schema(
-            model_delete=user_tour, session=session
+        return await user_tour_response_handler.delete_by_user(
+            user_id=user_id_to_delete, session=session
+        )
+
+    elif role_access[user_role] == role_access[Role.USER]:
+        if check_user_ids(needed=user_id, received=user_id_to_delete):
+            return await user_tour_response_handler.delete_by_user(
+                user_id=user_id_to_delete, session=session
+            )
+
+    return access_denied()
+
+
+@user_router.post("/tour/bulk", response_model=Response)
+async def set_tour_bulk(
+    user_role: Role,
+    user_id: int | None,
+    user_tour_list: conlist(
+        UserTourCreate, min_items=1, max_items=BULK_REGISTRATION_LIMIT
+    ),
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    if await check_bulk_access(
+        user_role=user_role,
+        user_id=user_id,
+        model_list=user_tour_list,
+        get_university_ids=get_university_tour_ids,
+        target_key="tour_id",
+        session=session,
+    ):
+        return await user_tour_response_handler.bulk_create(
+            model_create_list=user_tour_list, session=session
+        )
+
+    return access_denied()
+
+
+@user_router.delete("/tour/bulk", response_model=Response)
+async def delete_user_tour_bulk(
+    user_role: Role,
+    user_id: int | None,
+    user_tour_list: conlist(
+        UserTourDelete, min_items=1, max_items=BULK_REGISTRATION_LIMIT
+    ),
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    if await check_bulk_access(
+        user_role=user_role,
+        user_id=user_id,
+        model_list=user_tour_list,
+        get_university_ids=get_university_tour_ids,
+        target_key="tour_id",
+        session=session,
+    ):
+        return await user_tour_response_handler.bulk_delete(
+            model_delete_list=user_tour_list, session=session
+        )
+
+    return access_denied()
+
+
+@user_router.post("/tour/waitlist", response_model=Response)
+async def join_tour_waitlist(
+    user_role: Role,
+    user_id: int | None,
+    user_tour: UserTourCreate,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    if role_access[user_role] == role_access[Role.ADMIN]:
+        return await user_tour_response_handler.join_waitlist(
+            model_create=user_tour, session=session
         )
+    elif role_access[user_role] == role_access[Role.USER] and user_id is not None:
+        if check_user_ids(needed=user_id, received=user_tour.user_id):
+            return await user_tour_response_handler.join_waitlist(
+                model_create=user_tour, session=session
+            )
+
+    return access_denied()
+
+
+@user_router.get("/tour/waitlist", response_model=Response)
+async def get_tour_waitlist(
+    user_role: Role,
+    user_id: int | None,
+    user_id_to_get: int | None = None,
+    tour_id: int | None = None,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    if role_access[user_role] == role_access[Role.ADMIN]:
+        if tour_id is not None:
+            return await user_tour_response_handler.get_waitlist(
+                waitlist_filter=UserTourFilter.TOUR, value=tour_id, session=session
+            )
+        elif user_id_to_get is not None:
+            return await user_tour_response_handler.get_waitlist(
+                waitlist_filter=UserTourFilter.USER,
+                value=user_id_to_get,
+                session=session,
+            )
     elif role_access[user_role] == role_access[Role.UNIVERSITY] and user_id is not None:
-        if check_university_tour(
-            user_id=user_id, tour_id=user_tour.tour_id, session=session
+        if tour_id is not None and await check_university_tour(
+            user_id=user_id, tour_id=tour_id, session=session
         ):
-            return await user_tour_response_handler.delete_by_delete_schema(
-                model_delete=user_tour, session=session
+            return await user_tour_response_handler.get_waitlist(
+                waitlist_filter=UserTourFilter.TOUR, value=tour_id, session=session
             )
+    elif role_access[user_role] == role_access[Role.USER]:
+        if check_user_ids(needed=user_id, received=user_id_to_get):
+            return await user_tour_response_handler.get_waitlist(
+                waitlist_filter=UserTourFilter.USER,
+                value=user_id_to_get,
+                session=session,
+            )
+
+    return access_denied()
+
+
+@user_router.delete("/tour/waitlist", response_model=Response)
+async def leave_tour_waitlist(
+    user_role: Role,
+    user_id: int | None,
+    user_tour: UserTourDelete,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    if role_access[user_role] == role_access[Role.ADMIN]:
+        return await user_tour_response_handler.leave_waitlist(
+            model_delete=user_tour, session=session
+        )
     elif role_access[user_role] == role_access[Role.USER] and user_id is not None:
         if check_user_ids(needed=user_id, received=user_tour.user_id):
-            return await user_tour_response_handler.delete_by_delete_schema(
+            return await user_tour_response_handler.leave_waitlist(
                 model_delete=user_tour, session=session
             )
 
     return access_denied()
 
 
-@user_router.delete("/tour", response_model=Response)
-async def delete_all_user_events(
+@user_router.delete("/{event_id}", response_model=Response)
+async def delete_user_event(
     user_role: Role,
     user_id: int | None,
-    user_id_to_delete: int,
+    user_event: UserEventDelete,
     session: AsyncSession = Depends(get_async_session),
 ) -> Response:
     if role_access[user_role] == role_access[Role.ADMIN]:
-        return await user_tour_response_handler.delete_by_user(
-            user_id=user_id_to_delete, session=session
+        return await user_event_response_handler.delete_by_delete_schema(
+            model_delete=user_event, session=session
         )
+    elif role_access[user_role] == role_access[Role.UNIVERSITY] and user_id is not None:
+        if await check_university_event(
+            user_id=user_id, event_id=user_event.event_id, session=session
+        ):
+            return await user_event_response_handler.delete_by_delete_schema(
+                model_delete=user_event, session=session
+            )
+    elif role_access[user_role] == role_access[Role.USER] and user_id is not None:
+        if check_user_ids(needed=user_id, received=user_event.user_id):
+            return await user_event_response_handler.delete_by_delete_schema(
+                model_delete=user_event, session=session
+            )
 
-    elif role_access[user_role] == role_access[Role.USER]:
-        if check_user_ids(needed=user_id, received=user_id_to_delete):
-            return await user_tour_response_handler.delete_by_user(
-                user_id=user_id_to_delete, session=session
+    return access_denied()
+
+
+@user_router.delete("/tour/{tour_id}", response_model=Response)
+async def delete_user_tour(
+    user_role: Role,
+    user_id: int | None,
+    user_tour: UserTourDelete,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    if role_access[user_role] == role_access[Role.ADMIN]:
+        return await user_tour_response_handler.delete_by_delete_schema(
+            model_delete=user_tour, session=session
+        )
+    elif role_access[user_role] == role_access[Role.UNIVERSITY] and user_id is not None:
+        if await check_university_tour(
+            user_id=user_id, tour_id=user_tour.tour_id, session=session
+        ):
+            return await user_tour_response_handler.delete_by_delete_schema(
+                model_delete=user_tour, session=session
+            )
+    elif role_access[user_role] == role_access[Role.USER] and user_id is not None:
+        if check_user_ids(needed=user_id, received=user_tour.user_id):
+            return await user_tour_response_handler.delete_by_delete_schema(
+                model_delete=user_tour, session=session
             )
 
     return access_denied()
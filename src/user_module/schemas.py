@@ -43,6 +43,12 @@ class UserEventUpdate(BaseIDModel):
     event_id: int
 
 
+class UserEventWaitlistRead(BaseIDModel):
+    user_id: int
+    event_id: int
+    position: int
+
+
 class UserTourCreate(BaseModel):
     user_id: int
     tour_id: int
@@ -63,6 +69,12 @@ class UserTourDelete(BaseModel):
     tour_id: int
 
 
+class UserTourWaitlistRead(BaseIDModel):
+    user_id: int
+    tour_id: int
+    position: int
+
+
 class EventListRead(BaseModel):
     event_id_list: list[int] = []
 
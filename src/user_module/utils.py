@@ -1,2 +1,59 @@
+import asyncio
+from typing import Awaitable, Callable
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import async_session_maker
+from src.user_module.database.user_event.user_event_query import UserEventQuery
+from src.user_module.database.user_tour.user_tour_query import UserTourQuery
+from src.utils import Role, role_access
+
+
 def check_user_ids(needed: int, received: int):
     return needed == received
+
+
+async def check_bulk_access(
+    user_role: Role,
+    user_id: int | None,
+    model_list: list,
+    get_university_ids: Callable[..., Awaitable[set[int]]],
+    target_key: str,
+    session: AsyncSession,
+) -> bool:
+    if role_access[user_role] == role_access[Role.ADMIN]:
+        return True
+    if user_id is None:
+        return False
+    if role_access[user_role] == role_access[Role.UNIVERSITY]:
+        university_id_set = await get_university_ids(user_id=user_id, session=session)
+        return all(
+            getattr(model, target_key) in university_id_set for model in model_list
+        )
+    if role_access[user_role] == role_access[Role.USER]:
+        return all(
+            check_user_ids(needed=user_id, received=model.user_id)
+            for model in model_list
+        )
+    return False
+
+
+async def reconcile_registered_counts(session: AsyncSession) -> None:
+    for query in (UserEventQuery(), UserTourQuery()):
+        reconciled_count = await query.reconcile_registered_count(session=session)
+        if reconciled_count > 0:
+            logger.warning(
+                f"Reconciled registered_count of {reconciled_count} "
+                f"{query._target_model.__tablename__} rows"
+            )
+
+
+async def run_registration_reconciler(interval: int) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with async_session_maker() as session:
+                await reconcile_registered_counts(session=session)
+        except Exception as e:
+            logger.error(str(e))
@@ -1,7 +1,13 @@
+import sys
 from enum import Enum
 
+from fastapi.exceptions import RequestValidationError
 from loguru import logger
+from pydantic.error_wrappers import ErrorWrapper
 
+from src.config import LOG_FILE, LOG_LEVEL, LOG_SAMPLING_LIMIT, LOG_SAMPLING_WINDOW
+from src.monitoring.log_sampler import LogSampler
+from src.monitoring.tracing import add_trace_id
 from src.schemas import Response
 
 
@@ -28,15 +34,51 @@ def access_denied() -> Response:
     )
 
 
-logger.add(
-    "education_tour.log",
-    format="{time}\t|\t{level}\t|\t{message}",
-    level="INFO",
-    rotation="10MB",
-    compression="zip",
+def check_location(
+    latitude: float | None, longitude: float | None, radius_km: float | None
+) -> None:
+    location = {"latitude": latitude, "longitude": longitude, "radius_km": radius_km}
+    missing = [name for name, value in location.items() if value is None]
+    if 0 < len(missing) < len(location):
+        raise RequestValidationError(
+            [
+                ErrorWrapper(
+                    ValueError("Координаты и радиус поиска указываются вместе"),
+                    loc=("query", name),
+                )
+                for name in missing
+            ]
+        )
+
+
+logger.configure(
+    handlers=[
+        {
+            "sink": sys.stderr,
+            "level": LOG_LEVEL,
+            "enqueue": True,
+            "filter": LogSampler(window=LOG_SAMPLING_WINDOW, limit=LOG_SAMPLING_LIMIT),
+        },
+        {
+            "sink": LOG_FILE,
+            "level": LOG_LEVEL,
+            "serialize": True,
+            "enqueue": True,
+            "rotation": "10MB",
+            "compression": "zip",
+            "filter": LogSampler(window=LOG_SAMPLING_WINDOW, limit=LOG_SAMPLING_LIMIT),
+        },
+    ],
+    extra={"trace_id": ""},
+    patcher=add_trace_id,
 )
 
 
+class SortOrder(Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
 class Role(Enum):
     GUEST = "0"
     USER = "1"
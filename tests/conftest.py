@@ -1,6 +1,13 @@
 import asyncio
+import os
+import tempfile
 from typing import AsyncGenerator
 
+# Keep test runs out of the application log
+os.environ.setdefault(
+    "LOG_FILE", os.path.join(tempfile.gettempdir(), "education_tour_test.log")
+)
+
 import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
@@ -16,12 +23,14 @@ from src.config import (
     TEST_DB_USER,
 )
 from src.database import get_async_session, metadata
+from src.database_utils.query_counter import install_query_counter
 from src.main import app
 
 # DATABASE
 TEST_DATABASE_URL = f"postgresql+asyncpg://{TEST_DB_USER}:{TEST_DB_PASSWORD}@{TEST_DB_HOST}:{TEST_DB_PORT}/{TEST_DB_NAME}"
 
 engine_test = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+install_query_counter(engine=engine_test.sync_engine)
 async_session_maker = sessionmaker(
     engine_test, class_=AsyncSession, expire_on_commit=False
 )
@@ -0,0 +1,70 @@
+from src.autocomplete.autocomplete_index import AutocompleteIndex
+from src.autocomplete.autocomplete_models import AutocompleteSource
+from src.event_module.database.event_tag.event_tag_responses import (
+    EventTagResponseHandler,
+)
+from src.event_module.schemas import EventTagUpdate
+
+SOURCE = AutocompleteSource.TAG
+
+
+def make_index() -> AutocompleteIndex:
+    index = AutocompleteIndex(queries={}, ttl=300)
+    index.build(
+        source=SOURCE,
+        schemas=[{"id": 1, "name": "Открытый урок"}, {"id": 2, "name": "Экскурсия"}],
+    )
+    return index
+
+
+def test_put_replaces_entries_in_place():
+    index = make_index()
+
+    index.put(source=SOURCE, model_id=1, name="Лекция")
+    index.put(source=SOURCE, model_id=3, name="Открытая лекция")
+
+    assert index.search(source=SOURCE, prefix="откр", limit=10) == [
+        {"id": 3, "name": "Открытая лекция"}
+    ]
+    assert index.search(source=SOURCE, prefix="лек", limit=10) == [
+        {"id": 1, "name": "Лекция"},
+        {"id": 3, "name": "Открытая лекция"},
+    ]
+    assert index.is_fresh(source=SOURCE)
+
+
+def test_remove_drops_entries():
+    index = make_index()
+
+    index.remove(source=SOURCE, model_id=2)
+
+    assert index.search(source=SOURCE, prefix="экс", limit=10) == []
+    assert index.search(source=SOURCE, prefix="урок", limit=10) == [
+        {"id": 1, "name": "Открытый урок"}
+    ]
+
+
+def test_put_autocomplete_ignores_handlers_without_source():
+    EventTagResponseHandler()._put_autocomplete(
+        model_update=EventTagUpdate(id=1, event_id=1, tag_id=1)
+    )
+
+
+def test_apply_change_of_another_worker():
+    index = make_index()
+
+    index.apply_change(
+        payload='{"source": "tag", "operation": "UPDATE", "id": 2, "name": "Лекция"}'
+    )
+    index.apply_change(payload='{"source": "tag", "operation": "DELETE", "id": 1}')
+    index.apply_change(payload='{"source": "event", "operation": "DELETE", "id": 2}')
+
+    assert index.search(source=SOURCE, prefix="", limit=10) == [
+        {"id": 2, "name": "Лекция"}
+    ]
+    assert index.is_fresh(source=SOURCE)
+
+    # Too long names are not notified, the whole source is reloaded instead
+    index.apply_change(payload='{"source": "tag", "operation": "INSERT", "id": 3}')
+
+    assert not index.is_fresh(source=SOURCE)
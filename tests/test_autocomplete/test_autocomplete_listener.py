@@ -0,0 +1,59 @@
+import asyncio
+import time
+from contextlib import suppress
+from typing import Callable
+
+from sqlalchemy import delete, insert, update
+
+from src.autocomplete.autocomplete_index import AutocompleteIndex
+from src.autocomplete.autocomplete_listener import run_autocomplete_listener
+from src.autocomplete.autocomplete_models import AutocompleteSource
+from src.event_module.database.tag.tag_query import TagQuery
+from src.event_module.models import Tag
+from tests.conftest import async_session_maker, engine_test
+
+SOURCE = AutocompleteSource.TAG
+# An explicit id keeps the sequence, and so the ids of the other tests, intact
+TAG_ID = 100000
+
+
+async def wait_for(condition: Callable[[], bool], timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.05)
+
+
+async def execute(statement) -> None:
+    async with async_session_maker() as session:
+        await session.execute(statement)
+        await session.commit()
+
+
+async def test_listener_applies_changes_committed_elsewhere():
+    index = AutocompleteIndex(queries={SOURCE: TagQuery()}, ttl=300)
+    index.build(source=SOURCE, schemas=[])
+    listener = asyncio.create_task(
+        run_autocomplete_listener(engine=engine_test, index=index, retry_interval=1)
+    )
+    try:
+        # The index is invalidated once the listener is subscribed
+        await wait_for(lambda: not index.is_fresh(source=SOURCE))
+        index.build(source=SOURCE, schemas=[])
+
+        await execute(insert(Tag).values(id=TAG_ID, name="Слушатель"))
+        await wait_for(lambda: index.search(source=SOURCE, prefix="слуш", limit=10))
+
+        await execute(update(Tag).where(Tag.id == TAG_ID).values(name="Наблюдатель"))
+        await wait_for(lambda: index.search(source=SOURCE, prefix="набл", limit=10))
+        assert index.search(source=SOURCE, prefix="слуш", limit=10) == []
+
+        await execute(delete(Tag).where(Tag.id == TAG_ID))
+        await wait_for(
+            lambda: index.search(source=SOURCE, prefix="набл", limit=10) == []
+        )
+        assert index.is_fresh(source=SOURCE)
+    finally:
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
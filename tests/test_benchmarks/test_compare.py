@@ -0,0 +1,14 @@
+from benchmarks.micro.compare import compare
+
+
+def test_compare_flags_regressions_over_threshold():
+    baseline = {"test_return_json": 1.0, "test_jsonable_encoder": 1.0}
+    results = {
+        "test_return_json": 1.2,
+        "test_jsonable_encoder": 1.5,
+        "test_new_benchmark": 1.0,
+    }
+
+    assert compare(results=results, baseline=baseline, threshold=0.25) == [
+        "test_jsonable_encoder"
+    ]
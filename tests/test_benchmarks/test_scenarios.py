@@ -0,0 +1,20 @@
+from benchmarks.scenarios import Recorder, summarize
+
+
+def test_summarize_reports_percentiles_per_endpoint():
+    recorder = Recorder()
+    recorder.latencies["GET /event/"] = [i / 1000 for i in range(1, 101)]
+    recorder.errors["POST /user/event"] += 1
+
+    summary = summarize(recorder=recorder, elapsed=10)
+
+    assert summary["GET /event/"] == {
+        "requests": 100,
+        "errors": 0,
+        "rps": 10.0,
+        "p50_ms": 50.0,
+        "p95_ms": 95.0,
+        "p99_ms": 99.0,
+    }
+    assert summary["POST /user/event"]["requests"] == 0
+    assert summary["POST /user/event"]["p99_ms"] is None
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import Table, UniqueConstraint
+
+from src.event_module.database.event_tag.event_tag_query import EventTagQuery
+from src.tour_module.database.tour_event.tour_event_query import TourEventQuery
+from src.university_module.database.university_event.university_event_query import (
+    UniversityEventQuery,
+)
+from src.university_module.database.university_tour.university_tour_query import (
+    UniversityTourQuery,
+)
+from src.user_module.database.user_event.user_event_query import UserEventQuery
+from src.user_module.database.user_tour.user_tour_query import UserTourQuery
+from src.user_module.database.user_university.user_university_query import (
+    UserUniversityQuery,
+)
+
+LINK_QUERIES = [
+    EventTagQuery,
+    TourEventQuery,
+    UniversityEventQuery,
+    UniversityTourQuery,
+    UserEventQuery,
+    UserTourQuery,
+    UserUniversityQuery,
+]
+
+
+def get_leading_columns(table: Table) -> set[str]:
+    leading_columns = set()
+    for index in table.indexes:
+        if len(index.columns) > 0:
+            leading_columns.add(list(index.columns)[0].name)
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint) and len(constraint.columns) > 0:
+            leading_columns.add(list(constraint.columns)[0].name)
+    return leading_columns
+
+
+@pytest.mark.parametrize("query_class", LINK_QUERIES)
+def test_dependency_fields_are_index_covered(query_class):
+    table = query_class._model.__table__
+    leading_columns = get_leading_columns(table=table)
+    for dependency_field in query_class.dependency_fields.values():
+        assert dependency_field.key in leading_columns, (
+            f"{table.name}.{dependency_field.key} is not the leading column "
+            f"of any index"
+        )
@@ -0,0 +1,37 @@
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from src.database_utils.migrations import get_alembic_config, is_up_to_date
+from tests.conftest import engine_test
+
+
+def stamp_head(connection) -> None:
+    script_directory = ScriptDirectory.from_config(get_alembic_config())
+    MigrationContext.configure(connection).stamp(script_directory, "heads")
+
+
+async def test_readiness_waits_for_migrations(ac: AsyncClient):
+    assert (await ac.get("/health/live")).status_code == 200
+    assert (await ac.get("/health/ready")).status_code == 503
+
+    async with engine_test.begin() as connection:
+        await connection.run_sync(stamp_head)
+    try:
+        assert (await ac.get("/health/ready")).status_code == 200
+    finally:
+        async with engine_test.begin() as connection:
+            await connection.execute(text("DROP TABLE alembic_version"))
+
+
+def test_newer_revision_counts_as_up_to_date():
+    script_directory = ScriptDirectory.from_config(get_alembic_config())
+    head, previous = [
+        revision.revision for revision in script_directory.walk_revisions()
+    ][:2]
+
+    assert not is_up_to_date(current=frozenset())
+    assert not is_up_to_date(current=frozenset({previous}))
+    assert is_up_to_date(current=frozenset({head}))
+    assert is_up_to_date(current=frozenset({"revision_of_a_newer_build"}))
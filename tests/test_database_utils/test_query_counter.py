@@ -0,0 +1,19 @@
+from sqlalchemy import create_engine, text
+
+from src.config import REPEATED_QUERY_THRESHOLD
+from src.database_utils.query_counter import install_query_counter, start_query_stats
+
+
+def test_query_counter_flags_repeated_statements():
+    engine = create_engine("sqlite://")
+    install_query_counter(engine=engine)
+    query_stats = start_query_stats()
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        for value in range(REPEATED_QUERY_THRESHOLD):
+            connection.execute(text("SELECT :value"), {"value": value})
+
+    assert query_stats.count == REPEATED_QUERY_THRESHOLD + 1
+    assert query_stats.get_headers()["X-DB-Query-Count"] == str(query_stats.count)
+    assert list(query_stats.get_repeated().values()) == [REPEATED_QUERY_THRESHOLD]
@@ -64,6 +64,8 @@ EVENTS_READ = [
             corps=1,
             level=1,
         ).dict(),
+        "image": None,
+        "registered_count": 0,
     },
     {
         "id": 2,
@@ -83,6 +85,8 @@ EVENTS_READ = [
             level=2,
             office=202,
         ).dict(),
+        "image": None,
+        "registered_count": 0,
     },
 ]
 
@@ -1,16 +1,23 @@
 from httpx import AsyncClient
 
+from src.autocomplete.text.autocomplete_message import AutocompleteMessage
 from src.event_module.database.category.text.category_message import CategoryMessage
 from src.event_module.schemas import CategoryRead
 from src.schemas import Response
-from src.utils import Status, return_json
+from src.utils import Role, Status, return_json
 from tests.test_event_module.constants.category_constants import CATEGORIES
 
 category_message = CategoryMessage()
+autocomplete_message = AutocompleteMessage()
 
 
 async def test_create_category(ac: AsyncClient):
-    json = (await ac.post("/event/category/", json={"name": CATEGORIES[0].name})).json()
+    json = (
+        await ac.post(
+            f"/api/v1/category/?user_role={Role.ADMIN.value}",
+            json={"name": CATEGORIES[0].name},
+        )
+    ).json()
     response = Response(
         status=json["status"],
         message=json["message"],
@@ -24,7 +31,7 @@ async def test_create_category(ac: AsyncClient):
 
 
 async def test_get_all_categories(ac: AsyncClient):
-    json = (await ac.get("/event/category/")).json()
+    json = (await ac.get("/api/v1/category/")).json()
     response = Response(
         status=json["status"],
         message=json["message"],
@@ -35,7 +42,7 @@ async def test_get_all_categories(ac: AsyncClient):
 
 
 async def test_get_category_by_id(ac: AsyncClient):
-    json = (await ac.get(f"/event/category/{CATEGORIES[0].id}")).json()
+    json = (await ac.get(f"/api/v1/category/{CATEGORIES[0].id}")).json()
     response = Response(
         status=json["status"],
         message=json["message"],
@@ -58,7 +65,7 @@ async def test_get_category_by_id(ac: AsyncClient):
 async def test_update_category(ac: AsyncClient):
     json = (
         await ac.put(
-            f"/event/category/{CATEGORIES[0].id}",
+            f"/api/v1/category/{CATEGORIES[0].id}?user_role={Role.ADMIN.value}",
             json={"id": CATEGORIES[0].id, "name": CATEGORIES[0].name},
         )
     ).json()
@@ -73,16 +80,36 @@ async def test_update_category(ac: AsyncClient):
         message=category_message.get("update_success").format(id=CATEGORIES[0].id),
     )
 
-    get_json = (await ac.get(f"/event/category/{CATEGORIES[0].id}")).json()
+    get_json = (await ac.get(f"/api/v1/category/{CATEGORIES[0].id}")).json()
     updated_name = get_json["data"]["category"]["name"]
 
     assert response == correct_response and updated_name == CATEGORIES[0].name
 
 
+async def test_autocomplete_category(ac: AsyncClient):
+    json = (await ac.get("/api/v1/autocomplete/category?q=откр")).json()
+    response = Response(
+        status=json["status"],
+        message=json["message"],
+        data=json["data"],
+        details=json["details"],
+    )
+    correct_response = return_json(
+        status=Status.SUCCESS,
+        message=autocomplete_message.get("search_success").format(text="откр"),
+        data={
+            "suggestions_count": 1,
+            "suggestions": [{"id": CATEGORIES[0].id, "name": CATEGORIES[0].name}],
+        },
+    )
+
+    assert response == correct_response
+
+
 async def test_delete_category(ac: AsyncClient):
     json = (
         await ac.delete(
-            f"/event/category/{CATEGORIES[0].id}",
+            f"/api/v1/category/{CATEGORIES[0].id}?user_role={Role.ADMIN.value}",
         )
     ).json()
     response = Response(
@@ -96,7 +123,7 @@ async def test_delete_category(ac: AsyncClient):
         message=category_message.get("delete_success").format(id=CATEGORIES[0].id),
     )
 
-    get_json = (await ac.get(f"/event/category/")).json()
+    get_json = (await ac.get("/api/v1/category/")).json()
     categories_count = get_json["data"]["categories_count"]
 
     assert response == correct_response and categories_count == 0
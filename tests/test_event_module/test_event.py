@@ -1,8 +1,13 @@
 from httpx import AsyncClient
 
+from src.event_module.database.event.text.event_details import EventDetails
 from src.event_module.database.event.text.event_message import EventMessage
 from src.schemas import Response
-from src.utils import Status, return_json
+from src.user_module.database.user_event.text.user_event_details import UserEventDetails
+from src.user_module.database.user_event.text.user_event_messages import (
+    UserEventMessage,
+)
+from src.utils import Role, Status, return_json
 from tests.test_event_module.constants.event_constants import (
     CATEGORIES,
     EVENTS_CREATE,
@@ -11,12 +16,25 @@ from tests.test_event_module.constants.event_constants import (
 )
 
 event_message = EventMessage()
+event_details = EventDetails()
+user_event_message = UserEventMessage()
+user_event_details = UserEventDetails()
 
 
 async def test_create_event(ac: AsyncClient):
-    await ac.post("/event/category/", json={"name": CATEGORIES[0].name})
-    await ac.post("/event/category/", json={"name": CATEGORIES[1].name})
-    json = (await ac.post("/event/", json=EVENTS_CREATE[0])).json()
+    await ac.post(
+        f"/api/v1/category/?user_role={Role.ADMIN.value}",
+        json={"name": CATEGORIES[0].name},
+    )
+    await ac.post(
+        f"/api/v1/category/?user_role={Role.ADMIN.value}",
+        json={"name": CATEGORIES[1].name},
+    )
+    json = (
+        await ac.post(
+            f"/api/v1/event/?user_role={Role.ADMIN.value}", json=EVENTS_CREATE[0]
+        )
+    ).json()
     response = Response(
         status=json["status"],
         message=json["message"],
@@ -30,8 +48,8 @@ async def test_create_event(ac: AsyncClient):
 
 
 async def test_get_all_events(ac: AsyncClient):
-    await ac.post("/event/", json=EVENTS_CREATE[1])
-    json = (await ac.get("/event/")).json()
+    await ac.post(f"/api/v1/event/?user_role={Role.ADMIN.value}", json=EVENTS_CREATE[1])
+    json = (await ac.get("/api/v1/event/")).json()
     response = Response(
         status=json["status"],
         message=json["message"],
@@ -42,7 +60,7 @@ async def test_get_all_events(ac: AsyncClient):
 
 
 async def test_get_event_by_id(ac: AsyncClient):
-    json = (await ac.get(f"/event/{EVENTS_READ[1]['id']}")).json()
+    json = (await ac.get(f"/api/v1/event/{EVENTS_READ[1]['id']}")).json()
     response = Response(
         status=json["status"],
         message=json["message"],
@@ -58,9 +76,273 @@ async def test_get_event_by_id(ac: AsyncClient):
     assert response == correct_response
 
 
+async def test_get_events_with_fields(ac: AsyncClient):
+    json = (await ac.get("/api/v1/event/?fields=name&fields=date_start")).json()
+    response = Response(
+        status=json["status"],
+        message=json["message"],
+        data=json["data"],
+        details=json["details"],
+    )
+    correct_response = return_json(
+        status=Status.SUCCESS,
+        message=event_message.get("get_all_success"),
+        data={
+            "events_count": 2,
+            "events": [
+                {
+                    "id": event["id"],
+                    "name": event["name"],
+                    "date_start": event["date_start"],
+                }
+                for event in EVENTS_READ
+            ],
+        },
+    )
+
+    assert response == correct_response
+
+
+async def test_get_events_by_ids(ac: AsyncClient):
+    json = (await ac.get("/api/v1/event/batch?ids=2&ids=1&ids=99")).json()
+    response = Response(
+        status=json["status"],
+        message=json["message"],
+        data=json["data"],
+        details=json["details"],
+    )
+    correct_response = return_json(
+        status=Status.SUCCESS,
+        message=event_message.get("get_all_success"),
+        data={
+            "events_count": 2,
+            "events": [EVENTS_READ[1], EVENTS_READ[0]],
+            "missing_events": [99],
+        },
+    )
+
+    assert response == correct_response
+
+
+async def test_get_event_with_include(ac: AsyncClient):
+    json = (
+        await ac.get(
+            f"/api/v1/event/{EVENTS_READ[1]['id']}?include=tags&include=registrations_count"
+        )
+    ).json()
+    response = Response(
+        status=json["status"],
+        message=json["message"],
+        data=json["data"],
+        details=json["details"],
+    )
+    correct_response = return_json(
+        status=Status.SUCCESS,
+        message=event_message.get("get_one_success").format(id=EVENTS_READ[1]["id"]),
+        data={"event": {**EVENTS_READ[1], "tags": [], "registrations_count": 0}},
+    )
+
+    assert response == correct_response
+
+
+async def test_get_events_by_date_range(ac: AsyncClient):
+    json = (
+        await ac.get("/api/v1/event/?date_from=2023-08-01T00:00:00&date_sort=asc")
+    ).json()
+    response = Response(
+        status=json["status"],
+        message=json["message"],
+        data=json["data"],
+        details=json["details"],
+    )
+    correct_response = return_json(
+        status=Status.SUCCESS,
+        message=event_message.get("get_all_success"),
+        data={"events_count": 1, "events": [EVENTS_READ[0]]},
+    )
+
+    assert response == correct_response
+
+
+async def test_search_events(ac: AsyncClient):
+    json = (await ac.get("/api/v1/event/search?q=наук")).json()
+    response = Response(
+        status=json["status"],
+        message=json["message"],
+        data=json["data"],
+        details=json["details"],
+    )
+    correct_response = return_json(
+        status=Status.SUCCESS,
+        message=event_message.get("search_success").format(text="наук"),
+        data={"events_count": 1, "events": [EVENTS_READ[1]]},
+    )
+
+    assert response == correct_response
+
+
+async def test_get_events_by_location_without_coordinates(ac: AsyncClient):
+    json = (
+        await ac.get("/api/v1/event/?latitude=59.9&longitude=30.48&radius_km=10")
+    ).json()
+    response = Response(
+        status=json["status"],
+        message=json["message"],
+        data=json["data"],
+        details=json["details"],
+    )
+    correct_response = return_json(
+        status=Status.SUCCESS,
+        message=event_message.get("get_all_success"),
+        data={"events_count": 0, "events": []},
+    )
+
+    assert response == correct_response
+
+
+async def test_get_events_by_city(ac: AsyncClient):
+    json = (await ac.get("/api/v1/event/?city=санкт-петербург&country=Россия")).json()
+    response = Response(
+        status=json["status"],
+        message=json["message"],
+        data=json["data"],
+        details=json["details"],
+    )
+    correct_response = return_json(
+        status=Status.SUCCESS,
+        message=event_message.get("get_all_success"),
+        data={"events_count": 2, "events": EVENTS_READ},
+    )
+
+    assert response == correct_response
+
+
+async def test_register_user_after_deadline(ac: AsyncClient):
+    json = (
+        await ac.post(
+            f"/api/v1/user/event?user_role={Role.ADMIN.value}&user_id=1",
+            json={"user_id": 1, "event_id": EVENTS_READ[0]["id"]},
+        )
+    ).json()
+    response = Response(
+        status=json["status"],
+        message=json["message"],
+        data=json["data"],
+        details=json["details"],
+    )
+    correct_response = return_json(
+        status=Status.ERROR,
+        message=user_event_message.get("create_error"),
+        details=user_event_details.get("registration_closed"),
+    )
+
+    assert response == correct_response
+
+
+async def test_get_empty_event_waitlist(ac: AsyncClient):
+    json = (
+        await ac.get(
+            f"/api/v1/user/event/waitlist?user_role={Role.ADMIN.value}&user_id=1&event_id={EVENTS_READ[1]['id']}"
+        )
+    ).json()
+    response = Response(
+        status=json["status"],
+        message=json["message"],
+        data=json["data"],
+        details=json["details"],
+    )
+    correct_response = return_json(
+        status=Status.SUCCESS,
+        message=user_event_message.get("waitlist_get_success"),
+        data={"waitlist_count": 0, "waitlist": []},
+    )
+
+    assert response == correct_response
+
+
+async def test_bulk_register_users(ac: AsyncClient):
+    user_event_list = [
+        {"user_id": 1, "event_id": EVENTS_READ[0]["id"]},
+        {"user_id": 2, "event_id": 0},
+    ]
+    json = (
+        await ac.post(
+            f"/api/v1/user/event/bulk?user_role={Role.ADMIN.value}&user_id=1",
+            json=user_event_list,
+        )
+    ).json()
+    response = Response(
+        status=json["status"],
+        message=json["message"],
+        data=json["data"],
+        details=json["details"],
+    )
+    correct_response = return_json(
+        status=Status.SUCCESS,
+        message=user_event_message.get("bulk_create_success"),
+        data={
+            "success_count": 0,
+            "results": [
+                {
+                    **user_event_list[0],
+                    "result": "registration_closed",
+                    "details": user_event_details.get("registration_closed"),
+                },
+                {
+                    **user_event_list[1],
+                    "result": "registration_not_found",
+                    "details": user_event_details.get("registration_not_found"),
+                },
+            ],
+        },
+    )
+
+    assert response == correct_response
+
+
+async def test_export_users_by_event(ac: AsyncClient):
+    response = await ac.get(
+        f"/api/v1/event/0/user/export?user_role={Role.ADMIN.value}&export_format=csv"
+    )
+
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.text.splitlines() == ["id,user_id,event_id"]
+
+
+async def test_import_events_with_invalid_row(ac: AsyncClient):
+    content = (
+        "name,description,date_start,date_end,reg_deadline,max_users,address.city\n"
+        ",Описание,2030-01-01T10:00:00,2030-01-01T12:00:00,2029-12-31T10:00:00,10,"
+        "Москва\n"
+    )
+    json = (
+        await ac.post(
+            f"/api/v1/event/import?user_role={Role.ADMIN.value}&import_format=csv",
+            files={"file": ("events.csv", content.encode(), "text/csv")},
+        )
+    ).json()
+    response = Response(
+        status=json["status"],
+        message=json["message"],
+        data=json["data"],
+        details=json["details"],
+    )
+    correct_response = return_json(
+        status=Status.ERROR,
+        message=event_message.get("import_error"),
+        data={
+            "imported_events_count": 0,
+            "import_errors": [{"row": 2, "errors": ["name: field required"]}],
+        },
+        details=event_details.get("import_invalid_rows"),
+    )
+
+    assert response == correct_response
+
+
 async def test_get_events_by_category(ac: AsyncClient):
     json = (
-        await ac.get(f"/event/category_filter/{EVENTS_READ[1]['category_id']}")
+        await ac.get(f"/api/v1/event/?category_list={EVENTS_READ[1]['category_id']}")
     ).json()
     response = Response(
         status=json["status"],
@@ -70,9 +352,7 @@ async def test_get_events_by_category(ac: AsyncClient):
     )
     correct_response = return_json(
         status=Status.SUCCESS,
-        message=event_message.get("get_by_category_success").format(
-            id=EVENTS_READ[1]["category_id"]
-        ),
+        message=event_message.get("get_all_success"),
         data={"events_count": 1, "events": [EVENTS_READ[1]]},
     )
 
@@ -82,7 +362,7 @@ async def test_get_events_by_category(ac: AsyncClient):
 async def test_get_events_by_categories(ac: AsyncClient):
     json = (
         await ac.get(
-            f"/event/category_filter/?category_list={EVENTS_READ[0]['category_id']}&category_list={EVENTS_READ[1]['category_id']}"
+            f"/api/v1/event/?category_list={EVENTS_READ[0]['category_id']}&category_list={EVENTS_READ[1]['category_id']}"
         )
     ).json()
 
@@ -94,9 +374,7 @@ async def test_get_events_by_categories(ac: AsyncClient):
     )
     correct_response = return_json(
         status=Status.SUCCESS,
-        message=event_message.get("get_by_category_success").format(
-            id=[EVENTS_READ[0]["category_id"], EVENTS_READ[1]["category_id"]]
-        ),
+        message=event_message.get("get_all_success"),
         data={"events_count": 2, "events": EVENTS_READ},
     )
 
@@ -106,7 +384,7 @@ async def test_get_events_by_categories(ac: AsyncClient):
 async def test_update_event(ac: AsyncClient):
     json = (
         await ac.put(
-            f"/event/{EVENTS_UPDATE[0]['id']}",
+            f"/api/v1/event/{EVENTS_UPDATE[0]['id']}?user_role={Role.ADMIN.value}",
             json=EVENTS_UPDATE[0],
         )
     ).json()
@@ -121,7 +399,7 @@ async def test_update_event(ac: AsyncClient):
         message=event_message.get("update_success").format(id=EVENTS_UPDATE[0]["id"]),
     )
 
-    get_json = (await ac.get(f"/event/{EVENTS_UPDATE[0]['id']}")).json()
+    get_json = (await ac.get(f"/api/v1/event/{EVENTS_UPDATE[0]['id']}")).json()
     updated_name = get_json["data"]["event"]["name"]
 
     assert response == correct_response and updated_name == EVENTS_UPDATE[0]["name"]
@@ -130,7 +408,7 @@ async def test_update_event(ac: AsyncClient):
 async def test_delete_event(ac: AsyncClient):
     json = (
         await ac.delete(
-            f"/event/{EVENTS_READ[0]['id']}",
+            f"/api/v1/event/{EVENTS_READ[0]['id']}?user_role={Role.ADMIN.value}",
         )
     ).json()
     response = Response(
@@ -145,17 +423,17 @@ async def test_delete_event(ac: AsyncClient):
     )
 
     await ac.delete(
-        f"/event/{EVENTS_READ[1]['id']}",
+        f"/api/v1/event/{EVENTS_READ[1]['id']}?user_role={Role.ADMIN.value}",
     )
 
     await ac.delete(
-        f"/event/category/{CATEGORIES[0].id}",
+        f"/api/v1/category/{CATEGORIES[0].id}?user_role={Role.ADMIN.value}",
     )
     await ac.delete(
-        f"/event/category/{CATEGORIES[1].id}",
+        f"/api/v1/category/{CATEGORIES[1].id}?user_role={Role.ADMIN.value}",
     )
 
-    get_json = (await ac.get(f"/event/")).json()
+    get_json = (await ac.get("/api/v1/event/")).json()
     events_count = get_json["data"]["events_count"]
 
     assert response == correct_response and events_count == 0
@@ -0,0 +1,21 @@
+from loguru import logger
+
+from src.monitoring.log_sampler import LogSampler
+
+
+def test_log_sampler_drops_repeated_errors():
+    records = []
+    sampler = LogSampler(window=60, limit=2)
+    handler_id = logger.add(records.append, filter=sampler, format="{message}")
+    try:
+        for _ in range(5):
+            logger.error("database is unavailable")
+        logger.info("request served")
+    finally:
+        logger.remove(handler_id)
+
+    assert [record.strip() for record in records] == [
+        "database is unavailable",
+        "database is unavailable",
+        "request served",
+    ]
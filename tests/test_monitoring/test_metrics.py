@@ -0,0 +1,27 @@
+from httpx import AsyncClient
+
+from src.monitoring import middleware
+from src.monitoring.slow_requests import SlowRequestLog
+from src.utils import Role
+
+
+async def test_metrics_expose_route_latency(ac: AsyncClient):
+    await ac.get("/metrics")
+    response = await ac.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/metrics",'
+        'status="200"}'
+    ) in response.text
+
+
+async def test_streamed_export_queries_are_counted(ac: AsyncClient, monkeypatch):
+    slow_request_log = SlowRequestLog(threshold_ms=0, history=1)
+    monkeypatch.setattr(middleware, "slow_request_log", slow_request_log)
+
+    await ac.get(f"/api/v1/event/0/user/export?user_role={Role.ADMIN.value}")
+
+    [request] = slow_request_log.get_all()["GET /api/v1/event/{event_id}/user/export"]
+    assert request["query_count"] == 1
@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+from src.database_utils.query_counter import QueryStats
+from src.monitoring.profiler import SamplingProfiler, to_folded
+from src.monitoring.slow_requests import SlowRequestLog
+
+
+def busy_loop(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+async def test_profiler_collects_folded_stacks():
+    async def work():
+        await asyncio.sleep(0)
+        busy_loop(seconds=0.2)
+
+    task = asyncio.create_task(work())
+    stacks = await SamplingProfiler().profile(seconds=0.3, interval=0.005)
+    await task
+
+    folded = to_folded(stacks=stacks)
+    assert "busy_loop" in folded
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in folded.splitlines())
+
+
+def test_slow_request_log_keeps_queries():
+    query_stats = QueryStats()
+    query_stats.add(statement="SELECT 1", duration=0.5)
+    slow_request_log = SlowRequestLog(threshold_ms=100, history=1)
+
+    slow_request_log.observe(
+        method="GET", route="/event", duration=0.05, query_stats=query_stats
+    )
+    assert slow_request_log.get_all() == {}
+
+    for _ in range(2):
+        slow_request_log.observe(
+            method="GET", route="/event", duration=0.6, query_stats=query_stats
+        )
+    slow_requests = slow_request_log.get_all()["GET /event"]
+    assert len(slow_requests) == 1
+    assert slow_requests[0]["queries"] == [
+        {"statement": "SELECT 1", "duration_ms": 500.0}
+    ]
@@ -0,0 +1,15 @@
+from httpx import AsyncClient
+
+from src.monitoring.tracing import TRACE_ID_HEADER, TRACEPARENT_HEADER
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+async def test_trace_id_is_propagated(ac: AsyncClient):
+    response = await ac.get(
+        "/metrics",
+        headers={TRACEPARENT_HEADER: f"00-{TRACE_ID}-00f067aa0ba902b7-01"},
+    )
+
+    assert response.headers[TRACE_ID_HEADER] == TRACE_ID
+    assert response.headers[TRACEPARENT_HEADER].startswith(f"00-{TRACE_ID}-")
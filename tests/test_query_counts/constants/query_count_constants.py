@@ -0,0 +1,446 @@
+import json
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from src.utils import Role
+
+ADMIN = {"user_role": Role.ADMIN.value, "user_id": 1}
+UNIVERSITY_ADMIN = {"user_role": Role.UNIVERSITY.value, "user_id": 1}
+FEED_SIZE = 5
+USERS_PER_EVENT = 3
+DATE_START = (datetime.utcnow() + timedelta(days=30)).replace(microsecond=0)
+ADDRESS = {"country": "Россия", "city": "Москва", "street": "Тверская", "house": 1}
+
+EVENT = {
+    "name": "День открытых дверей",
+    "description": "Экскурсия по кампусу",
+    "date_start": DATE_START.isoformat(),
+    "date_end": (DATE_START + timedelta(hours=3)).isoformat(),
+    "reg_deadline": (DATE_START - timedelta(days=1)).isoformat(),
+    "max_users": 100,
+    "category_id": "{category}",
+    "address": ADDRESS,
+}
+TOUR = {key: value for key, value in EVENT.items() if key != "category_id"}
+UNIVERSITY = {
+    "name": "Университет",
+    "url": "https://example.com",
+    "phone": "+7 000 000-00-00",
+    "email": "university@example.com",
+    "address": ADDRESS,
+    "description": "Описание",
+    "reg_date": DATE_START,
+}
+IMPORT_CSV = (
+    "name,description,date_start,date_end,reg_deadline,max_users,category_id,"
+    "address.city\n"
+    f'Импорт,Описание,{EVENT["date_start"]},{EVENT["date_end"]},'
+    f'{EVENT["reg_deadline"]},10,{{category}},Москва\n'
+)
+
+IMPORT_JSONL = json.dumps(TOUR, ensure_ascii=False) + "\n"
+
+
+class QueryCountCase(NamedTuple):
+    method: str
+    url: str
+    max_queries: int
+    max_commits: int
+    params: dict | None = None
+    json: dict | list | None = None
+    files: dict | None = None
+
+
+# Placeholders in braces are replaced with the ids of the seeded rows. The
+# cases run in order, so the writes only touch rows nothing later relies on.
+QUERY_COUNT_CASES = {
+    # event_module
+    "get_events": QueryCountCase("GET", "/event/", 1, 0),
+    "get_events_filtered": QueryCountCase(
+        "GET",
+        "/event/",
+        1,
+        0,
+        params={
+            "category_list": ["{category}"],
+            "tag_id": "{tag}",
+            "university_id": "{university}",
+            "registration_open": True,
+            "date_sort": "asc",
+        },
+    ),
+    "get_events_with_include": QueryCountCase(
+        "GET",
+        "/event/",
+        4,
+        0,
+        params={"include": ["tags", "universities", "registrations_count"]},
+    ),
+    "get_events_by_location": QueryCountCase(
+        "GET", "/event/", 1, 0, params={"city": "Москва"}
+    ),
+    "get_events_by_ids": QueryCountCase(
+        "GET", "/event/batch", 1, 0, params={"ids": "{feed}"}
+    ),
+    "search_events": QueryCountCase(
+        "GET", "/event/search", 1, 0, params={"q": "кампус"}
+    ),
+    "get_event": QueryCountCase(
+        "GET",
+        "/event/{event}",
+        4,
+        0,
+        params={"include": ["tags", "universities", "registrations_count"]},
+    ),
+    "get_event_users": QueryCountCase("GET", "/event/{event}/user", 1, 0, params=ADMIN),
+    "export_event_users": QueryCountCase(
+        "GET", "/event/{event}/user/export", 1, 0, params=ADMIN
+    ),
+    "get_categories": QueryCountCase("GET", "/category/", 1, 0),
+    "get_category": QueryCountCase("GET", "/category/{category}", 1, 0),
+    "get_tags": QueryCountCase("GET", "/tag/", 1, 0),
+    "get_tags_by_event": QueryCountCase(
+        "GET", "/tag/", 1, 0, params={"event_id": "{event}"}
+    ),
+    "get_tag": QueryCountCase("GET", "/tag/{tag}", 1, 0),
+    "create_event": QueryCountCase("POST", "/event/", 1, 1, params=ADMIN, json=EVENT),
+    "import_events": QueryCountCase(
+        "POST",
+        "/event/import",
+        3,
+        1,
+        params={**ADMIN, "university_id": "{university}"},
+        files={"file": ("events.csv", IMPORT_CSV, "text/csv")},
+    ),
+    "update_event": QueryCountCase(
+        "PUT",
+        "/event/{event_update}",
+        2,
+        1,
+        params=ADMIN,
+        json={**EVENT, "id": "{event_update}"},
+    ),
+    "add_event_tags": QueryCountCase(
+        "POST",
+        "/event/{event_update}/tag",
+        3,
+        2,
+        params=ADMIN,
+        json={"event_id": "{event_update}", "tag_list": "{tags}"},
+    ),
+    "delete_event_tags": QueryCountCase(
+        "DELETE",
+        "/event/{event_update}/tag",
+        2,
+        1,
+        params=ADMIN,
+        json={"event_id": "{event_update}", "tag_list": "{tags}"},
+    ),
+    "create_category": QueryCountCase(
+        "POST", "/category/", 1, 1, params=ADMIN, json={"name": "Новая категория"}
+    ),
+    "update_category": QueryCountCase(
+        "PUT",
+        "/category/{category_delete}",
+        2,
+        1,
+        params=ADMIN,
+        json={"id": "{category_delete}", "name": "Переименованная категория"},
+    ),
+    "create_tag": QueryCountCase(
+        "POST", "/tag/", 1, 1, params=ADMIN, json={"name": "Новый тег"}
+    ),
+    "update_tag": QueryCountCase(
+        "PUT",
+        "/tag/{tag_delete}",
+        2,
+        1,
+        params=ADMIN,
+        json={"id": "{tag_delete}", "name": "Переименованный тег"},
+    ),
+    # tour_module
+    "get_tours": QueryCountCase("GET", "/tour/", 1, 0),
+    "get_tours_with_include": QueryCountCase(
+        "GET",
+        "/tour/",
+        2,
+        0,
+        params={"university_id": "{university}", "include": ["events"]},
+    ),
+    "get_tours_by_ids": QueryCountCase(
+        "GET", "/tour/batch", 1, 0, params={"ids": ["{tour}", "{tour_update}"]}
+    ),
+    "search_tours": QueryCountCase("GET", "/tour/search", 1, 0, params={"q": "кампус"}),
+    "get_tour": QueryCountCase(
+        "GET", "/tour/{tour}", 2, 0, params={"include": ["events"]}
+    ),
+    "get_tour_with_tags": QueryCountCase(
+        "GET", "/tour/{tour}", 3, 0, params={"include": ["tags"]}
+    ),
+    "get_tour_with_event_tags": QueryCountCase(
+        "GET", "/tour/{tour}", 5, 0, params={"include": ["events", "tags"]}
+    ),
+    "get_tour_users": QueryCountCase("GET", "/tour/{tour}/user", 1, 0, params=ADMIN),
+    "export_tour_users": QueryCountCase(
+        "GET", "/tour/{tour}/user/export", 1, 0, params=ADMIN
+    ),
+    "create_tour": QueryCountCase("POST", "/tour/", 1, 1, params=ADMIN, json=TOUR),
+    "import_tours": QueryCountCase(
+        "POST",
+        "/tour/import",
+        1,
+        1,
+        params={**ADMIN, "import_format": "jsonl"},
+        files={"file": ("tours.jsonl", IMPORT_JSONL, "application/jsonl")},
+    ),
+    "update_tour": QueryCountCase(
+        "PUT",
+        "/tour/{tour_update}",
+        2,
+        1,
+        params=ADMIN,
+        json={**TOUR, "id": "{tour_update}"},
+    ),
+    "add_tour_events": QueryCountCase(
+        "POST",
+        "/tour/{tour_update}/event",
+        6,
+        5,
+        params=ADMIN,
+        json={"tour_id": "{tour_update}", "event_list": "{feed}"},
+    ),
+    "delete_tour_events": QueryCountCase(
+        "DELETE",
+        "/tour/{tour_update}/event",
+        5,
+        1,
+        params=ADMIN,
+        json={"tour_id": "{tour_update}", "event_list": "{feed}"},
+    ),
+    # university_module
+    "get_universities": QueryCountCase("GET", "/university/", 1, 0),
+    "get_universities_by_city": QueryCountCase(
+        "GET", "/university/", 1, 0, params={"city": "Москва"}
+    ),
+    "get_universities_by_ids": QueryCountCase(
+        "GET", "/university/batch", 1, 0, params={"ids": ["{university}"]}
+    ),
+    "search_universities": QueryCountCase(
+        "GET", "/university/search", 1, 0, params={"q": "университет"}
+    ),
+    "get_university": QueryCountCase("GET", "/university/{university}", 1, 0),
+    "get_university_users": QueryCountCase(
+        "POST", "/university/{university}/user", 1, 0
+    ),
+    "export_university_event_users": QueryCountCase(
+        "GET", "/university/{university}/event/user/export", 1, 0, params=ADMIN
+    ),
+    "export_university_tour_users": QueryCountCase(
+        "GET", "/university/{university}/tour/user/export", 1, 0, params=ADMIN
+    ),
+    "create_university": QueryCountCase(
+        "POST",
+        "/university/",
+        1,
+        1,
+        params=ADMIN,
+        json={**UNIVERSITY, "reg_date": DATE_START.isoformat()},
+    ),
+    "update_university": QueryCountCase(
+        "PUT",
+        "/university/{university_delete}",
+        2,
+        1,
+        params=ADMIN,
+        json={
+            **UNIVERSITY,
+            "id": "{university_delete}",
+            "reg_date": DATE_START.isoformat(),
+        },
+    ),
+    "add_university_events": QueryCountCase(
+        "POST",
+        "/university/{university_delete}/event",
+        6,
+        5,
+        params=ADMIN,
+        json={"university_id": "{university_delete}", "event_list": "{feed}"},
+    ),
+    "delete_university_events": QueryCountCase(
+        "DELETE",
+        "/university/{university_delete}/event",
+        5,
+        1,
+        params=ADMIN,
+        json={"university_id": "{university_delete}", "event_list": "{feed}"},
+    ),
+    "add_university_tours": QueryCountCase(
+        "POST",
+        "/university/{university_delete}/tour",
+        2,
+        1,
+        params=ADMIN,
+        json={"university_id": "{university_delete}", "tour_list": ["{tour}"]},
+    ),
+    "delete_university_tours": QueryCountCase(
+        "DELETE",
+        "/university/{university_delete}/tour",
+        1,
+        1,
+        params=ADMIN,
+        json={"university_id": "{university_delete}", "tour_list": ["{tour}"]},
+    ),
+    # user_module
+    "register_user_event": QueryCountCase(
+        "POST",
+        "/user/event",
+        3,
+        1,
+        params=ADMIN,
+        json={"user_id": 100, "event_id": "{event}"},
+    ),
+    "get_user_events": QueryCountCase(
+        "GET", "/user/event", 1, 0, params={**ADMIN, "user_id_to_get": 100}
+    ),
+    "unregister_user_event": QueryCountCase(
+        "DELETE",
+        "/user/{event}",
+        4,
+        1,
+        params=ADMIN,
+        json={"user_id": 100, "event_id": "{event}"},
+    ),
+    "bulk_register_user_events": QueryCountCase(
+        "POST",
+        "/user/event/bulk",
+        5,
+        1,
+        params=ADMIN,
+        json=[{"user_id": 200 + index, "event_id": "{event}"} for index in range(10)],
+    ),
+    "bulk_unregister_user_events": QueryCountCase(
+        "DELETE",
+        "/user/event/bulk",
+        4,
+        1,
+        params=ADMIN,
+        json=[{"user_id": 200 + index, "event_id": "{event}"} for index in range(10)],
+    ),
+    "bulk_register_user_events_as_university": QueryCountCase(
+        "POST",
+        "/user/event/bulk",
+        7,
+        1,
+        params=UNIVERSITY_ADMIN,
+        json=[
+            {"user_id": 300, "event_id": f"{{feed_{index}}}"}
+            for index in range(FEED_SIZE)
+        ],
+    ),
+    "join_event_waitlist": QueryCountCase(
+        "POST",
+        "/user/event/waitlist",
+        4,
+        1,
+        params=ADMIN,
+        json={"user_id": 100, "event_id": "{event_full}"},
+    ),
+    "get_event_waitlist": QueryCountCase(
+        "GET",
+        "/user/event/waitlist",
+        1,
+        0,
+        params={**ADMIN, "event_id": "{event_full}"},
+    ),
+    "leave_event_waitlist": QueryCountCase(
+        "DELETE",
+        "/user/event/waitlist",
+        1,
+        1,
+        params=ADMIN,
+        json={"user_id": 100, "event_id": "{event_full}"},
+    ),
+    "delete_user_events": QueryCountCase(
+        "DELETE", "/user/event", 15, 1, params={**ADMIN, "user_id_to_delete": 1}
+    ),
+    "register_user_tour": QueryCountCase(
+        "POST",
+        "/user/tour",
+        3,
+        1,
+        params=ADMIN,
+        json={"user_id": 100, "tour_id": "{tour}"},
+    ),
+    "get_user_tours": QueryCountCase(
+        "GET", "/user/tour", 1, 0, params={**ADMIN, "user_id_to_get": 100}
+    ),
+    "unregister_user_tour": QueryCountCase(
+        "DELETE",
+        "/user/tour/{tour}",
+        4,
+        1,
+        params=ADMIN,
+        json={"user_id": 100, "tour_id": "{tour}"},
+    ),
+    "bulk_register_user_tours": QueryCountCase(
+        "POST",
+        "/user/tour/bulk",
+        5,
+        1,
+        params=ADMIN,
+        json=[{"user_id": 200 + index, "tour_id": "{tour}"} for index in range(10)],
+    ),
+    "bulk_unregister_user_tours": QueryCountCase(
+        "DELETE",
+        "/user/tour/bulk",
+        4,
+        1,
+        params=ADMIN,
+        json=[{"user_id": 200 + index, "tour_id": "{tour}"} for index in range(10)],
+    ),
+    "join_tour_waitlist": QueryCountCase(
+        "POST",
+        "/user/tour/waitlist",
+        4,
+        1,
+        params=ADMIN,
+        json={"user_id": 100, "tour_id": "{tour_full}"},
+    ),
+    "get_tour_waitlist": QueryCountCase(
+        "GET", "/user/tour/waitlist", 1, 0, params={**ADMIN, "tour_id": "{tour_full}"}
+    ),
+    "leave_tour_waitlist": QueryCountCase(
+        "DELETE",
+        "/user/tour/waitlist",
+        1,
+        1,
+        params=ADMIN,
+        json={"user_id": 100, "tour_id": "{tour_full}"},
+    ),
+    "delete_user_tours": QueryCountCase(
+        "DELETE", "/user/tour", 3, 1, params={**ADMIN, "user_id_to_delete": 100}
+    ),
+    "add_user_university": QueryCountCase(
+        "POST",
+        "/user/university",
+        1,
+        1,
+        params=ADMIN,
+        json={"user_id": 100, "university_id": "{university}"},
+    ),
+    "get_user_universities": QueryCountCase(
+        "GET", "/user/university", 1, 0, params={**ADMIN, "user_id_to_get": 100}
+    ),
+    # deletes run last
+    "delete_event": QueryCountCase(
+        "DELETE", "/event/{event_delete}", 7, 5, params=ADMIN
+    ),
+    "delete_tour": QueryCountCase("DELETE", "/tour/{tour_delete}", 6, 4, params=ADMIN),
+    "delete_university": QueryCountCase(
+        "DELETE", "/university/{university_delete}", 4, 3, params=ADMIN
+    ),
+    "delete_category": QueryCountCase(
+        "DELETE", "/category/{category_delete}", 3, 1, params=ADMIN
+    ),
+    "delete_tag": QueryCountCase("DELETE", "/tag/{tag_delete}", 3, 2, params=ADMIN),
+}
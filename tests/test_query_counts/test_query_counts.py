@@ -0,0 +1,162 @@
+import re
+
+import pytest
+from httpx import AsyncClient
+
+from src.database_utils.query_counter import record_queries
+from src.event_module.models import Category, Event, EventTag, Tag
+from src.tour_module.models import Tour, TourEvent
+from src.university_module.models import University, UniversityEvent, UniversityTour
+from src.user_module.models import UserEvent, UserTour, UserUniversity
+from src.utils import Status
+from tests.conftest import async_session_maker, engine_test
+from tests.test_query_counts.constants.query_count_constants import (
+    ADDRESS,
+    DATE_START,
+    FEED_SIZE,
+    QUERY_COUNT_CASES,
+    UNIVERSITY,
+    USERS_PER_EVENT,
+    QueryCountCase,
+)
+
+API_PREFIX = "/api/v1"
+PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+def make_event(category: Category, name: str, max_users: int = 100) -> Event:
+    return Event(
+        name=name,
+        description="Экскурсия по кампусу",
+        date_start=DATE_START,
+        date_end=DATE_START,
+        reg_deadline=DATE_START,
+        max_users=max_users,
+        category_id=category.id,
+        address=ADDRESS,
+    )
+
+
+def make_tour(name: str, max_users: int = 100) -> Tour:
+    return Tour(
+        name=name,
+        description="Экскурсия по кампусу",
+        date_start=DATE_START,
+        date_end=DATE_START,
+        reg_deadline=DATE_START,
+        max_users=max_users,
+        address=ADDRESS,
+    )
+
+
+@pytest.fixture(scope="module")
+async def seeded_ids() -> dict:
+    async with async_session_maker() as session:
+        categories = [Category(name=f"Категория {index}") for index in range(2)]
+        tags = [Tag(name=f"Тег {index}") for index in range(3)]
+        universities = [
+            University(**{**UNIVERSITY, "name": f"Университет {index}"})
+            for index in range(2)
+        ]
+        session.add_all(categories + tags + universities)
+        await session.flush()
+
+        feed = [
+            make_event(category=categories[0], name=f"Событие {index}")
+            for index in range(FEED_SIZE)
+        ]
+        event_update = make_event(category=categories[0], name="Событие на изменение")
+        event_delete = make_event(category=categories[1], name="Событие на удаление")
+        event_full = make_event(
+            category=categories[0], name="Заполненное событие", max_users=1
+        )
+        tours = [make_tour(name=f"Тур {index}") for index in range(3)]
+        tour_full = make_tour(name="Заполненный тур", max_users=1)
+        session.add_all(feed + [event_update, event_delete, event_full])
+        session.add_all(tours + [tour_full])
+        await session.flush()
+
+        for event in feed:
+            session.add_all(
+                EventTag(event_id=event.id, tag_id=tag.id) for tag in tags[:2]
+            )
+            session.add(
+                UniversityEvent(university_id=universities[0].id, event_id=event.id)
+            )
+            session.add(TourEvent(tour_id=tours[0].id, event_id=event.id))
+            session.add_all(
+                UserEvent(user_id=user_id, event_id=event.id)
+                for user_id in range(1, USERS_PER_EVENT + 1)
+            )
+        session.add(
+            UniversityTour(university_id=universities[0].id, tour_id=tours[0].id)
+        )
+        session.add_all(
+            UserTour(user_id=user_id, tour_id=tours[0].id)
+            for user_id in range(1, USERS_PER_EVENT + 1)
+        )
+        session.add(UserEvent(user_id=1, event_id=event_full.id))
+        session.add(UserTour(user_id=1, tour_id=tour_full.id))
+        session.add(UserUniversity(user_id=1, university_id=universities[0].id))
+        for event in feed:
+            event.registered_count = USERS_PER_EVENT
+        event_full.registered_count = 1
+        tours[0].registered_count = USERS_PER_EVENT
+        tour_full.registered_count = 1
+        await session.commit()
+
+        return {
+            "category": categories[0].id,
+            "category_delete": categories[1].id,
+            "tag": tags[0].id,
+            "tags": [tag.id for tag in tags[:2]],
+            "tag_delete": tags[2].id,
+            "university": universities[0].id,
+            "university_delete": universities[1].id,
+            "feed": [event.id for event in feed],
+            **{f"feed_{index}": event.id for index, event in enumerate(feed)},
+            "event": feed[0].id,
+            "event_update": event_update.id,
+            "event_delete": event_delete.id,
+            "event_full": event_full.id,
+            "tour": tours[0].id,
+            "tour_update": tours[1].id,
+            "tour_delete": tours[2].id,
+            "tour_full": tour_full.id,
+        }
+
+
+def fill_ids(value, ids: dict):
+    if isinstance(value, str):
+        match = PLACEHOLDER.fullmatch(value)
+        if match is not None and match.group(1) in ids:
+            return ids[match.group(1)]
+        return PLACEHOLDER.sub(
+            lambda match: str(ids.get(match.group(1), match.group(0))), value
+        )
+    if isinstance(value, dict):
+        return {key: fill_ids(item, ids) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(fill_ids(item, ids) for item in value)
+    return value
+
+
+@pytest.mark.parametrize("name", QUERY_COUNT_CASES.keys())
+async def test_query_count(ac: AsyncClient, seeded_ids: dict, name: str):
+    case: QueryCountCase = QUERY_COUNT_CASES[name]
+    with record_queries(engine=engine_test.sync_engine) as query_stats:
+        response = await ac.request(
+            case.method,
+            API_PREFIX + fill_ids(case.url, seeded_ids),
+            params=fill_ids(case.params, seeded_ids),
+            json=fill_ids(case.json, seeded_ids),
+            files=fill_ids(case.files, seeded_ids),
+        )
+    assert response.status_code == 200, response.text
+    if response.headers["content-type"] == "application/json":
+        assert response.json()["status"] == Status.SUCCESS.value, response.text
+    assert query_stats.count <= case.max_queries, (
+        f"{name} executed {query_stats.count} queries, expected at most "
+        f"{case.max_queries}:\n" + "\n".join(query_stats.statements)
+    )
+    assert query_stats.commits <= case.max_commits
@@ -0,0 +1,105 @@
+from httpx import AsyncClient
+
+from src.schemas import Response
+from src.tour_module.database.tour.text.tour_message import TourMessage
+from src.utils import Role, Status, return_json
+
+tour_message = TourMessage()
+
+TOURS_CSV = (
+    "name,description,date_start,date_end,reg_deadline,max_users,"
+    "address.country,address.city,address.latitude,address.longitude\n"
+    "Тур по Петербургу,Три дня в Петербурге,2030-07-01T10:00:00,"
+    "2030-07-03T18:00:00,2030-06-20T10:00:00,30,Россия,Санкт-Петербург,59.94,30.31\n"
+    "Тур по Москве,Два дня в Москве,2030-08-01T10:00:00,"
+    "2030-08-02T18:00:00,2030-07-20T10:00:00,20,Россия,Москва,55.75,37.62\n"
+)
+
+
+async def test_import_tours(ac: AsyncClient):
+    json = (
+        await ac.post(
+            f"/api/v1/tour/import?user_role={Role.ADMIN.value}&import_format=csv",
+            files={"file": ("tours.csv", TOURS_CSV.encode(), "text/csv")},
+        )
+    ).json()
+    response = Response(
+        status=json["status"],
+        message=json["message"],
+        data=json["data"],
+        details=json["details"],
+    )
+    correct_response = return_json(
+        status=Status.SUCCESS,
+        message=tour_message.get("import_success").format(count=2),
+        data={"imported_tours_count": 2, "import_errors": []},
+    )
+
+    assert response == correct_response
+
+    tours = (await ac.get("/api/v1/tour/?fields=name&fields=max_users")).json()["data"][
+        "tours"
+    ]
+    imported = {tour["name"]: tour["max_users"] for tour in tours}
+    assert imported["Тур по Петербургу"] == 30
+    assert imported["Тур по Москве"] == 20
+
+
+async def test_include_tags_does_not_embed_events(ac: AsyncClient):
+    tours = (await ac.get("/api/v1/tour/?include=tags")).json()["data"]["tours"]
+
+    assert any(tour["tags"] for tour in tours)
+    for tour in tours:
+        assert "events" not in tour
+        assert all(set(tag) == {"id", "name"} for tag in tour["tags"])
+        assert len({tag["id"] for tag in tour["tags"]}) == len(tour["tags"])
+
+
+async def test_include_events_with_tags(ac: AsyncClient):
+    tours = (await ac.get("/api/v1/tour/?include=events&include=tags")).json()["data"][
+        "tours"
+    ]
+    events = [event for tour in tours for event in tour["events"]]
+
+    assert any(event["tags"] for event in events)
+    for tour in tours:
+        assert {tag["id"] for tag in tour["tags"]} == {
+            tag["id"] for event in tour["events"] for tag in event["tags"]
+        }
+
+
+async def test_get_tours_by_location(ac: AsyncClient):
+    tours = (
+        await ac.get(
+            "/api/v1/tour/?latitude=59.9&longitude=30.3&radius_km=10&fields=name"
+        )
+    ).json()["data"]["tours"]
+
+    assert [tour["name"] for tour in tours] == ["Тур по Петербургу"]
+
+
+async def test_get_tours_by_location_without_radius(ac: AsyncClient):
+    response = await ac.get("/api/v1/tour/?latitude=59.9")
+
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["query", "longitude"],
+        ["query", "radius_km"],
+    ]
+
+
+async def test_create_tour_with_wrong_coordinates(ac: AsyncClient):
+    response = await ac.post(
+        f"/api/v1/tour/?user_role={Role.ADMIN.value}",
+        json={
+            "name": "Тур",
+            "description": "Описание",
+            "date_start": "2030-07-01T10:00:00",
+            "date_end": "2030-07-03T18:00:00",
+            "reg_deadline": "2030-06-20T10:00:00",
+            "max_users": 10,
+            "address": {"latitude": 95, "longitude": 30.31},
+        },
+    )
+
+    assert response.status_code == 422
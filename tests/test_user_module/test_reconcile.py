@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, insert, select, update
+
+from src import main
+from src.database_utils.registration_base_query import RECONCILE_LOCK_ID
+from src.event_module.models import Category, Event
+from src.user_module.database.user_event.user_event_query import UserEventQuery
+from src.user_module.models import UserEvent
+from tests.conftest import async_session_maker
+
+user_event_query = UserEventQuery()
+
+
+@pytest.fixture
+async def event_id() -> int:
+    """
+    Event with one registration and a registered_count drifted to 3
+    """
+    date_start = datetime.utcnow() + timedelta(days=30)
+    async with async_session_maker() as session:
+        category = Category(name="Категория для пересчёта")
+        session.add(category)
+        await session.flush()
+        event = Event(
+            name="Событие для пересчёта",
+            description="Описание",
+            date_start=date_start,
+            date_end=date_start,
+            reg_deadline=date_start,
+            max_users=10,
+            category_id=category.id,
+            registered_count=3,
+        )
+        session.add(event)
+        await session.flush()
+        session.add(UserEvent(user_id=1, event_id=event.id))
+        await session.commit()
+        return event.id
+
+
+async def get_registered_count(event_id: int) -> int:
+    async with async_session_maker() as session:
+        return await session.scalar(
+            select(Event.registered_count).where(Event.id == event_id)
+        )
+
+
+async def reconcile() -> int:
+    async with async_session_maker() as session:
+        return await user_event_query.reconcile_registered_count(session=session)
+
+
+async def test_reconcile_fixes_drifted_count(event_id: int):
+    assert await reconcile() >= 1
+    assert await get_registered_count(event_id) == 1
+
+
+async def test_reconcile_is_skipped_while_another_process_runs_it(event_id: int):
+    async with async_session_maker() as session:
+        await session.execute(select(func.pg_advisory_xact_lock(RECONCILE_LOCK_ID)))
+        assert await reconcile() == 0
+        await session.commit()
+
+    assert await get_registered_count(event_id) == 3
+
+
+async def test_reconcile_counts_registration_committed_meanwhile(event_id: int):
+    async with async_session_maker() as session:
+        await session.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .values(registered_count=Event.registered_count + 1)
+        )
+        await session.execute(insert(UserEvent).values(user_id=2, event_id=event_id))
+        pending = asyncio.ensure_future(reconcile())
+        await asyncio.sleep(0.2)
+        await session.commit()
+    await pending
+
+    assert await get_registered_count(event_id) == 2
+
+
+async def test_reconciler_is_cancelled_on_shutdown(monkeypatch):
+    monkeypatch.setattr(main, "REGISTRATION_RECONCILE_INTERVAL", 3600)
+    await main.start_registration_reconciler()
+    reconciler = main.app.state.registration_reconciler
+
+    await main.stop_registration_reconciler()
+
+    assert reconciler.cancelled()
@@ -0,0 +1,162 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from src.database_utils.registration_base_query import RegistrationResult
+from src.event_module.models import Category, Event
+from src.user_module.database.user_event.user_event_query import UserEventQuery
+from src.user_module.models import UserEvent, UserEventWaitlist
+from src.user_module.schemas import UserEventCreate, UserEventDelete
+from tests.conftest import async_session_maker
+
+user_event_query = UserEventQuery()
+
+
+@pytest.fixture(scope="module")
+async def category_id() -> int:
+    async with async_session_maker() as session:
+        category = Category(name="Категория для листа ожидания")
+        session.add(category)
+        await session.commit()
+        return category.id
+
+
+async def create_event(
+    category_id: int,
+    registered: list[int],
+    waitlisted: list[int] = (),
+    max_users: int = 1,
+    reg_deadline: datetime | None = None,
+) -> int:
+    date_start = datetime.utcnow() + timedelta(days=30)
+    async with async_session_maker() as session:
+        event = Event(
+            name="Событие с листом ожидания",
+            description="Описание",
+            date_start=date_start,
+            date_end=date_start,
+            reg_deadline=reg_deadline or date_start,
+            max_users=max_users,
+            category_id=category_id,
+            registered_count=len(registered),
+        )
+        session.add(event)
+        await session.flush()
+        session.add_all(
+            UserEvent(user_id=user_id, event_id=event.id) for user_id in registered
+        )
+        await session.flush()
+        session.add_all(
+            UserEventWaitlist(user_id=user_id, event_id=event.id)
+            for user_id in waitlisted
+        )
+        await session.commit()
+        return event.id
+
+
+async def get_state(event_id: int) -> tuple[list[int], list[int], int]:
+    async with async_session_maker() as session:
+        registered = await session.scalars(
+            select(UserEvent.user_id)
+            .where(UserEvent.event_id == event_id)
+            .order_by(UserEvent.user_id)
+        )
+        waitlisted = await session.scalars(
+            select(UserEventWaitlist.user_id)
+            .where(UserEventWaitlist.event_id == event_id)
+            .order_by(UserEventWaitlist.id)
+        )
+        registered_count = await session.scalar(
+            select(Event.registered_count).where(Event.id == event_id)
+        )
+        return list(registered), list(waitlisted), registered_count
+
+
+async def join_waitlist(user_id: int, event_id: int) -> RegistrationResult:
+    async with async_session_maker() as session:
+        return await user_event_query.join_waitlist(
+            model_create=UserEventCreate(user_id=user_id, event_id=event_id),
+            session=session,
+        )
+
+
+async def unregister(user_id: int, event_id: int) -> None:
+    async with async_session_maker() as session:
+        await user_event_query.delete_by_delete_schema(
+            model_delete=UserEventDelete(user_id=user_id, event_id=event_id),
+            session=session,
+        )
+
+
+async def test_cancellation_promotes_waitlisted_user(category_id: int):
+    event_id = await create_event(category_id=category_id, registered=[1])
+
+    assert await join_waitlist(user_id=2, event_id=event_id) == (
+        RegistrationResult.WAITLISTED
+    )
+    await unregister(user_id=1, event_id=event_id)
+
+    assert await get_state(event_id) == ([2], [], 1)
+
+
+async def test_registration_removes_own_waitlist_entry(category_id: int):
+    event_id = await create_event(
+        category_id=category_id, registered=[1], waitlisted=[2, 3], max_users=2
+    )
+
+    assert await join_waitlist(user_id=2, event_id=event_id) == (
+        RegistrationResult.SUCCESS
+    )
+    assert await get_state(event_id) == ([1, 2], [3], 2)
+
+    await unregister(user_id=1, event_id=event_id)
+
+    assert await get_state(event_id) == ([2, 3], [], 2)
+
+
+async def test_promotion_stops_after_deadline(category_id: int):
+    event_id = await create_event(
+        category_id=category_id,
+        registered=[1],
+        waitlisted=[2],
+        reg_deadline=datetime.utcnow() - timedelta(days=1),
+    )
+
+    await unregister(user_id=1, event_id=event_id)
+
+    assert await get_state(event_id) == ([], [2], 0)
+
+
+async def test_delete_by_user_removes_waitlist_entries(category_id: int):
+    event_id = await create_event(category_id=category_id, registered=[1])
+    other_event_id = await create_event(
+        category_id=category_id, registered=[2], waitlisted=[1]
+    )
+
+    async with async_session_maker() as session:
+        await user_event_query.delete_by_user(user_id=1, session=session)
+
+    assert await get_state(event_id) == ([], [], 0)
+    assert await get_state(other_event_id) == ([2], [], 1)
+
+
+async def test_concurrent_join_and_cancellation_keep_the_seat_taken(
+    category_id: int,
+):
+    event_id = await create_event(category_id=category_id, registered=[1])
+
+    async with async_session_maker() as session:
+        await session.execute(
+            select(Event.id).where(Event.id == event_id).with_for_update()
+        )
+        pending = asyncio.gather(
+            join_waitlist(user_id=2, event_id=event_id),
+            unregister(user_id=1, event_id=event_id),
+        )
+        await asyncio.sleep(0.2)
+        await session.commit()
+    await pending
+
+    assert await get_state(event_id) == ([2], [], 1)